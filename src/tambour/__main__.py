@@ -529,8 +529,7 @@ def cmd_events_emit(args: argparse.Namespace) -> int:
     """Handle 'events emit' command."""
     import json
 
-    from tambour.config import Config
-    from tambour.events import Event, EventDispatcher, EventType
+    from tambour.events import EventType, emit, flatten_event_data
 
     try:
         event_type = EventType(args.event)
@@ -547,12 +546,7 @@ def cmd_events_emit(args: argparse.Namespace) -> int:
         try:
             data = json.loads(args.data)
             if isinstance(data, dict):
-                # Flatten nested dicts to string values for env var compatibility
-                for key, value in data.items():
-                    if isinstance(value, dict):
-                        extra[key] = json.dumps(value)
-                    else:
-                        extra[key] = str(value)
+                extra.update(flatten_event_data(data))
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON in --data: {e}", file=sys.stderr)
             return 1
@@ -563,8 +557,8 @@ def cmd_events_emit(args: argparse.Namespace) -> int:
                 key, value = item.split("=", 1)
                 extra[key] = value
 
-    event = Event(
-        event_type=event_type,
+    results = emit(
+        event_type,
         issue_id=args.issue,
         worktree=Path(args.worktree) if args.worktree else None,
         main_repo=Path(args.main_repo) if args.main_repo else None,
@@ -572,15 +566,6 @@ def cmd_events_emit(args: argparse.Namespace) -> int:
         extra=extra,
     )
 
-    config = Config.load_or_default()
-
-    # Use a log file for async execution results
-    log_file = Path.home() / ".tambour" / "events.log"
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-
-    dispatcher = EventDispatcher(config, log_file=log_file)
-    results = dispatcher.dispatch(event)
-
     if not results:
         print(f"Event '{event_type.value}' emitted (no plugins configured)")
         return 0
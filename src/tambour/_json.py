@@ -0,0 +1,39 @@
+"""JSON encoding and decoding with an optional fast path.
+
+Uses orjson when it is installed (``pip install tambour[speedups]``) and
+falls back to the standard library otherwise. orjson's decode error
+subclasses json.JSONDecodeError, so callers keep catching that.
+"""
+
+from __future__ import annotations
+
+import json
+from json import JSONDecodeError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ["JSONDecodeError", "dumps", "loads"]
+
+
+if orjson is not None:
+    loads = orjson.loads
+else:
+    loads = json.loads
+
+
+def dumps(obj: object, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize.
+        indent: Pretty-print with two-space indentation.
+
+    Returns:
+        Encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
@@ -5,8 +5,10 @@ Parses .tambour/config.toml files for plugin definitions and daemon settings.
 
 from __future__ import annotations
 
+import os
 import tomllib
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -222,16 +224,20 @@ class Config:
             return cls()
 
     @classmethod
-    def _find_config(cls) -> Path:
-        """Find config file by searching current directory and parents."""
-        cwd = Path.cwd()
-        for parent in [cwd, *cwd.parents]:
+    def _find_config(cls, start: Path | None = None) -> Path:
+        """Find config file by searching a directory and its parents.
+
+        Args:
+            start: Directory to start from. Defaults to the current directory.
+        """
+        start = start or Path.cwd()
+        for parent in [start, *start.parents]:
             config_path = parent / ".tambour" / "config.toml"
             if config_path.exists():
                 return config_path
 
         # Return expected path even if it doesn't exist
-        return cwd / ".tambour" / "config.toml"
+        return start / ".tambour" / "config.toml"
 
     @classmethod
     def _from_dict(cls, data: dict[str, Any], path: Path) -> Config:
@@ -282,6 +288,18 @@ class Config:
             config_path=path,
         )
 
+    @cached_property
+    def resolved_worktree_base(self) -> Path:
+        """Worktree base directory for the repository in the current directory.
+
+        Expands ``{repo}`` in ``worktree.base_path`` with the name of the
+        current directory and resolves relative paths against it. Computed
+        once, on first access.
+        """
+        cwd = Path.cwd()
+        base_path = self.worktree.base_path.replace("{repo}", cwd.name)
+        return Path(os.path.normpath(cwd / base_path))
+
     def get_plugins_for_event(self, event_type: str) -> list[PluginConfig]:
         """Get all enabled plugins that trigger on the given event type."""
         return [
@@ -234,6 +234,7 @@ class Daemon:
         Args:
             config: The tambour configuration.
         """
+        from tambour.eventsock import BRIDGE_SOCKET_ENV, EventSocketServer
         from tambour.health import HealthChecker
 
         # Setup logging
@@ -257,6 +258,19 @@ class Daemon:
         self._running = True
         checker = HealthChecker(config)
 
+        # Accept hook bridge events on a local socket and dispatch them in
+        # batches (see tambour.eventsock)
+        socket_path = Path(
+            os.environ.get(BRIDGE_SOCKET_ENV) or self.pid_file.parent / "bridge.sock"
+        )
+        event_server: EventSocketServer | None = EventSocketServer(socket_path, config, logger)
+        try:
+            event_server.start()
+            logger.info(f"Listening for bridge events on {socket_path}")
+        except OSError as e:
+            logger.warning(f"Bridge socket unavailable ({socket_path}): {e}")
+            event_server = None
+
         # Set up signal handlers
         def signal_handler(signum, frame):
             logger.info(f"Received signal {signum}, shutting down...")
@@ -265,18 +279,22 @@ class Daemon:
         signal.signal(signal.SIGTERM, signal_handler)
         signal.signal(signal.SIGINT, signal_handler)
 
-        while self._running:
-            try:
-                # logger.debug("Running health check...")
-                checker.check_all()
-                
-                # Sleep loop for responsiveness
-                for _ in range(config.daemon.health_interval):
-                    if not self._running:
-                        break
-                    time.sleep(1)
-            except Exception as e:
-                logger.error(f"Error in health check: {e}", exc_info=True)
-                time.sleep(5)
-        
+        try:
+            while self._running:
+                try:
+                    # logger.debug("Running health check...")
+                    checker.check_all()
+
+                    # Sleep loop for responsiveness
+                    for _ in range(config.daemon.health_interval):
+                        if not self._running:
+                            break
+                        time.sleep(1)
+                except Exception as e:
+                    logger.error(f"Error in health check: {e}", exc_info=True)
+                    time.sleep(5)
+        finally:
+            if event_server is not None:
+                event_server.stop()
+
         logger.info("Daemon stopped")
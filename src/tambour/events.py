@@ -6,20 +6,26 @@ for dispatching them to configured plugins.
 
 from __future__ import annotations
 
+import functools
 import os
 import subprocess
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from tambour.config import Config, PluginConfig
 
 
+# Default factory for event timestamps (a C-level partial, no lambda frame)
+_utcnow = functools.partial(datetime.now, timezone.utc)
+
+
 class EventType(Enum):
     """Lifecycle events emitted by tambour."""
 
@@ -66,7 +72,7 @@ class Event:
     worktree: Path | None = None
     main_repo: Path | None = None
     beads_db: Path | None = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_utcnow)
     extra: dict[str, str] = field(default_factory=dict)
 
     def to_env(self) -> dict[str, str]:
@@ -76,20 +82,22 @@ class Event:
             "TAMBOUR_TIMESTAMP": self.timestamp.isoformat(),
         }
 
-        if self.issue_id:
-            env["TAMBOUR_ISSUE_ID"] = self.issue_id
-        if self.issue_title:
-            env["TAMBOUR_ISSUE_TITLE"] = self.issue_title
-        if self.issue_type:
-            env["TAMBOUR_ISSUE_TYPE"] = self.issue_type
-        if self.branch:
-            env["TAMBOUR_BRANCH"] = self.branch
-        if self.worktree:
-            env["TAMBOUR_WORKTREE"] = str(self.worktree.absolute())
-        if self.main_repo:
-            env["TAMBOUR_MAIN_REPO"] = str(self.main_repo.absolute())
-        if self.beads_db:
-            env["TAMBOUR_BEADS_DB"] = str(self.beads_db.absolute())
+        for key, value in (
+            ("TAMBOUR_ISSUE_ID", self.issue_id),
+            ("TAMBOUR_ISSUE_TITLE", self.issue_title),
+            ("TAMBOUR_ISSUE_TYPE", self.issue_type),
+            ("TAMBOUR_BRANCH", self.branch),
+        ):
+            if value:
+                env[key] = value
+
+        for key, path in (
+            ("TAMBOUR_WORKTREE", self.worktree),
+            ("TAMBOUR_MAIN_REPO", self.main_repo),
+            ("TAMBOUR_BEADS_DB", self.beads_db),
+        ):
+            if path:
+                env[key] = str(path.absolute())
 
         # Add extra event-specific variables
         for key, value in self.extra.items():
@@ -122,7 +130,7 @@ class ToolEvent:
     tool_input: dict[str, str]
     tool_response: dict[str, str]
     session_id: str
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_utcnow)
     issue_id: str | None = None
     worktree: Path | None = None
     duration_ms: int | None = None
@@ -173,7 +181,7 @@ class SessionEvent:
     """
 
     session_id: str
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_utcnow)
     issue_id: str | None = None
     worktree: Path | None = None
     file_path: Path | None = None
@@ -222,15 +230,38 @@ class PluginResult:
 class EventDispatcher:
     """Dispatches events to configured plugins."""
 
-    def __init__(self, config: Config, log_file: Path | None = None):
+    def __init__(
+        self,
+        config: Config,
+        log_file: Path | None = None,
+        detach_async: bool = False,
+    ):
         """Initialize the dispatcher with configuration.
 
         Args:
             config: The tambour configuration.
             log_file: Optional path to log file for async results.
+            detach_async: Start non-blocking plugins as detached processes
+                instead of on threads, so a short-lived caller can exit
+                without waiting for them. Their results are not logged and
+                their timeouts are not enforced.
         """
         self.config = config
         self.log_file = log_file
+        self.detach_async = detach_async
+        # Log writes are handed to a single worker so the dispatch thread
+        # never blocks on the filesystem. One worker keeps lines in order.
+        self._executor: ThreadPoolExecutor | None = None
+        if log_file:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="tambour-log"
+            )
+
+    def close(self) -> None:
+        """Wait for pending log writes to finish and release the writer."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def dispatch(self, event: Event) -> list[PluginResult]:
         """Dispatch an event to all configured plugins.
@@ -269,7 +300,11 @@ class EventDispatcher:
         return results
 
     def _dispatch_async(self, plugin: PluginConfig, event: Event) -> None:
-        """Run a plugin in a background thread."""
+        """Run a plugin in a background thread, or detached if configured."""
+        if self.detach_async:
+            self._spawn_detached(plugin, event)
+            return
+
         def task() -> None:
             result = self._execute_plugin(plugin, event)
             self._log_result(result)
@@ -281,22 +316,64 @@ class EventDispatcher:
         thread = threading.Thread(target=task, daemon=False)
         thread.start()
 
+    def _spawn_detached(self, plugin: PluginConfig, event: Event) -> None:
+        """Start a plugin in its own session without waiting for it."""
+        env = os.environ.copy()
+        env.update(event.to_env())
+
+        try:
+            subprocess.Popen(
+                plugin.run,
+                shell=True,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=event.worktree or event.main_repo,
+                start_new_session=True,
+            )
+        except Exception as e:
+            self._log_result(PluginResult(
+                plugin_name=plugin.name,
+                success=False,
+                error=str(e),
+                duration_ms=0,
+            ))
+
     def _log_result(self, result: PluginResult) -> None:
-        """Log the result of a plugin execution."""
+        """Log the result of a plugin execution.
+
+        The log line is formatted on the calling thread and the write is
+        queued on the log executor, so dispatch never waits on disk I/O.
+        """
         if not self.log_file:
             return
 
         timestamp = datetime.now(timezone.utc).isoformat()
         status = "SUCCESS" if result.success else "FAILED"
-        
+
+        line = f"[{timestamp}] [{status}] Plugin '{result.plugin_name}': "
+        if result.exit_code is not None:
+            line += f"exit_code={result.exit_code} "
+        line += f"duration={result.duration_ms}ms\n"
+        if result.error:
+            line += f"  Error: {result.error}\n"
+
+        executor = self._executor
+        if executor is None:
+            self._write_log_sync(line)
+            return
+        try:
+            executor.submit(self._write_log_sync, line)
+        except RuntimeError:
+            # Executor already shut down (e.g. interpreter exit); write inline
+            self._write_log_sync(line)
+
+    def _write_log_sync(self, line: str) -> None:
+        """Append a formatted line to the log file."""
         try:
             with open(self.log_file, "a") as f:
-                f.write(f"[{timestamp}] [{status}] Plugin '{result.plugin_name}': ")
-                if result.exit_code is not None:
-                    f.write(f"exit_code={result.exit_code} ")
-                f.write(f"duration={result.duration_ms}ms\n")
-                if result.error:
-                    f.write(f"  Error: {result.error}\n")
+                f.write(line)
         except Exception as e:
             print(f"Failed to write to log file: {e}", file=sys.stderr)
 
@@ -355,3 +432,89 @@ class EventDispatcher:
                 error=str(e),
                 duration_ms=duration_ms,
             )
+
+
+def events_log_file() -> Path:
+    """Return the log file for async plugin results, creating its directory."""
+    log_file = Path.home() / ".tambour" / "events.log"
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    return log_file
+
+
+def flatten_event_data(data: dict[str, Any]) -> dict[str, str]:
+    """Flatten event data to string values for env var compatibility.
+
+    Nested dicts are JSON-encoded; everything else is passed through str().
+
+    Args:
+        data: Event data, e.g. parsed from ``--data`` JSON.
+
+    Returns:
+        Dictionary suitable for Event.extra.
+    """
+    import json
+
+    extra: dict[str, str] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            extra[key] = json.dumps(value)
+        else:
+            extra[key] = str(value)
+    return extra
+
+
+def emit(
+    event_type: str | EventType,
+    *,
+    issue_id: str | None = None,
+    worktree: Path | None = None,
+    main_repo: Path | None = None,
+    beads_db: Path | None = None,
+    extra: dict[str, str] | None = None,
+    config: Config | None = None,
+    detach_async: bool = False,
+) -> list[PluginResult]:
+    """Build an event and dispatch it to the configured plugins.
+
+    This is what ``tambour events emit`` runs; in-process callers (such as
+    the hook bridge) use it directly to avoid starting a new interpreter.
+    Async plugin results are appended to ~/.tambour/events.log.
+
+    Args:
+        event_type: Event type or its string value (e.g. "tool.used").
+        issue_id: The issue ID associated with the event.
+        worktree: Path to the worktree.
+        main_repo: Path to the main repository.
+        beads_db: Path to the beads database.
+        extra: Additional event-specific data.
+        config: Configuration to use. Defaults to Config.load_or_default().
+        detach_async: Start non-blocking plugins as detached processes
+            rather than waiting for them before returning.
+
+    Returns:
+        List of results from each plugin execution.
+
+    Raises:
+        ValueError: If event_type is not a known event type.
+    """
+    from tambour.config import Config
+
+    event = Event(
+        event_type=EventType(event_type),
+        issue_id=issue_id,
+        worktree=worktree,
+        main_repo=main_repo,
+        beads_db=beads_db,
+        extra=extra or {},
+    )
+
+    if config is None:
+        config = Config.load_or_default()
+
+    dispatcher = EventDispatcher(
+        config, log_file=events_log_file(), detach_async=detach_async
+    )
+    try:
+        return dispatcher.dispatch(event)
+    finally:
+        dispatcher.close()
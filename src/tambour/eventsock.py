@@ -0,0 +1,310 @@
+"""Local socket for handing hook events to the daemon.
+
+The hook bridge writes one JSON record per line to an AF_UNIX stream
+socket owned by the daemon. The daemon drains whatever records are
+pending, then dispatches the batch with a config and dispatcher loaded
+once per repository, so a burst of tool uses does not pay config loading
+and dispatcher setup per event. Records are matched to the main
+repository of their worktree, so hooks from another repository's
+sessions run that repository's plugins.
+
+Record format::
+
+    {"event": "tool.used", "issue": "bd-1", "worktree": "/path", "data": {...}}
+"""
+
+from __future__ import annotations
+
+import errno
+import json
+import logging
+import os
+import selectors
+import socket
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tambour.config import Config
+    from tambour.events import EventDispatcher
+
+# Environment variable naming the socket the bridge should send to
+BRIDGE_SOCKET_ENV = "TAMBOUR_BRIDGE_SOCKET"
+
+SEND_TIMEOUT = 0.05  # seconds; the hook gives up and dispatches itself
+BATCH_IDLE = 0.001  # seconds without new records before a batch is dispatched
+MAX_BATCH = 64  # records dispatched per batch at most
+POLL_INTERVAL = 0.5  # seconds between stop checks while idle
+
+
+def send_event(socket_path: str | Path, record: dict[str, Any]) -> bool:
+    """Send one event record to the daemon's bridge socket.
+
+    Args:
+        socket_path: Path to the daemon's bridge socket.
+        record: Event record (see module docstring).
+
+    Returns:
+        True if the record was handed off, False if the socket is missing,
+        not accepting, or too slow.
+    """
+    payload = json.dumps(record).encode() + b"\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(SEND_TIMEOUT)
+            sock.connect(os.fspath(socket_path))
+            sock.sendall(payload)
+    except OSError:
+        return False
+    return True
+
+
+def _find_main_repo(path: Path) -> Path | None:
+    """Find the main repository a worktree path belongs to, without running git.
+
+    Finds the nearest ``.git`` at or above ``path``. A directory means
+    ``path`` is in the main repository itself; a ``gitdir:`` file in a
+    linked worktree leads through its ``commondir`` to the main
+    repository's git directory.
+
+    Returns:
+        Main repository path, or None if not in a repository.
+    """
+    for parent in (path, *path.parents):
+        dot_git = parent / ".git"
+        if dot_git.is_dir():
+            return parent
+        try:
+            content = dot_git.read_text().strip()
+        except OSError:
+            continue
+        if not content.startswith("gitdir:"):
+            return None
+        git_dir = parent / content.removeprefix("gitdir:").strip()
+        try:
+            common_dir = git_dir / (git_dir / "commondir").read_text().strip()
+        except OSError:
+            # No commondir (e.g. a submodule): the git dir is the repo's own
+            return parent
+        return common_dir.resolve().parent
+    return None
+
+
+class EventSocketServer:
+    """Receives bridge events on a Unix socket and dispatches them in batches."""
+
+    def __init__(
+        self,
+        socket_path: Path,
+        config: Config,
+        logger: logging.Logger | None = None,
+    ):
+        """Initialize the server.
+
+        Args:
+            socket_path: Path to bind the socket at.
+            config: Configuration used to dispatch events from this
+                daemon's repository and from records without a worktree.
+            logger: Optional logger for dispatch errors.
+        """
+        self.socket_path = socket_path
+        self.config = config
+        self.logger = logger or logging.getLogger("tambour.eventsock")
+        self._sock: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._dispatcher = None
+        # Dispatchers for other repositories' configs, keyed by config path,
+        # and the config path each worktree resolved to
+        self._dispatchers: dict[Path, EventDispatcher] = {}
+        self._config_paths: dict[str, Path] = {}
+
+    def start(self) -> None:
+        """Bind the socket and start serving in a background thread.
+
+        Raises:
+            OSError: If the socket cannot be bound, or another daemon is
+                already serving it.
+        """
+        from tambour.events import EventDispatcher, events_log_file
+
+        # A leftover socket from a previous daemon would make bind() fail,
+        # but one a running daemon still answers on must be left alone
+        if self._socket_in_use():
+            raise OSError(errno.EADDRINUSE, f"Bridge socket in use: {self.socket_path}")
+        self.socket_path.unlink(missing_ok=True)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(os.fspath(self.socket_path))
+            os.chmod(self.socket_path, 0o600)
+            sock.listen()
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+
+        self._sock = sock
+        self._dispatcher = EventDispatcher(self.config, log_file=events_log_file())
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._serve, name="tambour-eventsock", daemon=True
+        )
+        self._thread.start()
+
+    def _socket_in_use(self) -> bool:
+        """Check whether something is accepting connections on the socket path."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(SEND_TIMEOUT)
+            try:
+                probe.connect(os.fspath(self.socket_path))
+            except OSError:
+                return False
+        return True
+
+    def stop(self) -> None:
+        """Stop serving, dispatch any pending records, and remove the socket."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for dispatcher in self._dispatchers.values():
+            dispatcher.close()
+        self._dispatchers.clear()
+        self._config_paths.clear()
+        if self._dispatcher is not None:
+            self._dispatcher.close()
+            self._dispatcher = None
+
+    def _serve(self) -> None:
+        """Accept connections and collect records until stopped."""
+        sel = selectors.DefaultSelector()
+        sel.register(self._sock, selectors.EVENT_READ, None)
+        pending: list[dict[str, Any]] = []
+
+        try:
+            while not self._stop.is_set():
+                ready = sel.select(BATCH_IDLE if pending else POLL_INTERVAL)
+                for key, _ in ready:
+                    if key.data is None:
+                        self._accept(sel)
+                    else:
+                        self._read(sel, key.fileobj, key.data, pending)
+
+                if pending and (not ready or len(pending) >= MAX_BATCH):
+                    self._dispatch_batch(pending)
+                    pending = []
+        finally:
+            for key in list(sel.get_map().values()):
+                if key.data is not None:
+                    self._parse_lines(key.data, pending, final=True)
+                key.fileobj.close()
+            sel.close()
+            self._sock = None
+            self.socket_path.unlink(missing_ok=True)
+            if pending:
+                self._dispatch_batch(pending)
+
+    def _accept(self, sel: selectors.BaseSelector) -> None:
+        """Accept a pending connection."""
+        try:
+            conn, _ = self._sock.accept()
+        except BlockingIOError:
+            return
+        conn.setblocking(False)
+        sel.register(conn, selectors.EVENT_READ, bytearray())
+
+    def _read(
+        self,
+        sel: selectors.BaseSelector,
+        conn: socket.socket,
+        buffer: bytearray,
+        pending: list[dict[str, Any]],
+    ) -> None:
+        """Read from a connection, moving complete records to pending."""
+        try:
+            chunk = conn.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b""
+
+        if chunk:
+            buffer += chunk
+            self._parse_lines(buffer, pending)
+            return
+
+        # Sender closed the connection; a final unterminated line still counts
+        self._parse_lines(buffer, pending, final=True)
+        sel.unregister(conn)
+        conn.close()
+
+    def _parse_lines(
+        self, buffer: bytearray, pending: list[dict[str, Any]], final: bool = False
+    ) -> None:
+        """Parse complete lines out of buffer into pending records."""
+        *lines, rest = buffer.split(b"\n")
+        if final:
+            lines.append(rest)
+            rest = b""
+        buffer[:] = rest
+
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                pending.append(record)
+
+    def _dispatcher_for(self, worktree: str | None) -> EventDispatcher:
+        """Return the dispatcher for the repository a record came from.
+
+        A worktree is matched to the config its main repository would
+        load; anything unresolved, or resolving to this daemon's own
+        config, uses the daemon's dispatcher.
+        """
+        if not worktree:
+            return self._dispatcher
+
+        from tambour.config import Config
+
+        config_path = self._config_paths.get(worktree)
+        if config_path is None:
+            root = _find_main_repo(Path(worktree)) or Path(worktree)
+            config_path = Config._find_config(root).resolve()
+            self._config_paths[worktree] = config_path
+
+        own_path = self.config.config_path
+        if own_path is not None and config_path == own_path.resolve():
+            return self._dispatcher
+
+        dispatcher = self._dispatchers.get(config_path)
+        if dispatcher is None:
+            from tambour.events import EventDispatcher
+
+            dispatcher = EventDispatcher(
+                Config.load_or_default(config_path), log_file=self._dispatcher.log_file
+            )
+            self._dispatchers[config_path] = dispatcher
+        return dispatcher
+
+    def _dispatch_batch(self, records: list[dict[str, Any]]) -> None:
+        """Dispatch a batch of records with each repository's dispatcher."""
+        from tambour.events import Event, EventType, flatten_event_data
+
+        for record in records:
+            try:
+                data = record.get("data")
+                worktree = record.get("worktree")
+                event = Event(
+                    event_type=EventType(record.get("event")),
+                    issue_id=record.get("issue"),
+                    worktree=Path(worktree) if worktree else None,
+                    extra=flatten_event_data(data) if isinstance(data, dict) else {},
+                )
+                self._dispatcher_for(worktree).dispatch(event)
+            except Exception as e:
+                self.logger.error(f"Failed to dispatch bridge event: {e}")
@@ -13,21 +13,33 @@ Implements the workflow to merge agent work and complete an issue:
 
 from __future__ import annotations
 
-import json
 import os
+import shutil
+import stat
 import subprocess
 import sys
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from tambour._json import JSONDecodeError, loads
 from tambour.lock import MergeLock
 
 if TYPE_CHECKING:
     from tambour.config import Config
 
+# Resolve tool paths once. An absolute argv[0] with close_fds=False (and no
+# cwd) lets subprocess use posix_spawn instead of fork+exec with a PATH scan.
+_GIT = shutil.which("git") or "git"
+_BD = shutil.which("bd") or "bd"
 
-@dataclass
+# Issue statuses that mean there is nothing left to close
+_CLOSED_STATUSES = frozenset({"closed", "done"})
+
+
+@dataclass(slots=True)
 class FinishResult:
     """Result of the finish operation."""
 
@@ -38,13 +50,9 @@ class FinishResult:
     worktree_removed: bool = False
     branch_deleted: bool = False
     issue_closed: bool = False
-    closed_epics: list[tuple[str, str]] = None  # (id, title) pairs
+    closed_epics: list[tuple[str, str]] = field(default_factory=list)  # (id, title) pairs
     error: str | None = None
 
-    def __post_init__(self):
-        if self.closed_epics is None:
-            self.closed_epics = []
-
 
 class FinishCommand:
     """Handles the finish workflow for completing agent work."""
@@ -72,31 +80,78 @@ class FinishCommand:
         self.main_repo = main_repo.resolve()
         self.worktree_base = worktree_base or (self.main_repo.parent / "bobbin-worktrees")
         self.worktree_path = self.worktree_base / issue_id
+        self._worktree_path_str = os.fspath(self.worktree_path)
         self.branch_name = issue_id
         self.merge = merge
         self.no_continue = no_continue
         self.config = config
         self._lock: MergeLock | None = None
+        self._local_branches: set[str] | None = None
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tambour-finish")
+        self._bd_cache: dict[tuple[str, ...], Any] = {}
+        self._out: list[str] = []
+
+    def close(self) -> None:
+        """Shut down worker threads and helper processes started by this command."""
+        self._pool.shutdown(wait=True)
+        if self._lock is not None:
+            self._lock.close()
+
+    def __enter__(self) -> FinishCommand:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - tears down worker threads."""
+        self.close()
+
+    def _log(self, message: str = "") -> None:
+        """Queue a progress message for the next output flush."""
+        self._out.append(message)
+
+    def _flush_output(self) -> None:
+        """Write queued progress messages to stdout in one call."""
+        if not self._out:
+            return
+        sys.stdout.write("\n".join(self._out) + "\n")
+        sys.stdout.flush()
+        self._out.clear()
 
     def _run_git(self, *args: str, cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess:
         """Run a git command."""
         return subprocess.run(
-            ["git", *args],
-            cwd=cwd or self.main_repo,
+            [_GIT, "-C", str(cwd or self.main_repo), *args],
             capture_output=True,
             text=True,
             check=check,
+            close_fds=False,
         )
 
     def _run_bd(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
         """Run a beads command."""
         return subprocess.run(
-            ["bd", *args],
+            [_BD, *args],
             capture_output=True,
             text=True,
             check=check,
+            close_fds=False,
         )
 
+    def _run_bd_json(self, *args: str, bust: bool = False) -> Any:
+        """Run a beads command and return its parsed JSON output.
+
+        Results are memoized per argument tuple for the lifetime of this
+        command; pass bust=True to force a fresh query (e.g. after bd close).
+        Failures raise and are not cached.
+        """
+        if not bust and args in self._bd_cache:
+            return self._bd_cache[args]
+
+        result = self._run_bd(*args)
+        data = loads(result.stdout)
+        self._bd_cache[args] = data
+        return data
+
     def _emit_event(self, event_type: str, extra: dict | None = None) -> None:
         """Emit a tambour event."""
         try:
@@ -122,8 +177,7 @@ class FinishCommand:
             Tuple of (title, issue_type, status).
         """
         try:
-            result = self._run_bd("show", self.issue_id, "--json")
-            data = json.loads(result.stdout)
+            data = self._run_bd_json("show", self.issue_id, "--json")
             if data:
                 issue = data[0]
                 return (
@@ -131,28 +185,85 @@ class FinishCommand:
                     issue.get("issue_type", "unknown"),
                     issue.get("status", "unknown"),
                 )
-        except (subprocess.CalledProcessError, json.JSONDecodeError, IndexError, Exception):
+        except (subprocess.CalledProcessError, JSONDecodeError, IndexError, Exception):
             pass
         return ("Unknown", "unknown", "unknown")
 
-    def _get_epic_status(self) -> list[dict]:
-        """Get current epic status for detecting auto-close eligibility."""
+    def _get_epic_status(self, bust: bool = False) -> list[dict]:
+        """Get current epic status for detecting auto-close eligibility.
+
+        Args:
+            bust: Ignore any cached result and query beads again.
+        """
         try:
-            result = self._run_bd("epic", "status", "--json", check=False)
-            if result.returncode == 0:
-                return json.loads(result.stdout)
-        except (json.JSONDecodeError, subprocess.CalledProcessError):
+            return self._run_bd_json("epic", "status", "--json", bust=bust)
+        except (JSONDecodeError, subprocess.CalledProcessError):
             pass
         return []
 
+    def _has_epic_parent(self) -> bool:
+        """Check whether closing this issue can make an epic eligible to close.
+
+        Reads the (cached) ``bd show`` record. Only a record that lists its
+        dependencies without a parent-child link counts as standalone; if
+        the record is unavailable or has no dependency information, assume
+        a parent may exist.
+        """
+        try:
+            issue = self._run_bd_json("show", self.issue_id, "--json")[0]
+        except (subprocess.CalledProcessError, JSONDecodeError, IndexError, KeyError, TypeError):
+            return True
+
+        if issue.get("parent"):
+            return True
+        dependencies = issue.get("dependencies")
+        if not isinstance(dependencies, list):
+            return True
+        return any(
+            isinstance(dep, dict) and dep.get("dependency_type") == "parent-child"
+            for dep in dependencies
+        )
+
+    def _get_parent_epic_status(self, bust: bool = False) -> list[dict]:
+        """Get epic status, skipping the query for issues without a parent epic.
+
+        Args:
+            bust: Ignore any cached result and query beads again.
+        """
+        if not self._has_epic_parent():
+            return []
+        return self._get_epic_status(bust=bust)
+
+    def _load_local_branches(self) -> set[str] | None:
+        """List local branches once and cache them for this command.
+
+        Returns:
+            Set of local branch names, or None if git could not list them.
+        """
+        if self._local_branches is None:
+            result = self._run_git(
+                "for-each-ref", "--format=%(refname:lstrip=2)", "refs/heads/", check=False
+            )
+            if result.returncode != 0:
+                return None
+            self._local_branches = set(result.stdout.split())
+        return self._local_branches
+
     def _branch_exists(self) -> bool:
         """Check if the branch exists locally."""
+        branches = self._load_local_branches()
+        if branches is not None:
+            return self.branch_name in branches
+
         result = self._run_git("show-ref", "--verify", "--quiet", f"refs/heads/{self.branch_name}", check=False)
         return result.returncode == 0
 
     def _worktree_exists(self) -> bool:
         """Check if the worktree directory exists."""
-        return self.worktree_path.is_dir()
+        try:
+            return stat.S_ISDIR(os.stat(self._worktree_path_str).st_mode)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
 
     def _detach_worktree_head(self) -> bool:
         """Detach HEAD in worktree so branch can be deleted."""
@@ -167,9 +278,19 @@ class FinishCommand:
     def run(self) -> FinishResult:
         """Execute the finish workflow.
 
+        Progress messages are buffered and written in batches: before each
+        step that may block (lock wait, pull, push) and when the run ends.
+
         Returns:
             FinishResult with the outcome of the operation.
         """
+        try:
+            return self._run()
+        finally:
+            self._flush_output()
+
+    def _run(self) -> FinishResult:
+        """Run the finish workflow steps (see run())."""
         # Validate worktree exists
         if not self._worktree_exists():
             return FinishResult(
@@ -178,29 +299,55 @@ class FinishCommand:
                 error=f"Worktree not found: {self.worktree_path}",
             )
 
-        # Get issue info
-        issue_title, issue_type, issue_status = self._get_issue_info()
-        result = FinishResult(
-            success=True,
-            issue_id=self.issue_id,
-            issue_title=issue_title,
-        )
+        # Query beads in the background; the answers are not needed until
+        # the merge lock is held, so the bd round trips overlap the lock wait
+        issue_future = self._pool.submit(self._get_issue_info)
 
         if not self.merge:
             # Just report the worktree location
-            print(f"Worktree preserved at: {self.worktree_path}")
-            print()
-            print("To merge and cleanup later, run:")
-            print(f"  tambour finish {self.issue_id} --merge")
-            return result
+            issue_title, _, _ = issue_future.result()
+            self._log(f"Worktree preserved at: {self.worktree_path}")
+            self._log()
+            self._log("To merge and cleanup later, run:")
+            self._log(f"  tambour finish {self.issue_id} --merge")
+            return FinishResult(
+                success=True,
+                issue_id=self.issue_id,
+                issue_title=issue_title,
+            )
+
+        # Capture epic state before closing. The issue lookup fills the
+        # bd show cache that decides whether an epic query is needed at all.
+        def epics_before_task() -> list[dict]:
+            issue_future.result()
+            return self._get_parent_epic_status()
+
+        epics_before_future = self._pool.submit(epics_before_task)
 
-        print(f"=== Finishing agent work for: {self.issue_id} ===")
-        print(f"Merging {self.branch_name} into main...")
+        self._log(f"=== Finishing agent work for: {self.issue_id} ===")
+        self._log(f"Merging {self.branch_name} into main...")
 
         # Acquire merge lock
         self._lock = MergeLock(self.main_repo)
-        print("Acquiring merge lock...")
-        if not self._lock.acquire(self.issue_id):
+        self._log("Acquiring merge lock...")
+        self._flush_output()
+        wait_started = time.monotonic()
+        acquired = self._lock.acquire(
+            self.issue_id,
+            on_wait=lambda holder: print(
+                f"Waiting for merge lock (held by {holder}, "
+                f"{int(time.monotonic() - wait_started)}s elapsed)..."
+            ),
+        )
+
+        issue_title, issue_type, issue_status = issue_future.result()
+        result = FinishResult(
+            success=True,
+            issue_id=self.issue_id,
+            issue_title=issue_title,
+        )
+
+        if not acquired:
             return FinishResult(
                 success=False,
                 issue_id=self.issue_id,
@@ -208,15 +355,16 @@ class FinishCommand:
                 error=f"Timeout waiting for merge lock after {self._lock.timeout}s. "
                       "Use 'tambour lock status' to check, or 'tambour lock release' to force-release.",
             )
-        print(f"Acquired merge lock for {self.issue_id}")
+        self._log(f"Acquired merge lock for {self.issue_id}")
 
         try:
             # Ensure we're on main
-            print("Switching to main...")
+            self._log("Switching to main...")
             self._run_git("checkout", "main")
 
             # Pull latest
-            print("Pulling latest main...")
+            self._log("Pulling latest main...")
+            self._flush_output()
             pull_result = self._run_git("pull", "origin", "main", "--ff-only", check=False)
             if pull_result.returncode != 0:
                 return FinishResult(
@@ -229,7 +377,7 @@ class FinishCommand:
             # Check if branch exists
             if self._branch_exists():
                 # Merge the branch
-                print(f"Merging {self.branch_name}...")
+                self._log(f"Merging {self.branch_name}...")
                 merge_result = self._run_git("merge", self.branch_name, "--no-edit", check=False)
                 if merge_result.returncode != 0:
                     return FinishResult(
@@ -241,7 +389,8 @@ class FinishCommand:
                 result.merged = True
 
                 # Push to origin
-                print("Pushing to origin...")
+                self._log("Pushing to origin...")
+                self._flush_output()
                 push_result = self._run_git("push", "origin", "main", check=False)
                 if push_result.returncode != 0:
                     return FinishResult(
@@ -255,65 +404,78 @@ class FinishCommand:
                 # Emit branch.merged event
                 self._emit_event("branch.merged")
             else:
-                print(f"Branch {self.branch_name} does not exist. Assuming changes already merged.")
+                self._log(f"Branch {self.branch_name} does not exist. Assuming changes already merged.")
                 result.merged = True
 
         finally:
             # Always release lock
             if self._lock and self._lock.is_acquired:
-                print(f"Released merge lock for {self.issue_id}")
+                self._log(f"Released merge lock for {self.issue_id}")
                 self._lock.release(self.issue_id)
 
         # Detach HEAD in worktree before removing
-        print("Detaching HEAD in worktree...")
+        self._log("Detaching HEAD in worktree...")
         self._detach_worktree_head()
 
         # Remove worktree
-        print("Removing worktree...")
+        self._log("Removing worktree...")
         remove_result = self._run_bd("worktree", "remove", str(self.worktree_path), check=False)
         result.worktree_removed = remove_result.returncode == 0
         if not result.worktree_removed:
-            print(f"Warning: Could not remove worktree (may need manual cleanup)")
+            self._log(f"Warning: Could not remove worktree (may need manual cleanup)")
 
         # Delete branch
-        print("Deleting branch...")
+        self._log("Deleting branch...")
         if self._branch_exists():
             delete_result = self._run_git("branch", "-d", self.branch_name, check=False)
             if delete_result.returncode != 0:
                 # Try force delete since changes are merged
-                print("Standard delete failed, trying force delete (branch is merged)...")
+                self._log("Standard delete failed, trying force delete (branch is merged)...")
                 delete_result = self._run_git("branch", "-D", self.branch_name, check=False)
             result.branch_deleted = delete_result.returncode == 0
+            if not result.branch_deleted:
+                # The branch list predates the worktree removal, which may
+                # have deleted the branch itself
+                ref_result = self._run_git(
+                    "show-ref", "--verify", "--quiet", f"refs/heads/{self.branch_name}", check=False
+                )
+                if ref_result.returncode != 0:
+                    self._log(f"Branch {self.branch_name} already deleted.")
+                    result.branch_deleted = True
+            if result.branch_deleted and self._local_branches is not None:
+                self._local_branches.discard(self.branch_name)
         else:
-            print(f"Branch {self.branch_name} already deleted.")
+            self._log(f"Branch {self.branch_name} already deleted.")
             result.branch_deleted = True
 
-        # Capture epic state before closing
-        epics_before = self._get_epic_status()
+        epics_before = epics_before_future.result()
 
         # Close issue
-        print("Closing issue...")
-        if issue_status in ("closed", "done"):
-            print(f"Issue {self.issue_id} is already closed.")
+        self._log("Closing issue...")
+        if issue_status in _CLOSED_STATUSES:
+            self._log(f"Issue {self.issue_id} is already closed.")
             result.issue_closed = True
         else:
             close_result = self._run_bd("close", self.issue_id, check=False)
             result.issue_closed = close_result.returncode == 0
             if not result.issue_closed:
-                print(f"Warning: Could not close issue {self.issue_id}")
+                self._log(f"Warning: Could not close issue {self.issue_id}")
+
+        # Re-read epic state (must follow the close) while the event is emitted
+        epics_after_future = self._pool.submit(self._get_parent_epic_status, bust=True)
 
         # Emit task.completed event
         self._emit_event("task.completed")
 
         # Check for epics that became eligible for closure
-        epics_after = self._get_epic_status()
+        epics_after = epics_after_future.result()
         result.closed_epics = self._auto_close_epics(epics_before, epics_after)
 
-        print()
+        self._log()
         if result.worktree_removed:
-            print("Done! Branch merged and worktree cleaned up.")
+            self._log("Done! Branch merged and worktree cleaned up.")
         else:
-            print("Done! Branch merged, issue closed, but worktree needs manual cleanup.")
+            self._log("Done! Branch merged, issue closed, but worktree needs manual cleanup.")
 
         return result
 
@@ -327,28 +489,36 @@ class FinishCommand:
         Returns:
             List of (epic_id, epic_title) tuples for closed epics.
         """
-        # Find epics eligible before
+        # Index eligibility by id once on each side
         eligible_before = {
             e["epic"]["id"]
             for e in epics_before
             if e.get("eligible_for_close")
         }
-
-        # Find newly eligible epics
-        closed_epics = []
+        newly_eligible: list[tuple[str, str]] = []
         for epic_data in epics_after:
             if not epic_data.get("eligible_for_close"):
                 continue
-            epic_id = epic_data["epic"]["id"]
-            if epic_id in eligible_before:
-                continue  # Already eligible before
-
-            # Auto-close this epic
-            epic_title = epic_data["epic"].get("title", "Unknown")
-            print(f"  → Auto-closing completed epic: {epic_id} \"{epic_title}\"")
-            close_result = self._run_bd("close", epic_id, check=False)
-            if close_result.returncode == 0:
-                closed_epics.append((epic_id, epic_title))
+            epic = epic_data["epic"]
+            epic_id = epic["id"]
+            if epic_id not in eligible_before:
+                newly_eligible.append((epic_id, epic.get("title", "Unknown")))
+        if not newly_eligible:
+            return []
+
+        for epic_id, epic_title in newly_eligible:
+            self._log(f"  → Auto-closing completed epic: {epic_id} \"{epic_title}\"")
+
+        # Closing distinct epics is independent, so run the bd calls in parallel
+        close_results = self._pool.map(
+            lambda epic: self._run_bd("close", epic[0], check=False),
+            newly_eligible,
+        )
+        closed_epics = [
+            epic
+            for epic, close_result in zip(newly_eligible, close_results)
+            if close_result.returncode == 0
+        ]
 
         return closed_epics
 
@@ -386,11 +556,10 @@ class FinishCommand:
 
         # Check for ready tasks
         try:
-            ready_result = self._run_bd("ready", "--json")
-            ready_data = json.loads(ready_result.stdout)
+            ready_data = self._run_bd_json("ready", "--json")
             ready_tasks = [t for t in ready_data if t.get("issue_type") == "task"]
             ready_count = len(ready_tasks)
-        except (subprocess.CalledProcessError, json.JSONDecodeError):
+        except (subprocess.CalledProcessError, JSONDecodeError):
             ready_count = 0
             ready_tasks = []
 
@@ -433,15 +602,14 @@ def cmd_finish(args) -> int:
 
     config = Config.load_or_default()
 
-    finish = FinishCommand(
+    with FinishCommand(
         issue_id=args.issue,
         main_repo=main_repo,
         merge=args.merge,
         no_continue=args.no_continue,
         config=config,
-    )
-
-    result = finish.run()
+    ) as finish:
+        result = finish.run()
 
     if not result.success:
         print(f"Error: {result.error}", file=sys.stderr)
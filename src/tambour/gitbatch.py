@@ -0,0 +1,131 @@
+"""Persistent git helper process for read-only object lookups.
+
+Wraps a long-running ``git cat-file --batch-command`` process so that
+repeated ref and object lookups share one git process instead of
+spawning a new one per query.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from pathlib import Path
+
+
+class GitBatchError(OSError):
+    """Raised when the batch helper cannot serve a request."""
+
+
+class GitBatch:
+    """Long-running ``git cat-file --batch-command`` session.
+
+    The helper process is started lazily on first use and torn down by
+    close() (or on context manager exit). Requests are serialized with a
+    lock so a single session can be shared between threads.
+
+    Callers should be prepared for GitBatchError (e.g. git older than
+    2.36, which lacks --batch-command) and fall back to a plain git call.
+    """
+
+    def __init__(self, repo_path: Path):
+        """Initialize the batch session.
+
+        Args:
+            repo_path: Path to the git repository.
+        """
+        self.repo_path = repo_path
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+        self._broken = False
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the helper process if it is not already running."""
+        if self._broken:
+            raise GitBatchError("git cat-file --batch-command is unavailable")
+
+        if self._proc is None or self._proc.poll() is not None:
+            try:
+                self._proc = subprocess.Popen(
+                    ["git", "-C", str(self.repo_path), "cat-file", "--batch-command"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError as e:
+                self._broken = True
+                raise GitBatchError(f"Could not start git: {e}") from e
+        return self._proc
+
+    def _request(self, command: str) -> tuple[bytes, subprocess.Popen]:
+        """Send one command and read its header line.
+
+        Must be called with the lock held.
+        """
+        proc = self._ensure_started()
+        try:
+            proc.stdin.write(command.encode() + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline()
+        except (OSError, ValueError) as e:
+            self._terminate()
+            raise GitBatchError(f"git cat-file session failed: {e}") from e
+
+        if not header:
+            # git exited without answering (unsupported option, bad repo, ...)
+            self._terminate()
+            self._broken = True
+            raise GitBatchError("git cat-file --batch-command is unavailable")
+
+        return header, proc
+
+    def contents(self, name: str) -> bytes | None:
+        """Read the raw contents of an object.
+
+        Args:
+            name: Any object name git understands (sha, ref, rev:path).
+
+        Returns:
+            Object contents, or None if the object is missing.
+        """
+        with self._lock:
+            header, proc = self._request(f"contents {name}")
+            parts = header.decode().split()
+            if len(parts) != 3:
+                return None
+
+            size = int(parts[2])
+            data = proc.stdout.read(size)
+            proc.stdout.read(1)  # trailing newline
+
+        return data
+
+    def _terminate(self) -> None:
+        """Stop the helper process."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        if proc.stdout:
+            proc.stdout.close()
+
+    def close(self) -> None:
+        """Shut down the helper process, if running."""
+        with self._lock:
+            self._terminate()
+
+    def __enter__(self) -> GitBatch:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - shuts down the helper process."""
+        self.close()
@@ -6,18 +6,51 @@ optionally triggers recovery actions.
 
 from __future__ import annotations
 
-import json
+import os
+import shutil
+import stat
 import subprocess
+import sys
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
+
+from tambour._json import JSONDecodeError, loads
+from tambour.heartbeat import parse_heartbeat_timestamp, read_heartbeat_bytes
 
 if TYPE_CHECKING:
     from tambour.config import Config
 
+BD_TIMEOUT = 10  # seconds
+
+# Resolve bd once; an absolute argv[0] with close_fds=False lets subprocess
+# use posix_spawn, avoiding a fork of the (long-lived) daemon process.
+_BD = shutil.which("bd") or "bd"
+
+# Task statuses are interned on entry to _check_task so the zombie test is
+# an identity check, and every TaskHealth shares one status string
+_IN_PROGRESS = sys.intern("in_progress")
+
+
+def _find_beads_dir(start: Path) -> Path | None:
+    """Locate the beads data directory bd would use from ``start``.
+
+    Honors BEADS_DIR, otherwise looks for ``.beads`` in ``start`` and its
+    parents.
+    """
+    env_dir = os.environ.get("BEADS_DIR")
+    if env_dir:
+        return Path(env_dir)
+    for parent in (start, *start.parents):
+        candidate = parent / ".beads"
+        if candidate.is_dir():
+            return candidate
+    return None
+
 
-@dataclass
+@dataclass(slots=True)
 class TaskHealth:
     """Health status of a task."""
 
@@ -49,21 +82,44 @@ class HealthChecker:
         self.zombie_threshold = config.daemon.zombie_threshold
         self.auto_recover = config.daemon.auto_recover
 
+        # Worktrees live at <resolved base>/<issue_id>
+        self._worktree_base = config.resolved_worktree_base
+        # Process CWD snapshot shared by all tasks within one check_all() pass
+        self._proc_cwds: set[str] | None = None
+        self._cache_proc_cwds = False
+        # Worktree directory listing shared by all tasks within one check_all() pass
+        self._existing_worktrees: set[str] | None = None
+        # Parsed heartbeat timestamps keyed by file, with the stat signature
+        # (inode, mtime_ns, size) they were read at
+        self._heartbeat_cache: dict[Path, tuple[tuple[int, int, int], datetime | None]] = {}
+        # Last in-progress task list, with the beads directory signature it
+        # was listed at; reused by check_all() while beads is unchanged
+        self._beads_dir = _find_beads_dir(Path.cwd())
+        self._task_cache: tuple[frozenset[tuple[str, int, int]], list[dict[str, str]]] | None = None
+        self._list_failed = False
+
     def check_all(self) -> list[TaskHealth]:
         """Check health of all in-progress tasks.
 
         Returns:
             List of health status for each in-progress task.
         """
-        tasks = self._get_in_progress_tasks()
         results: list[TaskHealth] = []
 
-        for task in tasks:
-            health = self._check_task(task)
-            results.append(health)
+        now = datetime.now(timezone.utc)
+        self._cache_proc_cwds = True
+        self._existing_worktrees = self._scan_worktrees()
+        try:
+            for task in self._iter_in_progress_tasks_cached():
+                health = self._check_task(task, now)
+                results.append(health)
 
-            if health.is_zombie:
-                self._handle_zombie(health)
+                if health.is_zombie:
+                    self._handle_zombie(health)
+        finally:
+            self._cache_proc_cwds = False
+            self._proc_cwds = None
+            self._existing_worktrees = None
 
         return results
 
@@ -82,25 +138,170 @@ class HealthChecker:
 
         return self._check_task(task)
 
-    def _get_in_progress_tasks(self) -> list[dict[str, str]]:
-        """Get all tasks with in_progress status.
+    def _run_bd(self, *args: str) -> subprocess.CompletedProcess | None:
+        """Run a beads command.
+
+        All of the checker's beads calls go through here, so there is one
+        place to change how bd is invoked.
 
         Returns:
-            List of task dictionaries from beads.
+            The completed process, or None if bd is missing or timed out.
         """
         try:
-            result = subprocess.run(
-                ["bd", "list", "--status", "in_progress", "--format", "json"],
+            return subprocess.run(
+                [_BD, *args],
                 capture_output=True,
                 text=True,
-                timeout=10,
+                timeout=BD_TIMEOUT,
+                close_fds=False,
             )
-            if result.returncode != 0:
-                return []
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+
+    def _beads_signature(self) -> frozenset[tuple[str, int, int]] | None:
+        """Snapshot (name, mtime_ns, size) of the files in the beads directory.
+
+        Every bd write touches the database or its export files, so an
+        unchanged signature means the task list cannot have changed.
+
+        Returns:
+            The signature, or None if the beads directory is unknown or
+            unreadable.
+        """
+        if self._beads_dir is None:
+            return None
+        try:
+            with os.scandir(self._beads_dir) as it:
+                signature = []
+                for entry in it:
+                    if entry.is_file():
+                        st = entry.stat()
+                        signature.append((entry.name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            return None
+        return frozenset(signature)
+
+    def _iter_in_progress_tasks_cached(self) -> Iterator[dict[str, str]]:
+        """Yield in-progress tasks, skipping bd while beads is unchanged.
+
+        The beads directory is checked before listing. If it has not
+        changed since the last complete, successful listing, that listing
+        is replayed instead of running bd again.
 
-            # Parse JSON output
-            return json.loads(result.stdout)
-        except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
+        Yields:
+            Task dictionaries from beads.
+        """
+        signature = self._beads_signature()
+        if (
+            signature is not None
+            and self._task_cache is not None
+            and self._task_cache[0] == signature
+        ):
+            yield from self._task_cache[1]
+            return
+
+        tasks: list[dict[str, str]] = []
+        for task in self._iter_in_progress_tasks():
+            tasks.append(task)
+            yield task
+
+        if signature is not None and not self._list_failed:
+            self._task_cache = (signature, tasks)
+        else:
+            self._task_cache = None
+
+    def _iter_in_progress_tasks(self) -> Iterator[dict[str, str]]:
+        """Yield in-progress tasks as beads emits them.
+
+        Reads ``bd list --format jsonl`` from a pipe so each task can be
+        checked while bd is still writing the rest. If bd does not produce
+        JSONL, falls back to the buffered JSON listing. bd is killed if the
+        whole listing takes longer than BD_TIMEOUT, which counts as a
+        failed listing, as does bd exiting non-zero after a partial stream.
+
+        Yields:
+            Task dictionaries from beads.
+        """
+        self._list_failed = False
+        try:
+            proc = subprocess.Popen(
+                [_BD, "list", "--status", "in_progress", "--format", "jsonl"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                close_fds=False,
+            )
+        except FileNotFoundError:
+            self._list_failed = True
+            return
+
+        # A deadline for the whole read: a bd stalled mid-output (e.g. on a
+        # database lock) must not block the health check indefinitely
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            if proc.poll() is None:
+                timed_out.set()
+                proc.kill()
+
+        timer = threading.Timer(BD_TIMEOUT, kill_on_timeout)
+        timer.daemon = True
+        timer.start()
+
+        streamed = False
+        not_jsonl = False
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    task = loads(line)
+                except JSONDecodeError:
+                    task = None
+                if not isinstance(task, dict):
+                    if streamed:
+                        continue
+                    not_jsonl = True  # e.g. a JSON array; use the fallback
+                    break
+                streamed = True
+                yield task
+        finally:
+            proc.stdout.close()
+            try:
+                proc.wait(timeout=BD_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                timed_out.set()
+                proc.kill()
+                proc.wait()
+            timer.cancel()
+
+        if timed_out.is_set():
+            self._list_failed = True
+            return
+
+        if not_jsonl or (not streamed and proc.returncode != 0):
+            yield from self._get_in_progress_tasks()
+        elif proc.returncode != 0:
+            # bd died part way through; what was streamed is incomplete
+            self._list_failed = True
+
+    def _get_in_progress_tasks(self) -> list[dict[str, str]]:
+        """Get all tasks with in_progress status.
+
+        Returns:
+            List of task dictionaries from beads.
+        """
+        result = self._run_bd("list", "--status", "in_progress", "--format", "json")
+        if result is None or result.returncode != 0:
+            self._list_failed = True
+            return []
+
+        # Parse JSON output
+        try:
+            return loads(result.stdout)
+        except JSONDecodeError:
+            self._list_failed = True
             return []
 
     def _get_task(self, issue_id: str) -> dict[str, str] | None:
@@ -112,47 +313,46 @@ class HealthChecker:
         Returns:
             Task dictionary, or None if not found.
         """
-        try:
-            result = subprocess.run(
-                ["bd", "show", issue_id, "--format", "json"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode != 0:
-                return None
+        result = self._run_bd("show", issue_id, "--format", "json")
+        if result is None or result.returncode != 0:
+            return None
 
-            return json.loads(result.stdout)
-        except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
+        try:
+            return loads(result.stdout)
+        except JSONDecodeError:
             return None
 
-    def _check_task(self, task: dict[str, str]) -> TaskHealth:
+    def _check_task(self, task: dict[str, str], now: datetime | None = None) -> TaskHealth:
         """Check the health of a single task.
 
         Args:
             task: Task dictionary from beads.
+            now: Reference time for heartbeat freshness. Defaults to the current time.
 
         Returns:
             Health status for the task.
         """
         issue_id = task.get("id", "")
-        status = task.get("status", "")
+        status = task.get("status")
+        # Malformed tasks (e.g. "status": null) are not in progress
+        status = sys.intern(status) if isinstance(status, str) else ""
         assignee = task.get("assignee")
 
         # Check if worktree exists
         worktree_path = self._find_worktree(issue_id)
-        worktree_exists = worktree_path is not None and worktree_path.exists()
+        # _find_worktree only returns paths it has seen on disk
+        worktree_exists = worktree_path is not None
 
         is_alive = False
         last_activity = None
         
         if worktree_exists and worktree_path:
-            is_alive, last_activity = self._check_heartbeat(worktree_path)
+            is_alive, last_activity = self._check_heartbeat(worktree_path, now)
 
         # A task is a zombie if it's in_progress but:
         # 1. Has no worktree, OR
         # 2. Has a worktree but is not alive (no heartbeat or process)
-        is_zombie = status == "in_progress" and (not worktree_exists or not is_alive)
+        is_zombie = status is _IN_PROGRESS and not (worktree_exists and is_alive)
 
         return TaskHealth(
             issue_id=issue_id,
@@ -164,38 +364,114 @@ class HealthChecker:
             last_activity=last_activity,
         )
 
-    def _check_heartbeat(self, worktree_path: Path) -> tuple[bool, datetime | None]:
+    def _check_heartbeat(
+        self, worktree_path: Path, now: datetime | None = None
+    ) -> tuple[bool, datetime | None]:
         """Check heartbeat status for a worktree.
 
+        Args:
+            worktree_path: Path to the worktree.
+            now: Reference time for freshness. Defaults to the current time.
+
         Returns:
             Tuple of (is_alive, last_activity).
         """
-        heartbeat_file = worktree_path / ".tambour" / "heartbeat"
-        
         # Priority: Check heartbeat file
-        if heartbeat_file.exists():
-            try:
-                data = json.loads(heartbeat_file.read_text())
-                timestamp_str = data.get("timestamp")
-                if timestamp_str:
-                    last_activity = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                    age = (datetime.now(timezone.utc) - last_activity).total_seconds()
-                    
-                    # Alive if heartbeat is fresh
-                    is_alive = age < self.zombie_threshold
-                    return is_alive, last_activity
-            except (json.JSONDecodeError, ValueError, OSError):
-                pass
-        
+        last_activity = self._read_heartbeat_timestamp(worktree_path / ".tambour" / "heartbeat")
+        if last_activity is not None:
+            if now is None:
+                now = datetime.now(timezone.utc)
+            age = (now - last_activity).total_seconds()
+
+            # Alive if heartbeat is fresh
+            is_alive = age < self.zombie_threshold
+            return is_alive, last_activity
+
         # Fallback: Check process
         is_alive = self._is_process_running_in_worktree(worktree_path)
         return is_alive, None
 
+    def _read_heartbeat_timestamp(self, heartbeat_file: Path) -> datetime | None:
+        """Read the last heartbeat time from a heartbeat file.
+
+        The parsed timestamp is cached against the file's inode, mtime and
+        size, so polling an unchanged heartbeat costs a single stat.
+
+        Returns:
+            The heartbeat timestamp, or None if missing or unreadable.
+        """
+        try:
+            st = os.stat(heartbeat_file)
+        except OSError:
+            self._heartbeat_cache.pop(heartbeat_file, None)
+            return None
+
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._heartbeat_cache.get(heartbeat_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        last_activity = None
+        raw = read_heartbeat_bytes(heartbeat_file)
+        if raw:
+            try:
+                timestamp_str = loads(raw).get("timestamp")
+                if timestamp_str:
+                    last_activity = parse_heartbeat_timestamp(timestamp_str)
+            except (JSONDecodeError, ValueError, AttributeError):
+                pass
+
+        self._heartbeat_cache[heartbeat_file] = (signature, last_activity)
+        return last_activity
+
     def _is_process_running_in_worktree(self, worktree_path: Path) -> bool:
         """Check if any process has the worktree as its CWD.
 
-        Uses lsof to find processes with CWD in the given path.
+        Reads process CWDs from /proc where available, falling back to
+        lsof on platforms without procfs.
         """
+        cwds = self._process_cwds()
+        if cwds is None:
+            return self._lsof_has_cwd_in(worktree_path)
+
+        target = os.fspath(worktree_path.resolve())
+        prefix = target + os.sep
+        return any(cwd == target or cwd.startswith(prefix) for cwd in cwds)
+
+    def _process_cwds(self) -> set[str] | None:
+        """Get the CWDs of all visible processes.
+
+        Within check_all() the snapshot is taken once and reused for every
+        task, so /proc is walked at most once per pass.
+
+        Returns:
+            Set of CWD paths, or None if /proc is unavailable.
+        """
+        if self._proc_cwds is not None:
+            return self._proc_cwds
+
+        try:
+            it = os.scandir("/proc")
+        except OSError:
+            return None
+
+        cwds: set[str] = set()
+        with it:
+            for entry in it:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    cwds.add(os.readlink(f"/proc/{entry.name}/cwd"))
+                except OSError:
+                    # Process exited or belongs to another user
+                    continue
+
+        if self._cache_proc_cwds:
+            self._proc_cwds = cwds
+        return cwds
+
+    def _lsof_has_cwd_in(self, worktree_path: Path) -> bool:
+        """Check for a process CWD in the worktree using lsof."""
         try:
             # lsof +d <path> lists open files in path
             # grep " cwd " filters for Current Working Directory
@@ -220,20 +496,30 @@ class HealthChecker:
         Returns:
             Path to worktree, or None if not found.
         """
-        # Get worktree base path from config
-        base_path_template = self.config.worktree.base_path
-
-        # Get repo name from current directory
-        cwd = Path.cwd()
-        repo_name = cwd.name
+        worktree_path = self._worktree_base / issue_id
+        if self._existing_worktrees is not None:
+            return worktree_path if issue_id in self._existing_worktrees else None
+        try:
+            is_dir = stat.S_ISDIR(os.stat(worktree_path).st_mode)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return worktree_path if is_dir else None
 
-        # Expand template
-        base_path = base_path_template.replace("{repo}", repo_name)
+    def _scan_worktrees(self) -> set[str] | None:
+        """List worktree directory names under the worktree base.
 
-        # Construct worktree path
-        worktree_path = cwd.parent / base_path.lstrip("../") / issue_id
+        One directory read replaces a stat per task in check_all().
 
-        return worktree_path if worktree_path.exists() else None
+        Returns:
+            Set of directory names, or None if the base could not be read.
+        """
+        try:
+            with os.scandir(self._worktree_base) as it:
+                return {entry.name for entry in it if entry.is_dir()}
+        except FileNotFoundError:
+            return set()
+        except OSError:
+            return None
 
     def _handle_zombie(self, health: TaskHealth) -> None:
         """Handle a zombie task.
@@ -243,6 +529,9 @@ class HealthChecker:
         """
         from tambour.events import Event, EventType, EventDispatcher
 
+        if health.worktree_path is not None:
+            self._heartbeat_cache.pop(health.worktree_path / ".tambour" / "heartbeat", None)
+
         # Emit health.zombie event
         event = Event(
             event_type=EventType.HEALTH_ZOMBIE,
@@ -269,14 +558,6 @@ class HealthChecker:
         Returns:
             True if recovery succeeded.
         """
-        try:
-            # Unclaim the task by removing assignee
-            result = subprocess.run(
-                ["bd", "update", health.issue_id, "--status", "open"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        # Unclaim the task by removing assignee
+        result = self._run_bd("update", health.issue_id, "--status", "open")
+        return result is not None and result.returncode == 0
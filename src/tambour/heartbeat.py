@@ -6,8 +6,8 @@ to indicate liveness.
 
 from __future__ import annotations
 
-import json
 import os
+import select
 import signal
 import sys
 import time
@@ -15,6 +15,94 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import NoReturn
 
+# Heartbeat files are a few dozen bytes; one read of this size covers them
+HEARTBEAT_READ_SIZE = 4096
+
+
+def parse_heartbeat_timestamp(value: str) -> datetime:
+    """Parse a heartbeat timestamp.
+
+    Heartbeats are written as ``YYYY-MM-DDTHH:MM:SS.ffffffZ``; that exact
+    shape is sliced directly into a datetime. Anything else (no fraction,
+    explicit offset, ...) goes through datetime.fromisoformat.
+
+    Args:
+        value: ISO-8601 timestamp string.
+
+    Returns:
+        Timezone-aware datetime.
+
+    Raises:
+        ValueError: If the string is not a valid ISO-8601 timestamp.
+    """
+    if (
+        len(value) == 27
+        and value[26] == "Z"
+        and value[19] == "."
+        and value[10] == "T"
+        and value[4] == value[7] == "-"
+        and value[13] == value[16] == ":"
+    ):
+        try:
+            return datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+                int(value[20:26]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+    return datetime.fromisoformat(value)
+
+
+def format_heartbeat_timestamp(ns: int) -> bytes:
+    """Format an epoch time as a heartbeat timestamp.
+
+    Produces ``YYYY-MM-DDTHH:MM:SS.ffffffZ`` from a time.time_ns() value
+    with one gmtime call, without building datetime objects.
+
+    Args:
+        ns: Nanoseconds since the epoch.
+
+    Returns:
+        ASCII timestamp, always with microseconds.
+    """
+    secs, frac = divmod(ns, 1_000_000_000)
+    tm = time.gmtime(secs)
+    return b"%04d-%02d-%02dT%02d:%02d:%02d.%06dZ" % (
+        tm.tm_year, tm.tm_mon, tm.tm_mday,
+        tm.tm_hour, tm.tm_min, tm.tm_sec,
+        frac // 1000,
+    )
+
+
+def read_heartbeat_bytes(heartbeat_file: Path) -> bytes | None:
+    """Read a heartbeat file with a single open/read/close.
+
+    Skips the separate existence check and buffered-IO setup of
+    Path.read_text(), which matters when polling many worktrees.
+
+    Args:
+        heartbeat_file: Path to the heartbeat file.
+
+    Returns:
+        Raw file contents, or None if the file cannot be read.
+    """
+    try:
+        fd = os.open(heartbeat_file, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, HEARTBEAT_READ_SIZE)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
 
 class HeartbeatWriter:
     """Writes periodic heartbeats to a file."""
@@ -29,7 +117,16 @@ class HeartbeatWriter:
         self.worktree_path = worktree_path
         self.interval = interval
         self.heartbeat_file = worktree_path / ".tambour" / "heartbeat"
-        self._running = False
+        # Set by the signal handler. The handler only flips this flag: taking
+        # a lock there (as Event.set does) can deadlock against the main
+        # thread holding the same lock inside wait()
+        self._stopping = False
+        # Read end of the self-pipe the interpreter writes to on any signal
+        # (signal.set_wakeup_fd), so _wait wakes up immediately on shutdown
+        self._wakeup_fd: int | None = None
+        # Only the timestamp changes between heartbeats; the rest of the
+        # JSON document is fixed for the life of the process
+        self._template = b'{"timestamp": "%s", "pid": ' + str(os.getpid()).encode() + b"}"
 
     def start(self) -> NoReturn:
         """Start the heartbeat loop.
@@ -39,22 +136,35 @@ class HeartbeatWriter:
         # Ensure .tambour directory exists
         self.heartbeat_file.parent.mkdir(parents=True, exist_ok=True)
 
-        self._running = True
-        
+        self._stopping = False
+
         # Handle signals
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        previous_wakeup_fd = signal.set_wakeup_fd(write_fd)
+        self._wakeup_fd = read_fd
         signal.signal(signal.SIGTERM, self._stop)
         signal.signal(signal.SIGINT, self._stop)
 
         print(f"Starting heartbeat writer for {self.worktree_path}")
         print(f"File: {self.heartbeat_file}")
 
-        while self._running:
-            try:
-                self._write_heartbeat()
-                time.sleep(self.interval)
-            except Exception as e:
-                print(f"Error writing heartbeat: {e}", file=sys.stderr)
-                time.sleep(5)  # Retry delay
+        try:
+            while True:
+                try:
+                    self._write_heartbeat()
+                    delay = self.interval
+                except Exception as e:
+                    print(f"Error writing heartbeat: {e}", file=sys.stderr)
+                    delay = 5  # Retry delay
+                if self._wait(delay):
+                    break
+        finally:
+            signal.set_wakeup_fd(previous_wakeup_fd)
+            self._wakeup_fd = None
+            os.close(read_fd)
+            os.close(write_fd)
 
         # Cleanup on exit
         self.heartbeat_file.unlink(missing_ok=True)
@@ -62,19 +172,52 @@ class HeartbeatWriter:
 
     def _stop(self, signum, frame):
         """Signal handler to stop the loop."""
-        self._running = False
+        self._stopping = True
+
+    def _wait(self, delay: float) -> bool:
+        """Sleep for up to delay seconds, returning early once stopping.
+
+        Python-level signal handlers have run by the time select() returns
+        for the wakeup byte, so the flag is current when it is rechecked.
+        Signals other than SIGTERM/SIGINT wake the loop too; it then goes
+        back to waiting out the rest of the delay.
+
+        Returns:
+            True if the loop should stop.
+        """
+        deadline = time.monotonic() + delay
+        while not self._stopping:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self._wakeup_fd is None:
+                time.sleep(min(remaining, 0.1))
+                continue
+            if select.select([self._wakeup_fd], [], [], remaining)[0]:
+                try:
+                    os.read(self._wakeup_fd, 512)
+                except BlockingIOError:
+                    pass
+        return True
 
     def _write_heartbeat(self) -> None:
-        """Write the current timestamp to the heartbeat file."""
-        data = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-            "pid": os.getpid(),
-        }
-        
-        # Write atomically-ish (write then flush)
-        # Using a temp file and rename would be truly atomic but 
-        # direct write is sufficient for a timestamp check
-        with open(self.heartbeat_file, "w") as f:
-            json.dump(data, f)
-            f.flush()
-            os.fsync(f.fileno())
+        """Write the current timestamp to the heartbeat file.
+
+        The file is not fsynced: liveness is soft state, and the next
+        heartbeat supersedes this one, so a disk barrier per tick buys no
+        correctness.
+        """
+        # Same document json.dumps would produce, with the timestamp
+        # spliced into a pre-serialized template
+        payload = self._template % format_heartbeat_timestamp(time.time_ns())
+
+        # Write a sibling temp file and rename it over the heartbeat, so
+        # readers see either the previous heartbeat or the new one, never a
+        # truncated file
+        tmp_file = self.heartbeat_file.with_suffix(".tmp")
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, self.heartbeat_file)
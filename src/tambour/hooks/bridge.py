@@ -10,7 +10,10 @@ Architecture:
             ↓ JSON via stdin
     Bridge script (this module)
             ↓
-    python -m tambour events emit tool.used --data '...'
+    .tambour/metrics.jsonl directly, for tool.used with $TAMBOUR_BRIDGE_DIRECT=1
+    (or the daemon bridge socket ($TAMBOUR_BRIDGE_SOCKET), batched by the daemon)
+    (or tambour.events.emit() in-process,
+     or python -m tambour events emit tool.used --data '...')
             ↓
     Tambour event dispatcher
             ↓
@@ -27,6 +30,12 @@ import sys
 from pathlib import Path
 from typing import Any
 
+# Issue IDs look like bobbin-abc, proj-123 or feature-abc.sub1
+_ISSUE_RE = re.compile(r"^[a-z]+-[a-z0-9]+(\.[a-z0-9]+)*$", re.IGNORECASE)
+
+# Bash commands longer than this many characters are truncated in events
+MAX_COMMAND_LENGTH = 200
+
 
 def parse_stdin() -> dict[str, Any] | None:
     """Read and parse JSON from stdin.
@@ -85,18 +94,18 @@ def infer_issue_id(cwd: str) -> str | None:
     Returns:
         Issue ID if detected, None otherwise.
     """
-    path = Path(cwd)
+    # Plain string ops: this runs on every tool call, so skip building a Path
+    name = os.path.basename(cwd.rstrip(os.sep))
 
     # Check if this looks like a worktree path
     # Pattern: *-worktrees/issue-id or just the directory name matching issue pattern
-    if "-worktrees" in str(path):
-        # Extract the last component (issue ID)
-        return path.name
+    if "-worktrees" in cwd:
+        # The last component is the issue ID
+        return name
 
     # Check if the directory name matches common issue ID patterns
-    name = path.name
     # Matches patterns like: bobbin-abc, proj-123, issue-xyz
-    if re.match(r"^[a-z]+-[a-z0-9]+(\.[a-z0-9]+)*$", name, re.IGNORECASE):
+    if _ISSUE_RE.match(name):
         return name
 
     return None
@@ -110,7 +119,15 @@ def emit_event(
     worktree: str | None,
     extra_data: dict[str, Any] | None = None,
 ) -> int:
-    """Emit a tambour event via the CLI.
+    """Emit a tambour event.
+
+    With TAMBOUR_BRIDGE_DIRECT=1, tool.used events are appended straight to
+    the worktree's metrics JSONL and no plugins run for them. Otherwise, if
+    TAMBOUR_BRIDGE_SOCKET names a running daemon's socket, the event is
+    handed to the daemon, which dispatches events in batches. Otherwise it
+    is dispatched in-process when tambour is importable, which avoids
+    starting a second Python interpreter per tool use, and via the CLI as
+    a last resort.
 
     Args:
         event_type: The event type (tool.used or tool.failed).
@@ -121,7 +138,7 @@ def emit_event(
         extra_data: Additional data to include in the event.
 
     Returns:
-        Exit code from the tambour CLI (0 for success).
+        Exit code (0 for success).
     """
     data = {
         "tool_name": tool_name,
@@ -130,6 +147,139 @@ def emit_event(
     if extra_data:
         data.update(extra_data)
 
+    if event_type == "tool.used" and _append_metric(data, issue_id, worktree):
+        return 0
+
+    if _send_to_daemon(event_type, data, issue_id, worktree):
+        return 0
+
+    exit_code = _emit_in_process(event_type, data, issue_id, worktree)
+    if exit_code is not None:
+        return exit_code
+
+    return _emit_via_cli(event_type, data, issue_id, worktree)
+
+
+def _append_metric(
+    data: dict[str, Any],
+    issue_id: str | None,
+    worktree: str | None,
+) -> bool:
+    """Append a tool.used metric to the worktree's JSONL, if enabled.
+
+    Stores the same record the metrics-collector plugin would, through
+    MetricsCollector.store.
+
+    Returns:
+        True if the metric was written.
+    """
+    if os.environ.get("TAMBOUR_BRIDGE_DIRECT") != "1" or not worktree:
+        return False
+
+    try:
+        from datetime import datetime, timezone
+
+        from tambour.metrics.collector import MetricEvent, MetricsCollector
+        from tambour.metrics.extractors import extract_tool_fields
+    except ImportError:
+        return False
+
+    tool_name = data["tool_name"]
+    tool_input = {k: data[k] for k in ("file_path", "command") if data.get(k)}
+    event = MetricEvent(
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        session_id=data.get("session_id") or "unknown",
+        tool=tool_name,
+        input=extract_tool_fields(tool_name, tool_input),
+        issue_id=issue_id,
+        worktree=worktree,
+    )
+
+    metrics_file = Path(worktree) / MetricsCollector.DEFAULT_METRICS_PATH
+    return MetricsCollector(metrics_file).store(event)
+
+
+def _send_to_daemon(
+    event_type: str,
+    data: dict[str, Any],
+    issue_id: str | None,
+    worktree: str | None,
+) -> bool:
+    """Hand an event to the daemon's bridge socket, if one is configured.
+
+    Returns:
+        True if the daemon accepted the event.
+    """
+    socket_path = os.environ.get("TAMBOUR_BRIDGE_SOCKET")
+    if not socket_path:
+        return False
+
+    try:
+        from tambour.eventsock import send_event
+    except ImportError:
+        return False
+
+    record = {
+        "event": event_type,
+        "issue": issue_id,
+        "worktree": worktree,
+        "data": data,
+    }
+    return send_event(socket_path, record)
+
+
+def _emit_in_process(
+    event_type: str,
+    data: dict[str, Any],
+    issue_id: str | None,
+    worktree: str | None,
+) -> int | None:
+    """Dispatch an event through tambour.events in this process.
+
+    Non-blocking plugins are started detached so the hook does not wait
+    for them. Events with a blocking plugin subscribed are left to the
+    CLI, whose timeout bounds how long the hook can be held up.
+
+    Returns:
+        Exit code (0 for success), or None if tambour.events is unavailable
+        or the event should go through the CLI.
+    """
+    try:
+        from tambour.config import Config
+        from tambour.events import emit, flatten_event_data
+    except ImportError:
+        return None
+
+    try:
+        config = Config.load_or_default()
+        if any(p.blocking for p in config.get_plugins_for_event(event_type)):
+            return None
+
+        results = emit(
+            event_type,
+            issue_id=issue_id,
+            worktree=Path(worktree) if worktree else None,
+            extra=flatten_event_data(data),
+            config=config,
+            detach_async=True,
+        )
+    except Exception:
+        return 1
+
+    return 1 if any(not r.success for r in results) else 0
+
+
+def _emit_via_cli(
+    event_type: str,
+    data: dict[str, Any],
+    issue_id: str | None,
+    worktree: str | None,
+) -> int:
+    """Emit an event by running the tambour CLI.
+
+    Returns:
+        Exit code from the tambour CLI (0 for success).
+    """
     cmd = [
         sys.executable,
         "-m",
@@ -217,8 +367,11 @@ def main() -> int:
     if tool_name == "Bash" and isinstance(tool_input, dict):
         command = tool_input.get("command", "")
         if command:
-            # Truncate long commands
-            extra_data["command"] = command[:200]
+            # Most commands are short enough to pass through untouched;
+            # only long ones are cut (by characters, so no code point is split)
+            if len(command) > MAX_COMMAND_LENGTH:
+                command = command[:MAX_COMMAND_LENGTH]
+            extra_data["command"] = command
 
     # Include error message if failed
     if is_failed and error_msg:
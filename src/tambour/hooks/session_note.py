@@ -24,8 +24,16 @@ import os
 import re
 import subprocess
 import sys
+import time
 from pathlib import Path
 
+# Issue IDs look like bobbin-abc, proj-123 or feature-abc.sub1
+_ISSUE_RE = re.compile(r"^[a-z]+-[a-z0-9]+(\.[a-z0-9]+)*$", re.IGNORECASE)
+
+# Issue titles fetched from beads, reused across sessions for a while
+_TITLE_CACHE = Path.home() / ".claude" / "title_cache.json"
+_TITLE_CACHE_TTL = 3600  # seconds
+
 
 def parse_stdin() -> dict | None:
     """Read and parse JSON from stdin."""
@@ -43,38 +51,67 @@ def infer_issue_id(cwd: str) -> str | None:
 
     Checks for worktree patterns or git branch name matching issue patterns.
     """
-    path = Path(cwd)
+    name = os.path.basename(cwd.rstrip(os.sep))
 
     # Check if this looks like a worktree path
-    if "-worktrees" in str(path):
-        return path.name
+    if "-worktrees" in cwd:
+        return name
 
     # Check if directory name matches issue pattern (e.g., bobbin-abc)
-    name = path.name
-    if re.match(r"^[a-z]+-[a-z0-9]+(\.[a-z0-9]+)*$", name, re.IGNORECASE):
+    if _ISSUE_RE.match(name):
         return name
 
-    # Try to get the git branch name
-    try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
-        if result.returncode == 0:
-            branch = result.stdout.strip()
-            # Check if branch matches issue pattern
-            if re.match(r"^[a-z]+-[a-z0-9]+(\.[a-z0-9]+)*$", branch, re.IGNORECASE):
-                return branch
-    except Exception:
-        pass
+    # Try the current git branch name
+    branch = _read_git_branch(Path(cwd))
+    if branch and _ISSUE_RE.match(branch):
+        return branch
 
     return None
 
 
+def _read_git_branch(path: Path) -> str | None:
+    """Read the checked-out branch name without running git.
+
+    Finds the nearest ``.git`` (a directory, or a ``gitdir:`` file in linked
+    worktrees) at or above ``path`` and reads its HEAD.
+
+    Returns:
+        Branch name, or None if not in a repository or HEAD is detached.
+    """
+    for parent in (path, *path.parents):
+        dot_git = parent / ".git"
+        try:
+            if dot_git.is_dir():
+                git_dir = dot_git
+            else:
+                content = dot_git.read_text().strip()
+                if not content.startswith("gitdir:"):
+                    return None
+                git_dir = parent / content.removeprefix("gitdir:").strip()
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            continue
+        if head.startswith("ref: refs/heads/"):
+            return head.removeprefix("ref: refs/heads/")
+        return None
+    return None
+
+
 def get_issue_title(issue_id: str) -> str | None:
+    """Get issue title, from the title cache or else from beads."""
+    cache = _load_title_cache()
+    entry = cache.get(issue_id)
+    if isinstance(entry, dict) and time.time() - entry.get("fetched", 0) < _TITLE_CACHE_TTL:
+        return entry.get("title")
+
+    title = _fetch_issue_title(issue_id)
+    if title:
+        cache[issue_id] = {"title": title, "fetched": time.time()}
+        _save_title_cache(cache)
+    return title
+
+
+def _fetch_issue_title(issue_id: str) -> str | None:
     """Get issue title from beads."""
     try:
         result = subprocess.run(
@@ -92,6 +129,33 @@ def get_issue_title(issue_id: str) -> str | None:
     return None
 
 
+def _load_title_cache() -> dict:
+    """Load the title cache, or an empty one if missing or unreadable."""
+    try:
+        cache = json.loads(_TITLE_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_title_cache(cache: dict) -> None:
+    """Write the title cache, dropping expired entries."""
+    now = time.time()
+    fresh = {
+        key: entry
+        for key, entry in cache.items()
+        if isinstance(entry, dict) and now - entry.get("fetched", 0) < _TITLE_CACHE_TTL
+    }
+    try:
+        _TITLE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        # Rename into place so concurrent sessions never read a partial file
+        tmp_file = _TITLE_CACHE.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(fresh))
+        os.replace(tmp_file, _TITLE_CACHE)
+    except OSError:
+        pass
+
+
 def truncate_to_words(text: str, max_words: int = 3) -> str:
     """Truncate text to max_words words."""
     words = text.split()
@@ -101,12 +165,24 @@ def truncate_to_words(text: str, max_words: int = 3) -> str:
 
 
 def write_session_note(session_id: str, note: str) -> bool:
-    """Write the session note file."""
+    """Write the session note file.
+
+    The notes directory only needs creating the first time, so it is made
+    on demand when opening the note file fails rather than on every call.
+    """
     try:
         notes_dir = Path.home() / ".claude" / "session_notes"
-        notes_dir.mkdir(parents=True, exist_ok=True)
         note_file = notes_dir / f"{session_id}.txt"
-        note_file.write_text(note)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        try:
+            fd = os.open(note_file, flags, 0o644)
+        except FileNotFoundError:
+            notes_dir.mkdir(parents=True, exist_ok=True)
+            fd = os.open(note_file, flags, 0o644)
+        try:
+            os.write(fd, note.encode())
+        finally:
+            os.close(fd)
         return True
     except Exception:
         return False
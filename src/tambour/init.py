@@ -5,7 +5,6 @@ Creates .tambour/config.toml with sensible defaults.
 
 from __future__ import annotations
 
-import subprocess
 from pathlib import Path
 
 DEFAULT_CONFIG = """\
@@ -27,25 +26,18 @@ base_path = "../{repo}-worktrees"
 
 def _is_git_repo(directory: Path) -> bool:
     """Check if the directory is inside a git repository."""
-    result = subprocess.run(
-        ["git", "rev-parse", "--is-inside-work-tree"],
-        capture_output=True,
-        text=True,
-        cwd=directory,
-    )
-    return result.returncode == 0 and result.stdout.strip() == "true"
+    return _get_git_root(directory) is not None
 
 
 def _get_git_root(directory: Path) -> Path | None:
-    """Get the root of the git repository containing directory."""
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True,
-        text=True,
-        cwd=directory,
-    )
-    if result.returncode == 0:
-        return Path(result.stdout.strip())
+    """Get the root of the git repository containing directory.
+
+    Walks up from directory looking for a ``.git`` entry, which is a
+    directory in a regular checkout and a file in a linked worktree.
+    """
+    for path in (directory, *directory.parents):
+        if (path / ".git").exists():
+            return path
     return None
 
 
@@ -8,17 +8,22 @@ from __future__ import annotations
 
 import json
 import os
+import random
 import socket
 import subprocess
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable
 
+from tambour.gitbatch import GitBatch, GitBatchError
 
 LOCK_REF = "refs/tambour/merge-lock"
 DEFAULT_TIMEOUT = 300  # 5 minutes
-POLL_INTERVAL = 5  # seconds
+POLL_INTERVAL = 5  # seconds, first retry delay
+MAX_POLL_INTERVAL = 60  # seconds, cap for the backoff between retries
+HOLDER_REFRESH_INTERVAL = 30  # seconds between holder lookups while waiting
 
 
 @dataclass
@@ -49,6 +54,20 @@ class LockMetadata:
             pid=data["pid"],
         )
 
+    def to_json(self) -> str:
+        """Serialize to the compact JSON stored in lock.json."""
+        return (
+            f'{{"holder":{json.dumps(self.holder)},'
+            f'"acquired_at":"{self.acquired_at.isoformat()}",'
+            f'"host":{json.dumps(self.host)},'
+            f'"pid":{self.pid}}}'
+        )
+
+    @classmethod
+    def from_json(cls, payload: str | bytes) -> LockMetadata:
+        """Parse lock.json contents, including older indented blobs."""
+        return cls.from_dict(json.loads(payload))
+
 
 @dataclass
 class LockStatus:
@@ -83,6 +102,12 @@ class MergeLock:
         self.timeout = timeout or int(os.environ.get("TAMBOUR_LOCK_TIMEOUT", DEFAULT_TIMEOUT))
         self._acquired = False
         self._holder: str | None = None
+        # Persistent object reader, reused across status polls
+        self._batch = GitBatch(repo_path)
+
+    def close(self) -> None:
+        """Shut down the git helper process used to read lock metadata."""
+        self._batch.close()
 
     def _run_git(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
         """Run a git command in the repo."""
@@ -96,48 +121,68 @@ class MergeLock:
     def status(self) -> LockStatus:
         """Check the current lock status.
 
+        Asks the remote for the lock commit with ls-remote and reads its
+        metadata from the local object store, fetching only when the
+        commit is not already present (i.e. the holder changed).
+
         Returns:
             LockStatus indicating if lock is held and by whom.
         """
-        # Try to fetch the lock ref
-        result = self._run_git("fetch", "origin", LOCK_REF, check=False)
-        if result.returncode != 0:
+        result = self._run_git("ls-remote", "origin", LOCK_REF, check=False)
+        if result.returncode != 0 or not result.stdout.strip():
             return LockStatus(held=False)
+        commit_sha = result.stdout.split()[0]
+
+        payload = self._read_lock_json(commit_sha)
+        if payload is None:
+            fetch_result = self._run_git("fetch", "origin", LOCK_REF, check=False)
+            if fetch_result.returncode == 0:
+                # The ref may have moved since ls-remote; FETCH_HEAD is current
+                payload = self._read_lock_json(commit_sha) or self._read_lock_json("FETCH_HEAD")
+        if payload is None:
+            return LockStatus(held=True)
 
-        # Read the lock metadata
         try:
-            cat_result = self._run_git("cat-file", "-p", "FETCH_HEAD", check=False)
-            if cat_result.returncode != 0:
-                return LockStatus(held=True)
-
-            # Parse the commit tree to find lock.json
-            tree_result = self._run_git("ls-tree", "FETCH_HEAD", check=False)
-            if tree_result.returncode != 0:
-                return LockStatus(held=True)
-
-            # Extract blob hash for lock.json
-            for line in tree_result.stdout.strip().split("\n"):
-                if "lock.json" in line:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        blob_hash = parts[2]
-                        blob_result = self._run_git("cat-file", "-p", blob_hash, check=False)
-                        if blob_result.returncode == 0:
-                            data = json.loads(blob_result.stdout)
-                            metadata = LockMetadata.from_dict(data)
-                            return LockStatus(held=True, metadata=metadata)
-
-            return LockStatus(held=True)
-        except (json.JSONDecodeError, KeyError):
+            metadata = LockMetadata.from_json(payload)
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
             return LockStatus(held=True)
+        return LockStatus(held=True, metadata=metadata)
+
+    def _read_lock_json(self, rev: str) -> bytes | None:
+        """Read lock.json from a lock commit in the local object store.
+
+        Args:
+            rev: Commit to read (sha or FETCH_HEAD).
+
+        Returns:
+            Raw lock.json contents, or None if the commit is not available.
+        """
+        name = f"{rev}:lock.json"
+        try:
+            return self._batch.contents(name)
+        except GitBatchError:
+            pass
 
-    def acquire(self, holder: str) -> bool:
+        # No batch helper (e.g. git < 2.36); one cat-file per read
+        result = self._run_git("cat-file", "blob", name, check=False)
+        if result.returncode != 0:
+            return None
+        return result.stdout.encode()
+
+    def acquire(self, holder: str, on_wait: Callable[[str], None] | None = None) -> bool:
         """Acquire the merge lock.
 
-        Blocks until the lock is acquired or timeout is reached.
+        Blocks until the lock is acquired or timeout is reached. The lock
+        lives on the remote, so there is nothing local to watch; waiting
+        is done by polling, with exponential backoff and jitter so agents
+        queued behind the same holder do not retry in lockstep. The
+        backoff restarts whenever the lock changes hands.
 
         Args:
             holder: Identifier for the lock holder (usually issue ID).
+            on_wait: Called with the current holder each time the lock is
+                found taken, before sleeping. Defaults to printing a
+                waiting message.
 
         Returns:
             True if lock was acquired, False on timeout.
@@ -151,40 +196,18 @@ class MergeLock:
             host=socket.gethostname(),
             pid=os.getpid(),
         )
-        lock_data = json.dumps(metadata.to_dict(), indent=2)
+        lock_data = metadata.to_json()
+        # The lock commit does not change between attempts, so it is built
+        # once and each retry is a single push
+        commit_sha: str | None = None
+        attempt = 0
+        last_holder: str | None = None
+        last_status_check: float | None = None
 
         while time.time() < deadline:
-            # Create git objects for the lock
             try:
-                # Create blob with lock data
-                blob_result = subprocess.run(
-                    ["git", "-C", str(self.repo_path), "hash-object", "-w", "--stdin"],
-                    input=lock_data,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                blob_sha = blob_result.stdout.strip()
-
-                # Create tree with the blob
-                tree_input = f"100644 blob {blob_sha}\tlock.json\n"
-                tree_result = subprocess.run(
-                    ["git", "-C", str(self.repo_path), "mktree"],
-                    input=tree_input,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                tree_sha = tree_result.stdout.strip()
-
-                # Create commit with the tree
-                commit_result = subprocess.run(
-                    ["git", "-C", str(self.repo_path), "commit-tree", tree_sha, "-m", f"merge lock: {holder}"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                commit_sha = commit_result.stdout.strip()
+                if commit_sha is None:
+                    commit_sha = self._create_lock_commit(holder, lock_data)
 
                 # Try to push the commit as the lock ref
                 push_result = self._run_git(
@@ -197,18 +220,71 @@ class MergeLock:
                     self._holder = holder
                     return True
 
-                # Lock is held by someone else, check who
-                status = self.status()
-                current_holder = status.holder or "unknown"
-                print(f"Waiting for merge lock (held by {current_holder})...")
-                time.sleep(POLL_INTERVAL)
+                # Lock is held by someone else. Who holds it only matters for
+                # reporting and backoff, so look it up at most every
+                # HOLDER_REFRESH_INTERVAL seconds rather than on every retry.
+                now = time.monotonic()
+                if last_status_check is None or now - last_status_check >= HOLDER_REFRESH_INTERVAL:
+                    last_status_check = now
+                    current_holder = self.status().holder or "unknown"
+                    if current_holder != last_holder:
+                        # New owner: progress was made, so start over with short waits
+                        attempt = 0
+                        last_holder = current_holder
+                if on_wait is not None:
+                    on_wait(last_holder)
+                else:
+                    print(f"Waiting for merge lock (held by {last_holder})...")
 
             except subprocess.CalledProcessError as e:
                 print(f"Error acquiring lock: {e}")
-                time.sleep(POLL_INTERVAL)
+
+            delay = min(MAX_POLL_INTERVAL, POLL_INTERVAL * 1.5 ** attempt)
+            if delay < MAX_POLL_INTERVAL:
+                attempt += 1
+            delay *= random.uniform(0.5, 1.0)
+            time.sleep(max(0.0, min(delay, deadline - time.time())))
 
         return False
 
+    def _create_lock_commit(self, holder: str, lock_data: str) -> str:
+        """Create a root commit holding lock.json.
+
+        Blob, tree and commit are written by a single ``git fast-import``
+        run. Its staging branch is reset before the import ends, so no
+        local ref is left behind; the commit is identified via get-mark.
+
+        Args:
+            holder: Lock holder, used in the commit message.
+            lock_data: Serialized lock metadata.
+
+        Returns:
+            SHA of the new commit.
+
+        Raises:
+            subprocess.CalledProcessError: If git fast-import fails.
+        """
+        payload = lock_data.encode()
+        message = f"merge lock: {holder}".encode()
+        committer = f"tambour <tambour@{socket.gethostname()}> {int(time.time())} +0000".encode()
+        staging_ref = b"refs/tambour/staging-lock"
+
+        stream = b"".join([
+            b"blob\nmark :1\ndata %d\n%s\n" % (len(payload), payload),
+            b"commit %s\nmark :2\ncommitter %s\n" % (staging_ref, committer),
+            b"data %d\n%s\n" % (len(message), message),
+            b"M 100644 :1 lock.json\n\n",
+            b"reset %s\n\n" % staging_ref,
+            b"get-mark :2\n",
+        ])
+        result = subprocess.run(
+            ["git", "-C", str(self.repo_path), "fast-import", "--quiet", "--cat-blob-fd=1"],
+            input=stream,
+            capture_output=True,
+            check=True,
+        )
+        return result.stdout.decode().strip()
+
     def release(self, holder: str | None = None) -> bool:
         """Release the merge lock.
 
@@ -265,5 +341,8 @@ class MergeLock:
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit - releases lock if held."""
-        if self._acquired and self._holder:
-            self.release(self._holder)
+        try:
+            if self._acquired and self._holder:
+                self.release(self._holder)
+        finally:
+            self.close()
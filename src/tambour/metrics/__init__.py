@@ -17,7 +17,8 @@ Architecture:
     metrics-aggregator (aggregator module)
             |
             v
-    .tambour/metrics-agg.json (cached aggregations)
+    .tambour/metrics-agg.msgpack, or metrics-agg.json without msgspec
+    (cached aggregations)
 """
 
 from tambour.metrics.collector import MetricsCollector, MetricEvent
@@ -29,6 +30,7 @@ from tambour.metrics.aggregator import (
     SessionStats,
     ToolStats,
     compute,
+    compute_json,
 )
 
 __all__ = [
@@ -43,4 +45,5 @@ __all__ = [
     "SessionStats",
     "ToolStats",
     "compute",
+    "compute_json",
 ]
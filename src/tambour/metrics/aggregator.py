@@ -14,18 +14,407 @@ Usage:
     complex_files = agg.get_files_with_high_reread_rate(threshold=3.0)
     tool_stats = agg.get_tool_stats()
     session_stats = agg.get_session_stats(session_id="abc123")
+
+    # Or straight to JSON, e.g. for an API response
+    payload = aggregator.compute_json(window_days=7)
 """
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass, field
+import heapq
+import os
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone, timedelta
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from sys import intern
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, TypeVar
+
+from tambour._json import dumps, loads
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# The binary cache is preferred when msgspec is installed; the JSON cache
+# is then only written if this is set, for human inspection
+JSON_CACHE_ENV = "TAMBOUR_METRICS_JSON_CACHE"
+
+# Tools counted as file edits
+_EDIT_TOOLS = frozenset(("Edit", "Write"))
+
+# Minimum bytes of metrics.jsonl per worker process when aggregating from
+# scratch; smaller files are read in-process, as pool startup would cost
+# more than it saves
+PARALLEL_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Bytes kept from the start of metrics.jsonl and before the resume offset
+# to tell an appended-to file from a rewritten one
+_FINGERPRINT_SIZE = 64
+
+# How MetricEvent.to_json starts each line, so the timestamp can be read
+# without decoding the rest
+_TIMESTAMP_PREFIX = b'{"timestamp":"'
+_TIMESTAMP_START = len(_TIMESTAMP_PREFIX)
+_TIMESTAMP_T = _TIMESTAMP_START + 10
+_TIMESTAMP_SECOND_END = _TIMESTAMP_START + 19
+
+_T = TypeVar("_T")
+
+if msgspec is not None:
+    _ENCODER = msgspec.msgpack.Encoder()
+    _DECODER = msgspec.msgpack.Decoder()
+
+    class _EventInput(msgspec.Struct):
+        """The part of a tool input that aggregation reads."""
+
+        file_path: Any = None
+
+    class _EventOutput(msgspec.Struct):
+        """The part of a tool output that aggregation reads."""
+
+        success: Any = True
+
+    class _Event(msgspec.Struct):
+        """The fields of a metrics.jsonl event that aggregation reads.
+
+        Decoding into this skips every other field instead of building it.
+        Types are left loose so values come out as a plain decode would
+        give them; only unexpected input/output shapes fail validation.
+        """
+
+        timestamp: Any = ""
+        session_id: Any = "unknown"
+        tool: Any = ""
+        issue_id: Any = None
+        input: _EventInput | None = None
+        output: _EventOutput | None = None
+        error: Any = None
+
+    _EVENT_DECODER = msgspec.json.Decoder(_Event)
+else:
+    _ENCODER = _DECODER = _EVENT_DECODER = None
+
+
+def before_cutoff(timestamp: str, cutoff: datetime, cutoff_second: str) -> bool:
+    """Check whether an ISO timestamp falls before the cutoff.
+
+    UTC timestamps outside the cutoff's second are compared as strings,
+    which order the same as the times they encode; anything else is
+    parsed. Timestamps that cannot be parsed count as not before.
+
+    Args:
+        timestamp: ISO-8601 timestamp from an event.
+        cutoff: Timezone-aware cutoff time.
+        cutoff_second: The cutoff's UTC "YYYY-MM-DDTHH:MM:SS" prefix.
+    """
+    if (
+        timestamp[10:11] == "T"
+        and timestamp.endswith(("Z", "+00:00"))
+        and timestamp[:19] != cutoff_second
+    ):
+        return timestamp[:19] < cutoff_second
+
+    try:
+        # Python 3.11+ accepts a trailing "Z"
+        return datetime.fromisoformat(timestamp) < cutoff
+    except (ValueError, TypeError):
+        # Unparseable, or naive and so not comparable
+        return False
+
+
+def cutoff_keys(cutoff: datetime) -> tuple[str, bytes]:
+    """Precompute the cutoff forms used by before_cutoff and compare_line_to_cutoff.
+
+    Returns:
+        The cutoff's UTC "YYYY-MM-DDTHH:MM:SS" prefix, and the start of a
+        collector-written line with that timestamp.
+    """
+    cutoff_second = cutoff.astimezone(timezone.utc).isoformat()[:19]
+    return cutoff_second, _TIMESTAMP_PREFIX + cutoff_second.encode()
+
+
+def compare_line_to_cutoff(line: bytes, cutoff_line: bytes) -> int:
+    """Compare a raw metrics.jsonl line's timestamp with the cutoff.
+
+    Lines written by MetricEvent.to_json lead with the timestamp, so UTC
+    ones from a different second than the cutoff can be ordered without
+    decoding. Anything else has to be decoded to tell.
+
+    Args:
+        line: Raw line from metrics.jsonl.
+        cutoff_line: Second element of cutoff_keys(cutoff).
+
+    Returns:
+        -1 if the line is before the cutoff, 1 if it is after, or 0 if
+        that cannot be told from the raw bytes.
+    """
+    key = line[:_TIMESTAMP_SECOND_END]
+    if (
+        key == cutoff_line
+        or not line.startswith(_TIMESTAMP_PREFIX)
+        or line[_TIMESTAMP_T:_TIMESTAMP_T + 1] != b"T"
+        or not line[
+            _TIMESTAMP_START:line.find(b'"', _TIMESTAMP_START)
+        ].endswith((b"Z", b"+00:00"))
+    ):
+        return 0
+    return -1 if key < cutoff_line else 1
+
+
+def _replace_file(path: Path, chunks: Iterable[bytes]) -> None:
+    """Write chunks to path through a per-process temp file and a rename.
+
+    Several processes (dashboards, hooks, CLI runs) can share a cache, so
+    readers must see either the previous file or the new one, never a
+    truncated one that fails to decode and forces a full recompute.
+    """
+    tmp_file = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "wb") as f:
+            f.writelines(chunks)
+        os.replace(tmp_file, path)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _from_fields(cls: type[_T], data: dict[str, Any]) -> _T:
+    """Build a stats dataclass from a cached dict, ignoring unknown keys.
+
+    Caches written by another tambour version may carry fields this one
+    does not know; they are dropped rather than discarding the cache.
+    """
+    try:
+        return cls(**data)
+    except TypeError:
+        return cls(**{k: v for k, v in data.items() if k in cls.__slots__})
+
+
+def _iter_json_records(records: dict[str, Any]) -> Iterator[bytes]:
+    """Yield a JSON object mapping keys to records' to_dict(), one per line."""
+    yield b"{"
+    separator = b"\n"
+    for key, record in records.items():
+        yield separator + dumps(key) + b": " + dumps(record.to_dict())
+        separator = b",\n"
+    yield b"}"
+
+
+def _iter_json_cache(
+    result: AggregationResult, state: _AggregationState | None
+) -> Iterator[bytes]:
+    """Yield the JSON cache for a result and its running totals in pieces.
+
+    Records are serialized one at a time as they are written, so the full
+    to_dict() tree and its encoding never have to be held at once.
+    """
+    # Encode the scalar fields as an object and leave it open for the
+    # record sections that follow
+    yield dumps({
+        "computed_at": result.computed_at,
+        "window_days": result.window_days,
+        "event_count": result.event_count,
+    })[:-1]
+    for name in ("file_stats", "session_stats", "tool_stats"):
+        yield b',\n"' + name.encode() + b'": '
+        yield from _iter_json_records(getattr(result, name))
+
+    if state is None:
+        yield b',\n"state": null}\n'
+        return
+    yield b',\n"state": ' + dumps({
+        "event_count": state.event_count,
+        "tool_uses": state.tool_uses,
+        "tool_successes": state.tool_successes,
+        "oldest": state.oldest,
+        "cursor": state.cursor,
+        "head": state.head,
+        "tail": state.tail,
+    })[:-1]
+    for name in ("files", "sessions"):
+        yield b',\n"' + name.encode() + b'": '
+        yield from _iter_json_records(getattr(state, name))
+    yield b"}}\n"
+
+
+def _event_fields(line: bytes) -> tuple | None:
+    """Decode the fields aggregation needs from a metrics.jsonl line.
+
+    Returns:
+        ``(tool, session_id, timestamp, issue_id, file_path, success)``, or
+        None if the line is not valid JSON.
+    """
+    if _EVENT_DECODER is not None:
+        try:
+            event = _EVENT_DECODER.decode(line)
+        except msgspec.ValidationError:
+            # Valid JSON of an unexpected shape, e.g. a non-object input;
+            # read it the generic way below
+            pass
+        except ValueError:
+            return None
+        else:
+            tool_input = event.input
+            tool_output = event.output
+            return (
+                event.tool,
+                event.session_id,
+                event.timestamp,
+                event.issue_id,
+                tool_input.file_path if tool_input is not None else None,
+                False if event.error else tool_output.success if tool_output is not None else True,
+            )
+
+    # ValueError also covers invalid UTF-8
+    try:
+        event = loads(line)
+    except ValueError:
+        return None
+
+    event_get = event.get
+    tool_input = event_get("input")
+    tool_output = event_get("output")
+
+    # Extract file path for file-based tools
+    file_path = tool_input.get("file_path") if isinstance(tool_input, dict) else None
+
+    # Determine success/failure
+    success = True
+    if event_get("error"):
+        success = False
+    elif isinstance(tool_output, dict):
+        success = tool_output.get("success", True)
+
+    return (
+        event_get("tool", ""),
+        event_get("session_id", "unknown"),
+        event_get("timestamp", ""),
+        event_get("issue_id"),
+        file_path,
+        success,
+    )
+
+
+def _decode_events(lines: Iterable[bytes], cutoff: datetime) -> Iterator[tuple]:
+    """Decode metrics.jsonl lines, dropping malformed ones and those before cutoff.
+
+    Args:
+        lines: Raw lines, with or without their newline.
+        cutoff: Only include events after this time.
 
+    Yields:
+        Event fields as returned by _event_fields, in line order.
+    """
+    # Compare UTC timestamps as strings without building a datetime per
+    # event
+    cutoff_second, cutoff_line = cutoff_keys(cutoff)
+
+    for line in lines:
+        # Skip expired events without decoding them
+        if compare_line_to_cutoff(line, cutoff_line) < 0:
+            continue
+
+        # JSON allows surrounding whitespace, so lines are decoded as read;
+        # blank lines fail like malformed ones and are skipped
+        event = _event_fields(line)
+        if event is None:
+            continue
+
+        # Filter by timestamp
+        timestamp_str = event[2]
+        if timestamp_str and before_cutoff(timestamp_str, cutoff, cutoff_second):
+            continue
+
+        yield event
+
+
+def _resume_position(f: BinaryIO, offset: int) -> tuple[int, str, str] | None:
+    """Describe a resume offset in an open metrics.jsonl.
+
+    Returns:
+        ``(offset, head, tail)`` as stored in _AggregationState, or None if
+        offset is not at a line boundary: a final line without a newline
+        may still be being written.
+    """
+    f.seek(0)
+    head = f.read(_FINGERPRINT_SIZE)
+    f.seek(max(0, offset - _FINGERPRINT_SIZE))
+    tail = f.read(offset - f.tell())
+    if tail and not tail.endswith(b"\n"):
+        return None
+    return offset, head.hex(), tail.hex()
+
+
+def _usable_cpus() -> int:
+    """Count the CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _split_lines(path: Path, parts: int) -> list[int]:
+    """Split a file into up to parts byte ranges that start on line boundaries.
+
+    Returns:
+        Ascending offsets from 0 to the file size; consecutive pairs are
+        the ranges.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        bounds = [0]
+        for i in range(1, parts):
+            # Move past the line straddling the even split point; the range
+            # before it reads that line to its end
+            f.seek(size * i // parts)
+            f.readline()
+            offset = f.tell()
+            if bounds[-1] < offset < size:
+                bounds.append(offset)
+    bounds.append(size)
+    return bounds
+
+
+def _aggregate_range(
+    path: Path, start: int, end: int, cutoff: datetime
+) -> _AggregationState:
+    """Aggregate the lines starting in [start, end) of metrics.jsonl.
+
+    Runs in a worker process for MetricsAggregator._aggregate_in_parallel.
+    """
+
+    def lines(f: BinaryIO) -> Iterator[bytes]:
+        offset = start
+        for line in f:
+            if offset >= end:
+                return
+            offset += len(line)
+            yield line
+
+    state = _AggregationState()
+    with open(path, "rb") as f:
+        f.seek(start)
+        state.add_events(_decode_events(lines(f), cutoff))
+    return state
+
+
+def _largest(items: Iterable[_T], key: Callable[[_T], float], top_k: int | None) -> list[_T]:
+    """Sort items by key descending, keeping only the first top_k if set.
 
-@dataclass
+    A heap selects the top_k in O(n log k) rather than sorting everything.
+    Ties keep their original order either way.
+    """
+    if top_k is not None:
+        return heapq.nlargest(top_k, items, key=key)
+    return sorted(items, key=key, reverse=True)
+
+
+@dataclass(slots=True)
 class FileStats:
     """Aggregated statistics for a single file.
 
@@ -50,11 +439,23 @@ class FileStats:
     first_accessed: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        """Convert to dictionary for JSON serialization, omitting None values."""
+        data = {
+            "file_path": self.file_path,
+            "total_reads": self.total_reads,
+            "unique_sessions": self.unique_sessions,
+            "avg_reads_per_session": self.avg_reads_per_session,
+            "total_edits": self.total_edits,
+            "edit_success_rate": self.edit_success_rate,
+        }
+        if self.last_accessed is not None:
+            data["last_accessed"] = self.last_accessed
+        if self.first_accessed is not None:
+            data["first_accessed"] = self.first_accessed
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStats:
     """Aggregated statistics for a single session.
 
@@ -81,11 +482,25 @@ class SessionStats:
     end_time: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        """Convert to dictionary for JSON serialization, omitting None values."""
+        data = {
+            "session_id": self.session_id,
+            "total_tool_uses": self.total_tool_uses,
+            "unique_files_accessed": self.unique_files_accessed,
+            "read_count": self.read_count,
+            "edit_count": self.edit_count,
+            "edit_success_rate": self.edit_success_rate,
+        }
+        if self.issue_id is not None:
+            data["issue_id"] = self.issue_id
+        if self.start_time is not None:
+            data["start_time"] = self.start_time
+        if self.end_time is not None:
+            data["end_time"] = self.end_time
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolStats:
     """Aggregated statistics for a single tool type.
 
@@ -105,10 +520,16 @@ class ToolStats:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            "tool": self.tool,
+            "total_uses": self.total_uses,
+            "success_count": self.success_count,
+            "failure_count": self.failure_count,
+            "success_rate": self.success_rate,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregationResult:
     """Container for all aggregation results.
 
@@ -127,46 +548,59 @@ class AggregationResult:
     file_stats: dict[str, FileStats] = field(default_factory=dict)
     session_stats: dict[str, SessionStats] = field(default_factory=dict)
     tool_stats: dict[str, ToolStats] = field(default_factory=dict)
+    _files_by_basename: dict[str, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sorted_session_ids: list[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def get_files_by_reads(self, min_reads: int = 1) -> list[FileStats]:
+    def get_files_by_reads(
+        self, min_reads: int = 1, top_k: int | None = None
+    ) -> list[FileStats]:
         """Get files sorted by read count.
 
         Args:
             min_reads: Minimum read count to include.
+            top_k: If set, only return this many files.
 
         Returns:
             List of FileStats sorted by total_reads descending.
         """
-        files = [
+        files = (
             stats for stats in self.file_stats.values() if stats.total_reads >= min_reads
-        ]
-        return sorted(files, key=lambda f: f.total_reads, reverse=True)
+        )
+        return _largest(files, lambda f: f.total_reads, top_k)
 
-    def get_files_with_high_reread_rate(self, threshold: float = 3.0) -> list[FileStats]:
+    def get_files_with_high_reread_rate(
+        self, threshold: float = 3.0, top_k: int | None = None
+    ) -> list[FileStats]:
         """Get files with high average re-reads per session.
 
         Args:
             threshold: Minimum avg_reads_per_session to include.
+            top_k: If set, only return this many files.
 
         Returns:
             List of FileStats sorted by avg_reads_per_session descending.
         """
-        files = [
+        files = (
             stats
             for stats in self.file_stats.values()
             if stats.avg_reads_per_session >= threshold
-        ]
-        return sorted(files, key=lambda f: f.avg_reads_per_session, reverse=True)
+        )
+        return _largest(files, lambda f: f.avg_reads_per_session, top_k)
 
-    def get_tool_stats(self) -> list[ToolStats]:
+    def get_tool_stats(self, top_k: int | None = None) -> list[ToolStats]:
         """Get all tool statistics sorted by usage count.
 
+        Args:
+            top_k: If set, only return this many tools.
+
         Returns:
             List of ToolStats sorted by total_uses descending.
         """
-        return sorted(
-            self.tool_stats.values(), key=lambda t: t.total_uses, reverse=True
-        )
+        return _largest(self.tool_stats.values(), lambda t: t.total_uses, top_k)
 
     def get_session_stats(self, session_id: str) -> SessionStats | None:
         """Get statistics for a specific session.
@@ -179,15 +613,71 @@ class AggregationResult:
         """
         return self.session_stats.get(session_id)
 
-    def get_all_sessions(self) -> list[SessionStats]:
+    def find_files(self, query: str) -> list[FileStats]:
+        """Find files by exact path, path suffix, or substring.
+
+        Paths ending in ``query`` are looked up through a basename index
+        built on first use. The substring scan over all paths only runs
+        when that finds nothing. The index assumes file_stats is not
+        modified afterwards.
+
+        Args:
+            query: Full path, trailing path components, or any substring.
+
+        Returns:
+            List of matching FileStats; empty if nothing matches.
+        """
+        stats = self.file_stats.get(query)
+        if stats is not None:
+            return [stats]
+
+        if self._files_by_basename is None:
+            index: dict[str, list[str]] = defaultdict(list)
+            for path in self.file_stats:
+                index[path.rpartition("/")[2]].append(path)
+            self._files_by_basename = dict(index)
+        candidates = self._files_by_basename.get(query.rpartition("/")[2], ())
+        matches = [path for path in candidates if path.endswith(query)]
+        if not matches:
+            matches = [path for path in self.file_stats if query in path]
+        return [self.file_stats[path] for path in matches]
+
+    def find_sessions(self, prefix: str) -> list[SessionStats]:
+        """Find sessions by exact ID or ID prefix.
+
+        Prefixes are resolved by bisecting a sorted list of session IDs
+        built on first use.
+
+        Args:
+            prefix: Full session ID or its leading characters.
+
+        Returns:
+            List of matching SessionStats in ID order; empty if none match.
+        """
+        stats = self.session_stats.get(prefix)
+        if stats is not None:
+            return [stats]
+
+        if self._sorted_session_ids is None:
+            self._sorted_session_ids = sorted(self.session_stats)
+        ids = self._sorted_session_ids
+        matches = []
+        for i in range(bisect_left(ids, prefix), len(ids)):
+            if not ids[i].startswith(prefix):
+                break
+            matches.append(self.session_stats[ids[i]])
+        return matches
+
+    def get_all_sessions(self, top_k: int | None = None) -> list[SessionStats]:
         """Get all session statistics sorted by tool usage.
 
+        Args:
+            top_k: If set, only return this many sessions.
+
         Returns:
             List of SessionStats sorted by total_tool_uses descending.
         """
-        return sorted(
-            self.session_stats.values(), key=lambda s: s.total_tool_uses, reverse=True
-        )
+        return _largest(self.session_stats.values(), lambda s: s.total_tool_uses, top_k)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -202,7 +692,7 @@ class AggregationResult:
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return dumps(self.to_dict(), indent=True).decode()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AggregationResult:
@@ -222,19 +712,240 @@ class AggregationResult:
 
         # Reconstruct file stats
         for path, stats_dict in data.get("file_stats", {}).items():
-            result.file_stats[path] = FileStats(**stats_dict)
+            result.file_stats[path] = _from_fields(FileStats, stats_dict)
 
         # Reconstruct session stats
         for session_id, stats_dict in data.get("session_stats", {}).items():
-            result.session_stats[session_id] = SessionStats(**stats_dict)
+            result.session_stats[session_id] = _from_fields(SessionStats, stats_dict)
 
         # Reconstruct tool stats
         for tool_name, stats_dict in data.get("tool_stats", {}).items():
-            result.tool_stats[tool_name] = ToolStats(**stats_dict)
+            result.tool_stats[tool_name] = _from_fields(ToolStats, stats_dict)
 
         return result
 
 
+# Public AggregationResult fields; the lookup indexes are init=False slots
+# that must not leak into caches or JSON output
+_RESULT_FIELDS = tuple(f.name for f in fields(AggregationResult) if f.init)
+
+
+@dataclass(slots=True)
+class _FileTally:
+    """Running totals for one file while events are aggregated."""
+
+    first: str
+    last: str
+    reads: int = 0
+    edits: int = 0
+    edit_successes: int = 0
+    sessions: set[str] = field(default_factory=set)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["sessions"] = list(self.sessions)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _FileTally:
+        """Create from dictionary."""
+        return cls(**{**data, "sessions": set(data["sessions"])})
+
+
+@dataclass(slots=True)
+class _SessionTally:
+    """Running totals for one session while events are aggregated."""
+
+    first: str
+    last: str
+    issue_id: str | None = None
+    tools: int = 0
+    reads: int = 0
+    edits: int = 0
+    edit_successes: int = 0
+    files: set[str] = field(default_factory=set)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["files"] = list(self.files)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _SessionTally:
+        """Create from dictionary."""
+        return cls(**{**data, "files": set(data["files"])})
+
+
+@dataclass(slots=True)
+class _AggregationState:
+    """Running totals over metrics.jsonl up to a byte offset.
+
+    Cached with the result so that the next compute() only reads the
+    events appended since, as long as none of the aggregated events has
+    left the window and the file was not rewritten.
+
+    Attributes:
+        event_count: Number of events aggregated.
+        files: Per-file running totals.
+        sessions: Per-session running totals.
+        tool_uses: Per-tool use counts.
+        tool_successes: Per-tool success counts.
+        oldest: Earliest timestamp among the aggregated events.
+        cursor: Offset just past the last aggregated line, or None if the
+            file did not end on a complete line and cannot be resumed.
+        head: Hex of the file's first bytes, to detect rewrites.
+        tail: Hex of the bytes just before cursor, to detect rewrites.
+    """
+
+    event_count: int = 0
+    files: dict[str, _FileTally] = field(default_factory=dict)
+    sessions: dict[str, _SessionTally] = field(default_factory=dict)
+    tool_uses: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    tool_successes: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    oldest: str | None = None
+    cursor: int | None = 0
+    head: str = ""
+    tail: str = ""
+
+    def add_events(self, events: Iterable[tuple]) -> None:
+        """Add events to the running totals.
+
+        Args:
+            events: Event fields from _decode_events, already filtered to
+                the window.
+        """
+        # One record per file/session so each event costs a single dict
+        # lookup per key instead of one per counter
+        files = self.files
+        sessions = self.sessions
+        tool_uses = self.tool_uses
+        tool_successes = self.tool_successes
+        oldest = self.oldest
+
+        event_count = self.event_count
+        for tool, session_id, timestamp, issue_id, file_path, success in events:
+            event_count += 1
+
+            # Track tool stats
+            tool_uses[tool] += 1
+            if success:
+                tool_successes[tool] += 1
+
+            # Track session stats. ISO-8601 UTC timestamps order
+            # lexicographically, so plain string comparison finds the first
+            # and last without parsing
+            if timestamp and (oldest is None or timestamp < oldest):
+                oldest = timestamp
+            session = sessions.get(session_id)
+            if session is None:
+                session = sessions[session_id] = _SessionTally(first=timestamp, last=timestamp)
+            elif timestamp < session.first:
+                session.first = timestamp
+            elif timestamp > session.last:
+                session.last = timestamp
+            session.tools += 1
+            if issue_id and session.issue_id is None:
+                session.issue_id = issue_id
+
+            # Track file-specific stats
+            if file_path:
+                # Every decoded event carries its own copies of these
+                # strings; interning stores one per path and session across
+                # all the per-file and per-session sets
+                try:
+                    file_path = intern(file_path)
+                    session_id = intern(session_id)
+                except TypeError:
+                    pass
+
+                tally = files.get(file_path)
+                if tally is None:
+                    tally = files[file_path] = _FileTally(first=timestamp, last=timestamp)
+                elif timestamp < tally.first:
+                    tally.first = timestamp
+                elif timestamp > tally.last:
+                    tally.last = timestamp
+
+                # File reads
+                if tool == "Read":
+                    tally.reads += 1
+                    session.reads += 1
+
+                # File edits
+                elif tool in _EDIT_TOOLS:
+                    tally.edits += 1
+                    session.edits += 1
+                    if success:
+                        tally.edit_successes += 1
+                        session.edit_successes += 1
+
+                # Track file-session associations
+                tally.sessions.add(session_id)
+                session.files.add(file_path)
+
+        self.event_count = event_count
+        self.oldest = oldest
+
+    def merge(self, other: _AggregationState) -> None:
+        """Add running totals over the events that follow these ones.
+
+        Args:
+            other: Totals over a later part of metrics.jsonl.
+        """
+        self.event_count += other.event_count
+        if other.oldest is not None and (self.oldest is None or other.oldest < self.oldest):
+            self.oldest = other.oldest
+
+        for tool, uses in other.tool_uses.items():
+            self.tool_uses[tool] += uses
+        for tool, successes in other.tool_successes.items():
+            self.tool_successes[tool] += successes
+
+        for file_path, theirs in other.files.items():
+            tally = self.files.get(file_path)
+            if tally is None:
+                self.files[file_path] = theirs
+                continue
+            tally.first = min(tally.first, theirs.first)
+            tally.last = max(tally.last, theirs.last)
+            tally.reads += theirs.reads
+            tally.edits += theirs.edits
+            tally.edit_successes += theirs.edit_successes
+            tally.sessions |= theirs.sessions
+
+        for session_id, theirs in other.sessions.items():
+            session = self.sessions.get(session_id)
+            if session is None:
+                self.sessions[session_id] = theirs
+                continue
+            session.first = min(session.first, theirs.first)
+            session.last = max(session.last, theirs.last)
+            if session.issue_id is None:
+                session.issue_id = theirs.issue_id
+            session.tools += theirs.tools
+            session.reads += theirs.reads
+            session.edits += theirs.edits
+            session.edit_successes += theirs.edit_successes
+            session.files |= theirs.files
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _AggregationState:
+        """Create from dictionary."""
+        return cls(
+            event_count=data["event_count"],
+            files={k: _FileTally.from_dict(v) for k, v in data["files"].items()},
+            sessions={k: _SessionTally.from_dict(v) for k, v in data["sessions"].items()},
+            tool_uses=defaultdict(int, data["tool_uses"]),
+            tool_successes=defaultdict(int, data["tool_successes"]),
+            oldest=data["oldest"],
+            cursor=data["cursor"],
+            head=data["head"],
+            tail=data["tail"],
+        )
+
+
 class MetricsAggregator:
     """Aggregates raw metric events into useful statistics.
 
@@ -256,6 +967,8 @@ class MetricsAggregator:
         Args:
             metrics_path: Path to metrics.jsonl. Defaults to .tambour/metrics.jsonl.
             cache_path: Path to cache file. Defaults to .tambour/metrics-agg.json.
+                        A MessagePack copy is kept next to it as
+                        metrics-agg.msgpack when msgspec is installed.
         """
         base_path = Path.cwd()
 
@@ -266,12 +979,17 @@ class MetricsAggregator:
         if cache_path is None:
             cache_path = base_path / self.DEFAULT_CACHE_PATH
         self.cache_path = Path(cache_path)
+        self.cache_bin_path = self.cache_path.with_suffix(".msgpack")
+        self._read_position: tuple[int, str, str] | None = None
 
     def compute(
         self, window_days: int = DEFAULT_WINDOW_DAYS, force: bool = False
     ) -> AggregationResult:
         """Compute aggregations from metrics.jsonl.
 
+        When metrics.jsonl has only grown since the cache was written, the
+        cached running totals are resumed and just the new events are read.
+
         Args:
             window_days: Number of days to include in the time window.
             force: If True, recompute even if cache is fresh.
@@ -279,140 +997,114 @@ class MetricsAggregator:
         Returns:
             AggregationResult with computed statistics.
         """
+        state = None
+
         # Check cache unless forced
         if not force:
-            cached = self._load_cache(window_days)
+            cached, state = self._load_cache(window_days)
             if cached is not None:
                 return cached
 
         # Compute fresh aggregations
-        result = self._compute_aggregations(window_days)
+        result, state = self._compute_aggregations(window_days, state)
 
         # Save to cache
-        self._save_cache(result)
+        self._save_cache(result, state)
 
         return result
 
-    def _compute_aggregations(self, window_days: int) -> AggregationResult:
+    def compute_json(
+        self, window_days: int = DEFAULT_WINDOW_DAYS, force: bool = False
+    ) -> bytes:
+        """Compute aggregations and return them as compact JSON.
+
+        Carries the same data as ``compute(...).to_dict()``, but a fresh
+        cache is re-encoded from its decoded form without building the
+        AggregationResult and converting it back. Unset optional fields may
+        then appear as null rather than being left out.
+
+        Args:
+            window_days: Number of days to include in the time window.
+            force: If True, recompute even if cache is fresh.
+
+        Returns:
+            UTF-8 encoded JSON.
+        """
+        state = None
+
+        if not force:
+            cached, state = self._load_cache(window_days, as_dict=True)
+            if cached is not None:
+                return dumps(cached)
+
+        result, state = self._compute_aggregations(window_days, state)
+        self._save_cache(result, state)
+
+        return dumps(result.to_dict())
+
+    def _compute_aggregations(
+        self, window_days: int, state: _AggregationState | None = None
+    ) -> tuple[AggregationResult, _AggregationState]:
         """Compute aggregations from raw events.
 
         Args:
             window_days: Number of days to include.
+            state: Cached running totals to continue from. Ignored if any
+                event it covers has since fallen out of the window.
 
         Returns:
-            AggregationResult with computed statistics.
+            AggregationResult with computed statistics, and the running
+            totals it was built from.
         """
-        result = AggregationResult(
-            computed_at=datetime.now(timezone.utc).isoformat(),
-            window_days=window_days,
-        )
-
         # Calculate cutoff time
         cutoff = datetime.now(timezone.utc) - timedelta(days=window_days)
 
-        # Load and process events
-        events = self._load_events(cutoff)
-        result.event_count = len(events)
-
-        if not events:
-            return result
-
-        # Track intermediate data for calculations
-        file_sessions: dict[str, set[str]] = {}  # file_path -> set of session_ids
-        file_reads: dict[str, int] = {}  # file_path -> read count
-        file_edits: dict[str, int] = {}  # file_path -> edit count
-        file_edit_successes: dict[str, int] = {}  # file_path -> successful edit count
-        file_timestamps: dict[str, list[str]] = {}  # file_path -> list of timestamps
-
-        session_files: dict[str, set[str]] = {}  # session_id -> set of file_paths
-        session_issue: dict[str, str] = {}  # session_id -> issue_id
-        session_tools: dict[str, int] = {}  # session_id -> tool count
-        session_reads: dict[str, int] = {}  # session_id -> read count
-        session_edits: dict[str, int] = {}  # session_id -> edit count
-        session_edit_successes: dict[str, int] = {}  # session_id -> successful edits
-        session_timestamps: dict[str, list[str]] = {}  # session_id -> timestamps
-
-        tool_uses: dict[str, int] = {}  # tool -> total uses
-        tool_successes: dict[str, int] = {}  # tool -> successful uses
-
-        for event in events:
-            tool = event.get("tool", "")
-            session_id = event.get("session_id", "unknown")
-            timestamp = event.get("timestamp", "")
-            issue_id = event.get("issue_id")
-            tool_input = event.get("input", {})
-            tool_output = event.get("output", {})
-            error = event.get("error")
-
-            # Extract file path for file-based tools
-            file_path = tool_input.get("file_path")
-
-            # Determine success/failure
-            success = True
-            if error:
-                success = False
-            elif isinstance(tool_output, dict):
-                success = tool_output.get("success", True)
+        # Counts cannot be taken back out, so once an aggregated event has
+        # left the window everything is recomputed
+        if state is not None and state.oldest is not None and before_cutoff(
+            state.oldest, cutoff, cutoff_keys(cutoff)[0]
+        ):
+            state = None
+        if state is None:
+            state = _AggregationState()
 
-            # Track tool stats
-            tool_uses[tool] = tool_uses.get(tool, 0) + 1
-            if success:
-                tool_successes[tool] = tool_successes.get(tool, 0) + 1
-
-            # Track session stats
-            session_tools[session_id] = session_tools.get(session_id, 0) + 1
-            if issue_id and session_id not in session_issue:
-                session_issue[session_id] = issue_id
+        # A large file read from the start is split across processes;
+        # otherwise events are aggregated as they are read, without holding
+        # them all
+        if state.cursor or not self._aggregate_in_parallel(cutoff, state):
+            state.add_events(self._iter_events(cutoff, start=state.cursor))
 
-            if session_id not in session_timestamps:
-                session_timestamps[session_id] = []
-            session_timestamps[session_id].append(timestamp)
-
-            # Track file-specific stats
-            if file_path:
-                # File reads
-                if tool == "Read":
-                    file_reads[file_path] = file_reads.get(file_path, 0) + 1
-                    session_reads[session_id] = session_reads.get(session_id, 0) + 1
+        state.cursor, state.head, state.tail = self._read_position or (None, "", "")
 
-                # File edits
-                if tool in ("Edit", "Write"):
-                    file_edits[file_path] = file_edits.get(file_path, 0) + 1
-                    session_edits[session_id] = session_edits.get(session_id, 0) + 1
-                    if success:
-                        file_edit_successes[file_path] = (
-                            file_edit_successes.get(file_path, 0) + 1
-                        )
-                        session_edit_successes[session_id] = (
-                            session_edit_successes.get(session_id, 0) + 1
-                        )
+        return self._build_result(state, window_days), state
 
-                # Track file-session associations
-                if file_path not in file_sessions:
-                    file_sessions[file_path] = set()
-                file_sessions[file_path].add(session_id)
+    @staticmethod
+    def _build_result(state: _AggregationState, window_days: int) -> AggregationResult:
+        """Derive the per-file, per-session and per-tool stats from running totals.
 
-                if session_id not in session_files:
-                    session_files[session_id] = set()
-                session_files[session_id].add(file_path)
+        Args:
+            state: Running totals over the events in the window.
+            window_days: The time window the totals cover.
 
-                # Track timestamps per file
-                if file_path not in file_timestamps:
-                    file_timestamps[file_path] = []
-                file_timestamps[file_path].append(timestamp)
+        Returns:
+            AggregationResult with computed statistics.
+        """
+        result = AggregationResult(
+            computed_at=datetime.now(timezone.utc).isoformat(),
+            window_days=window_days,
+            event_count=state.event_count,
+        )
 
         # Build file stats
-        all_files = set(file_reads.keys()) | set(file_edits.keys())
-        for file_path in all_files:
-            reads = file_reads.get(file_path, 0)
-            edits = file_edits.get(file_path, 0)
-            edit_successes = file_edit_successes.get(file_path, 0)
-            sessions = file_sessions.get(file_path, set())
-            timestamps = sorted(file_timestamps.get(file_path, []))
-
-            unique_sessions = len(sessions)
+        for file_path, tally in state.files.items():
+            reads = tally.reads
+            edits = tally.edits
+            if not reads and not edits:
+                continue
+
+            unique_sessions = len(tally.sessions)
             avg_reads = reads / unique_sessions if unique_sessions > 0 else 0.0
-            success_rate = edit_successes / edits if edits > 0 else 1.0
+            success_rate = tally.edit_successes / edits if edits > 0 else 1.0
 
             result.file_stats[file_path] = FileStats(
                 file_path=file_path,
@@ -421,38 +1113,30 @@ class MetricsAggregator:
                 avg_reads_per_session=round(avg_reads, 2),
                 total_edits=edits,
                 edit_success_rate=round(success_rate, 3),
-                first_accessed=timestamps[0] if timestamps else None,
-                last_accessed=timestamps[-1] if timestamps else None,
+                first_accessed=tally.first,
+                last_accessed=tally.last,
             )
 
         # Build session stats
-        for session_id in session_tools:
-            tools = session_tools[session_id]
-            files = session_files.get(session_id, set())
-            reads = session_reads.get(session_id, 0)
-            edits = session_edits.get(session_id, 0)
-            edit_successes = session_edit_successes.get(session_id, 0)
-            timestamps = sorted(session_timestamps.get(session_id, []))
-            issue_id = session_issue.get(session_id)
-
-            success_rate = edit_successes / edits if edits > 0 else 1.0
+        for session_id, session in state.sessions.items():
+            edits = session.edits
+            success_rate = session.edit_successes / edits if edits > 0 else 1.0
 
             result.session_stats[session_id] = SessionStats(
                 session_id=session_id,
-                issue_id=issue_id,
-                total_tool_uses=tools,
-                unique_files_accessed=len(files),
-                read_count=reads,
+                issue_id=session.issue_id,
+                total_tool_uses=session.tools,
+                unique_files_accessed=len(session.files),
+                read_count=session.reads,
                 edit_count=edits,
                 edit_success_rate=round(success_rate, 3),
-                start_time=timestamps[0] if timestamps else None,
-                end_time=timestamps[-1] if timestamps else None,
+                start_time=session.first,
+                end_time=session.last,
             )
 
         # Build tool stats
-        for tool_name in tool_uses:
-            uses = tool_uses[tool_name]
-            successes = tool_successes.get(tool_name, 0)
+        for tool_name, uses in state.tool_uses.items():
+            successes = state.tool_successes.get(tool_name, 0)
             failures = uses - successes
             success_rate = successes / uses if uses > 0 else 1.0
 
@@ -466,101 +1150,182 @@ class MetricsAggregator:
 
         return result
 
-    def _load_events(self, cutoff: datetime) -> list[dict[str, Any]]:
-        """Load events from metrics.jsonl, filtering by cutoff time.
+    def _aggregate_in_parallel(self, cutoff: datetime, state: _AggregationState) -> bool:
+        """Aggregate a large metrics.jsonl from the start across processes.
+
+        Decoding is CPU-bound, so the file is split into line-aligned
+        ranges that worker processes aggregate independently; their totals
+        are then merged in file order. Sets ``_read_position`` like
+        _iter_events.
 
         Args:
             cutoff: Only include events after this time.
+            state: Empty running totals to merge the results into.
 
         Returns:
-            List of event dictionaries.
+            True if the events were aggregated, False if the file is too
+            small to be worth it or worker processes are unavailable, in
+            which case the caller should read it serially.
+        """
+        try:
+            size = self.metrics_path.stat().st_size
+        except OSError:
+            return False
+        workers = min(_usable_cpus(), size // PARALLEL_CHUNK_BYTES)
+        if workers < 2:
+            return False
+
+        try:
+            bounds = _split_lines(self.metrics_path, workers)
+            with ProcessPoolExecutor(max_workers=len(bounds) - 1) as pool:
+                parts = list(pool.map(
+                    _aggregate_range,
+                    repeat(self.metrics_path),
+                    bounds[:-1],
+                    bounds[1:],
+                    repeat(cutoff),
+                ))
+            with open(self.metrics_path, "rb") as f:
+                self._read_position = _resume_position(f, bounds[-1])
+        except (OSError, BrokenProcessPool):
+            return False
+
+        for part in parts:
+            state.merge(part)
+        return True
+
+    def _iter_events(
+        self, cutoff: datetime, start: int | None = 0
+    ) -> Iterator[tuple]:
+        """Iterate over events in metrics.jsonl, filtering by cutoff time.
+
+        Once exhausted, sets ``_read_position`` to ``(offset, head, tail)``
+        describing where reading stopped (see _AggregationState), or None
+        if the file could not be read to a line boundary.
+
+        Args:
+            cutoff: Only include events after this time.
+            start: Byte offset to start reading at.
+
+        Yields:
+            Event fields as returned by _event_fields, in file order.
         """
-        events = []
+        self._read_position = None
 
         if not self.metrics_path.exists():
-            return events
+            return
 
         try:
-            with open(self.metrics_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        event = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    # Filter by timestamp
-                    timestamp_str = event.get("timestamp", "")
-                    if timestamp_str:
-                        try:
-                            # Parse ISO format timestamp
-                            ts = datetime.fromisoformat(
-                                timestamp_str.replace("Z", "+00:00")
-                            )
-                            if ts < cutoff:
-                                continue
-                        except ValueError:
-                            # If we can't parse, include the event
-                            pass
-
-                    events.append(event)
+            with open(self.metrics_path, "rb") as f:
+                f.seek(start or 0)
+                yield from _decode_events(f, cutoff)
+                self._read_position = _resume_position(f, f.tell())
 
         except OSError:
             pass
 
-        return events
+    def _load_cache(
+        self, window_days: int, as_dict: bool = False
+    ) -> tuple[AggregationResult | dict[str, Any] | None, _AggregationState | None]:
+        """Load cached aggregations.
 
-    def _load_cache(self, window_days: int) -> AggregationResult | None:
-        """Load cached aggregations if fresh.
+        Reads the MessagePack cache when msgspec is installed and it exists,
+        and the JSON cache otherwise.
 
         Args:
             window_days: The requested time window.
+            as_dict: Return a fresh result as the decoded dictionary, in
+                to_dict() form, instead of building an AggregationResult.
 
         Returns:
-            AggregationResult if cache is valid, None otherwise.
+            ``(result, None)`` if the cache is fresh, ``(None, state)`` if
+            metrics.jsonl has only been appended to since and the cached
+            running totals can be resumed, and ``(None, None)`` otherwise.
         """
-        if not self.cache_path.exists():
-            return None
+        if _DECODER is not None and self.cache_bin_path.exists():
+            cache_path, decode = self.cache_bin_path, _DECODER.decode
+        elif self.cache_path.exists():
+            cache_path, decode = self.cache_path, loads
+        else:
+            return None, None
 
         if not self.metrics_path.exists():
-            return None
-
-        # Check if cache is stale (metrics file is newer)
-        cache_mtime = self.cache_path.stat().st_mtime
-        metrics_mtime = self.metrics_path.stat().st_mtime
-
-        if metrics_mtime > cache_mtime:
-            return None
+            return None, None
 
         try:
-            with open(self.cache_path) as f:
-                data = json.load(f)
+            with open(cache_path, "rb") as f:
+                data = decode(f.read())
 
             # Verify window matches
             if data.get("window_days") != window_days:
-                return None
+                return None, None
 
-            return AggregationResult.from_dict(data)
+            # Check if cache is stale (metrics file is newer)
+            cache_mtime = cache_path.stat().st_mtime
+            metrics_mtime = self.metrics_path.stat().st_mtime
 
-        except (json.JSONDecodeError, OSError, KeyError, TypeError):
+            if metrics_mtime <= cache_mtime:
+                if as_dict:
+                    data.pop("state", None)
+                    return data, None
+                return AggregationResult.from_dict(data), None
+
+            return None, self._resumable_state(data.get("state"))
+
+        except (ValueError, OSError, KeyError, TypeError, AttributeError):
+            return None, None
+
+    def _resumable_state(self, data: dict[str, Any] | None) -> _AggregationState | None:
+        """Rebuild cached running totals if metrics.jsonl was only appended to.
+
+        Args:
+            data: Serialized _AggregationState from the cache.
+
+        Returns:
+            The running totals, or None if they cannot be resumed.
+        """
+        if not data or data.get("cursor") is None:
             return None
 
-    def _save_cache(self, result: AggregationResult) -> bool:
+        state = _AggregationState.from_dict(data)
+        head = bytes.fromhex(state.head)
+        tail = bytes.fromhex(state.tail)
+
+        with open(self.metrics_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < state.cursor:
+                return None
+            if f.read(len(head)) != head:
+                return None
+            f.seek(state.cursor - len(tail))
+            if f.read(len(tail)) != tail:
+                return None
+
+        return state
+
+    def _save_cache(
+        self, result: AggregationResult, state: _AggregationState | None = None
+    ) -> bool:
         """Save aggregations to cache file.
 
         Args:
             result: The aggregation result to cache.
+            state: Running totals to cache for resuming, if resumable.
 
         Returns:
             True if saved successfully, False otherwise.
         """
+        if state is not None and state.cursor is None:
+            state = None
+
         try:
             self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_path, "w") as f:
-                f.write(result.to_json())
+            if _ENCODER is not None:
+                # msgspec encodes the dataclasses directly, skipping to_dict
+                payload = {name: getattr(result, name) for name in _RESULT_FIELDS}
+                payload["state"] = state
+                _replace_file(self.cache_bin_path, (_ENCODER.encode(payload),))
+            if _ENCODER is None or os.environ.get(JSON_CACHE_ENV) == "1":
+                _replace_file(self.cache_path, _iter_json_cache(result, state))
             return True
         except OSError:
             return False
@@ -588,3 +1353,27 @@ def compute(
         cache_path=cache_path,
     )
     return aggregator.compute(window_days=window_days, force=force)
+
+
+def compute_json(
+    window_days: int = MetricsAggregator.DEFAULT_WINDOW_DAYS,
+    force: bool = False,
+    metrics_path: Path | None = None,
+    cache_path: Path | None = None,
+) -> bytes:
+    """Convenience function to compute aggregations as JSON.
+
+    Args:
+        window_days: Number of days to include in the time window.
+        force: If True, recompute even if cache is fresh.
+        metrics_path: Optional path to metrics.jsonl.
+        cache_path: Optional path to cache file.
+
+    Returns:
+        UTF-8 encoded JSON of the AggregationResult.
+    """
+    aggregator = MetricsAggregator(
+        metrics_path=metrics_path,
+        cache_path=cache_path,
+    )
+    return aggregator.compute_json(window_days=window_days, force=force)
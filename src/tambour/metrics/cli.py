@@ -12,15 +12,66 @@ This module provides the command handlers for the metrics subcommands:
 
 from __future__ import annotations
 
-import json
+import functools
+import os
 import sys
+from contextlib import nullcontext
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from tambour._json import loads
+
+# Importing this module has already run tambour.metrics/__init__, which
+# loads the aggregator and collector, so there is nothing to defer
+from tambour.metrics.aggregator import (
+    AggregationResult,
+    MetricsAggregator,
+    before_cutoff,
+    compare_line_to_cutoff,
+    compute,
+    cutoff_keys,
+)
+from tambour.metrics.collector import MetricsCollector
+
 if TYPE_CHECKING:
     import argparse
 
+# Read buffer for streaming metrics.jsonl through 'metrics clear'. Line
+# iteration over a binary file already splits in C; reading the whole log
+# and splitting it was measured slower as well as holding it all in memory.
+_CLEAR_BUFFER_SIZE = 1024 * 1024
+
+
+def _resolve_args(args: argparse.Namespace) -> tuple[int, Path | None]:
+    """Read the --window and --storage options shared by the query commands."""
+    storage = getattr(args, "storage", None)
+    return getattr(args, "window", 7), Path(storage) if storage else None
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_compute(
+    window: int, metrics_path_str: str, fingerprint: tuple[int, int] | None
+) -> AggregationResult:
+    """Memoized compute; see _compute for the cache key."""
+    return compute(window_days=window, metrics_path=Path(metrics_path_str))
+
+
+def _compute(window: int, metrics_path: Path | None) -> AggregationResult:
+    """Compute aggregations, reusing results from earlier calls in this process.
+
+    Results are keyed on the window, the metrics path and the log's size
+    and mtime, so events appended by the collector are still picked up.
+    """
+    if metrics_path is None:
+        metrics_path = Path.cwd() / MetricsAggregator.DEFAULT_METRICS_PATH
+    try:
+        st = metrics_path.stat()
+        fingerprint: tuple[int, int] | None = (st.st_size, st.st_mtime_ns)
+    except OSError:
+        fingerprint = None
+    return _cached_compute(window, str(metrics_path), fingerprint)
+
 
 def format_number(n: int) -> str:
     """Format a number with thousands separators."""
@@ -32,14 +83,33 @@ def format_percent(rate: float) -> str:
     return f"{rate * 100:.1f}%"
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(iso: str) -> datetime | None:
+    """Parse an ISO timestamp, or return None if it is malformed."""
+    try:
+        # Python 3.11+ accepts a trailing "Z"
+        return datetime.fromisoformat(iso)
+    except (ValueError, TypeError):
+        return None
+
+
+def format_timestamp(iso: str) -> str:
+    """Format an ISO timestamp as 'YYYY-MM-DD HH:MM', or return it as-is."""
+    ts = _parse_iso(iso)
+    return ts.strftime("%Y-%m-%d %H:%M") if ts else iso
+
+
 def format_duration(start_iso: str | None, end_iso: str | None) -> str:
     """Format duration between two ISO timestamps."""
     if not start_iso or not end_iso:
         return "N/A"
 
+    start = _parse_iso(start_iso)
+    end = _parse_iso(end_iso)
+    if start is None or end is None:
+        return "N/A"
+
     try:
-        start = datetime.fromisoformat(start_iso.replace("Z", "+00:00"))
-        end = datetime.fromisoformat(end_iso.replace("Z", "+00:00"))
         delta = end - start
 
         total_seconds = int(delta.total_seconds())
@@ -58,14 +128,10 @@ def format_duration(start_iso: str | None, end_iso: str | None) -> str:
 
 def cmd_metrics_show(args: argparse.Namespace) -> int:
     """Handle 'metrics show' command - display summary."""
-    from tambour.metrics import compute
-
-    window = getattr(args, "window", 7)
-    storage = getattr(args, "storage", None)
-    metrics_path = Path(storage) if storage else None
+    window, metrics_path = _resolve_args(args)
 
     try:
-        agg = compute(window_days=window, metrics_path=metrics_path)
+        agg = _compute(window, metrics_path)
     except Exception as e:
         print(f"Error computing metrics: {e}", file=sys.stderr)
         return 1
@@ -84,10 +150,9 @@ def cmd_metrics_show(args: argparse.Namespace) -> int:
         # Find max tool name length for alignment
         max_name_len = max(len(t.tool) for t in tool_stats)
         for tool in tool_stats:
-            name = tool.tool.ljust(max_name_len)
-            count = format_number(tool.total_uses).rjust(6)
+            count = format_number(tool.total_uses)
             rate = format_percent(tool.success_rate)
-            print(f"  {name}  {count} ({rate} success)")
+            print(f"  {tool.tool:<{max_name_len}}  {count:>6} ({rate} success)")
     else:
         print("No tool usage data available.")
 
@@ -96,21 +161,20 @@ def cmd_metrics_show(args: argparse.Namespace) -> int:
 
 def cmd_metrics_hot_files(args: argparse.Namespace) -> int:
     """Handle 'metrics hot-files' command - list files by read count."""
-    from tambour.metrics import compute
-
-    window = getattr(args, "window", 7)
+    window, metrics_path = _resolve_args(args)
     threshold = getattr(args, "threshold", 5)
     limit = getattr(args, "limit", 20)
-    storage = getattr(args, "storage", None)
-    metrics_path = Path(storage) if storage else None
 
     try:
-        agg = compute(window_days=window, metrics_path=metrics_path)
+        agg = _compute(window, metrics_path)
     except Exception as e:
         print(f"Error computing metrics: {e}", file=sys.stderr)
         return 1
 
-    hot_files = agg.get_files_by_reads(min_reads=threshold)
+    # Only rank as many files as will be shown
+    hot_files = agg.get_files_by_reads(
+        min_reads=threshold, top_k=limit if limit > 0 else None
+    )
 
     if not hot_files:
         print(f"No files with ≥{threshold} reads in the last {window} days.")
@@ -118,48 +182,31 @@ def cmd_metrics_hot_files(args: argparse.Namespace) -> int:
 
     print(f"=== Hot Files (≥{threshold} reads in {window} days) ===")
 
-    # Apply limit
-    if limit > 0:
-        hot_files = hot_files[:limit]
-
     for file_stats in hot_files:
-        reads = str(file_stats.total_reads).rjust(4)
-        print(f"  {reads} reads  {file_stats.file_path}")
+        print(f"  {file_stats.total_reads:>4} reads  {file_stats.file_path}")
 
     return 0
 
 
 def cmd_metrics_file(args: argparse.Namespace) -> int:
     """Handle 'metrics file <path>' command - show file details."""
-    from tambour.metrics import compute
-
     file_path = args.path
-    window = getattr(args, "window", 7)
-    storage = getattr(args, "storage", None)
-    metrics_path = Path(storage) if storage else None
+    window, metrics_path = _resolve_args(args)
 
     try:
-        agg = compute(window_days=window, metrics_path=metrics_path)
+        agg = _compute(window, metrics_path)
     except Exception as e:
         print(f"Error computing metrics: {e}", file=sys.stderr)
         return 1
 
-    # Try to find the file - exact match or partial match
-    file_stats = agg.file_stats.get(file_path)
-
-    if not file_stats:
-        # Try partial match
-        matches = [
-            stats for path, stats in agg.file_stats.items()
-            if file_path in path or path.endswith(file_path)
-        ]
-        if len(matches) == 1:
-            file_stats = matches[0]
-        elif len(matches) > 1:
-            print(f"Multiple files match '{file_path}':", file=sys.stderr)
-            for m in matches[:10]:
-                print(f"  {m.file_path}", file=sys.stderr)
-            return 1
+    # Try to find the file - exact, suffix or partial match
+    matches = agg.find_files(file_path)
+    if len(matches) > 1:
+        print(f"Multiple files match '{file_path}':", file=sys.stderr)
+        for m in matches[:10]:
+            print(f"  {m.file_path}", file=sys.stderr)
+        return 1
+    file_stats = matches[0] if matches else None
 
     if not file_stats:
         print(f"No metrics found for: {file_path}", file=sys.stderr)
@@ -180,56 +227,33 @@ def cmd_metrics_file(args: argparse.Namespace) -> int:
         print(f"Edit success rate: {format_percent(file_stats.edit_success_rate)}")
 
     if file_stats.last_accessed:
-        # Format timestamp nicely
-        try:
-            ts = datetime.fromisoformat(file_stats.last_accessed.replace("Z", "+00:00"))
-            formatted = ts.strftime("%Y-%m-%d %H:%M")
-        except (ValueError, TypeError):
-            formatted = file_stats.last_accessed
-        print(f"Last accessed: {formatted}")
+        print(f"Last accessed: {format_timestamp(file_stats.last_accessed)}")
 
     if file_stats.first_accessed:
-        try:
-            ts = datetime.fromisoformat(file_stats.first_accessed.replace("Z", "+00:00"))
-            formatted = ts.strftime("%Y-%m-%d %H:%M")
-        except (ValueError, TypeError):
-            formatted = file_stats.first_accessed
-        print(f"First accessed: {formatted}")
+        print(f"First accessed: {format_timestamp(file_stats.first_accessed)}")
 
     return 0
 
 
 def cmd_metrics_session(args: argparse.Namespace) -> int:
     """Handle 'metrics session <session-id>' command - show session details."""
-    from tambour.metrics import compute
-
     session_id = args.session_id
-    window = getattr(args, "window", 7)
-    storage = getattr(args, "storage", None)
-    metrics_path = Path(storage) if storage else None
+    window, metrics_path = _resolve_args(args)
 
     try:
-        agg = compute(window_days=window, metrics_path=metrics_path)
+        agg = _compute(window, metrics_path)
     except Exception as e:
         print(f"Error computing metrics: {e}", file=sys.stderr)
         return 1
 
     # Try to find the session - exact match or prefix match
-    session_stats = agg.get_session_stats(session_id)
-
-    if not session_stats:
-        # Try prefix match
-        matches = [
-            stats for sid, stats in agg.session_stats.items()
-            if sid.startswith(session_id)
-        ]
-        if len(matches) == 1:
-            session_stats = matches[0]
-        elif len(matches) > 1:
-            print(f"Multiple sessions match '{session_id}':", file=sys.stderr)
-            for m in matches[:10]:
-                print(f"  {m.session_id}", file=sys.stderr)
-            return 1
+    matches = agg.find_sessions(session_id)
+    if len(matches) > 1:
+        print(f"Multiple sessions match '{session_id}':", file=sys.stderr)
+        for m in matches[:10]:
+            print(f"  {m.session_id}", file=sys.stderr)
+        return 1
+    session_stats = matches[0] if matches else None
 
     if not session_stats:
         print(f"No session found: {session_id}", file=sys.stderr)
@@ -257,23 +281,26 @@ def cmd_metrics_session(args: argparse.Namespace) -> int:
 
 def cmd_metrics_complexity(args: argparse.Namespace) -> int:
     """Handle 'metrics complexity' command - show complexity warnings."""
-    from tambour.metrics import compute
-
-    window = getattr(args, "window", 7)
+    window, metrics_path = _resolve_args(args)
     reread_threshold = getattr(args, "threshold", 3.0)
-    storage = getattr(args, "storage", None)
-    metrics_path = Path(storage) if storage else None
 
     try:
-        agg = compute(window_days=window, metrics_path=metrics_path)
+        agg = _compute(window, metrics_path)
     except Exception as e:
         print(f"Error computing metrics: {e}", file=sys.stderr)
         return 1
 
-    # Find files with complexity signals
+    # Find files with complexity signals. Most files have none, so select
+    # candidates in one tight pass and only build messages for those.
+    candidates = [
+        (file_path, stats)
+        for file_path, stats in agg.file_stats.items()
+        if stats.avg_reads_per_session >= reread_threshold
+        or (stats.edit_success_rate < 0.9 and stats.total_edits > 0)
+    ]
     complex_files = []
 
-    for file_path, stats in agg.file_stats.items():
+    for file_path, stats in candidates:
         signals = []
         recommendations = []
 
@@ -313,8 +340,6 @@ def cmd_metrics_complexity(args: argparse.Namespace) -> int:
 
 def cmd_metrics_clear(args: argparse.Namespace) -> int:
     """Handle 'metrics clear' command - remove old events."""
-    from tambour.metrics.collector import MetricsCollector
-
     older_than = getattr(args, "older_than", 30)
     dry_run = getattr(args, "dry_run", False)
     storage = getattr(args, "storage", None)
@@ -330,82 +355,95 @@ def cmd_metrics_clear(args: argparse.Namespace) -> int:
 
     # Calculate cutoff
     cutoff = datetime.now(timezone.utc) - timedelta(days=older_than)
-    cutoff_str = cutoff.isoformat()
+    # UTC timestamps are compared as strings rather than parsed
+    cutoff_second, cutoff_line = cutoff_keys(cutoff)
 
-    # Read and filter events
-    kept_events = []
+    # Stream kept lines into a sibling file that replaces metrics.jsonl at
+    # the end, so memory stays flat and a failure leaves the log intact
+    tmp_path = metrics_path.with_suffix(f".{os.getpid()}.tmp")
+    kept_count = 0
     removed_count = 0
 
     try:
-        with open(metrics_path) as f:
+        with open(metrics_path, "rb", buffering=_CLEAR_BUFFER_SIZE) as f, \
+                (nullcontext() if dry_run else open(tmp_path, "wb")) as out:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
 
-                try:
-                    event = json.loads(line)
-                except json.JSONDecodeError:
-                    # Keep malformed lines (or drop them?)
-                    kept_events.append(line)
+                # Lines written by the collector can be judged undecoded;
+                # only the rest (and those from the cutoff's second) are parsed
+                order = compare_line_to_cutoff(line, cutoff_line)
+                if order < 0:
+                    removed_count += 1
                     continue
 
-                timestamp_str = event.get("timestamp", "")
-                if timestamp_str:
+                if order == 0:
                     try:
-                        ts = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                        if ts < cutoff:
-                            removed_count += 1
-                            continue
+                        event = loads(line)
                     except ValueError:
-                        pass
+                        # Keep malformed lines (or drop them?)
+                        event = {}
+
+                    timestamp_str = event.get("timestamp", "")
+                    if timestamp_str and before_cutoff(timestamp_str, cutoff, cutoff_second):
+                        removed_count += 1
+                        continue
 
-                kept_events.append(line)
+                kept_count += 1
+                if out is not None:
+                    out.write(line + b"\n")
     except OSError as e:
+        tmp_path.unlink(missing_ok=True)
         print(f"Error reading metrics file: {e}", file=sys.stderr)
         return 1
 
     if dry_run:
         print(f"Would remove {removed_count} events older than {older_than} days")
-        print(f"Would keep {len(kept_events)} events")
+        print(f"Would keep {kept_count} events")
         return 0
 
     if removed_count == 0:
+        tmp_path.unlink(missing_ok=True)
         print(f"No events older than {older_than} days to remove")
         return 0
 
     # Write back filtered events
     try:
-        with open(metrics_path, "w") as f:
-            for line in kept_events:
-                f.write(line + "\n")
+        os.replace(tmp_path, metrics_path)
 
         print(f"Removed {removed_count} events older than {older_than} days")
-        print(f"Kept {len(kept_events)} events")
+        print(f"Kept {kept_count} events")
 
         # Invalidate cache by removing it
-        cache_path = metrics_path.parent / "metrics-agg.json"
-        if cache_path.exists():
-            cache_path.unlink()
+        cache_paths = [
+            metrics_path.parent / "metrics-agg.json",
+            metrics_path.parent / "metrics-agg.msgpack",
+        ]
+        cleared = False
+        for cache_path in cache_paths:
+            if cache_path.exists():
+                cache_path.unlink()
+                cleared = True
+        _cached_compute.cache_clear()
+        if cleared:
             print("Cleared aggregation cache")
 
         return 0
     except OSError as e:
+        tmp_path.unlink(missing_ok=True)
         print(f"Error writing metrics file: {e}", file=sys.stderr)
         return 1
 
 
 def cmd_metrics_refresh(args: argparse.Namespace) -> int:
     """Handle 'metrics refresh' command - force refresh aggregations."""
-    from tambour.metrics import compute
-
-    window = getattr(args, "window", 7)
-    force = getattr(args, "force", False) or True  # Always force for refresh command
-    storage = getattr(args, "storage", None)
-    metrics_path = Path(storage) if storage else None
+    window, metrics_path = _resolve_args(args)
 
     try:
-        agg = compute(window_days=window, force=force, metrics_path=metrics_path)
+        agg = compute(window_days=window, force=True, metrics_path=metrics_path)
+        _cached_compute.cache_clear()
         print(f"Refreshed aggregations for {window}-day window")
         print(f"  Events: {format_number(agg.event_count)}")
         print(f"  Files: {len(agg.file_stats)}")
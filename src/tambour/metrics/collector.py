@@ -19,15 +19,44 @@ from __future__ import annotations
 import json
 import os
 import sys
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from tambour.metrics.extractors import extract_tool_fields
 
+# Flags for appending one event to metrics.jsonl without a buffered file object
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
 
-@dataclass
+# Tool input fields that may be passed directly as environment variables
+_TOOL_INPUT_ENV_MAP = (
+    # Common fields
+    ("TAMBOUR_FILE_PATH", "file_path"),
+    # Bash-specific
+    ("TAMBOUR_COMMAND", "command"),
+    ("TAMBOUR_DESCRIPTION", "description"),
+    # Search tools
+    ("TAMBOUR_PATTERN", "pattern"),
+    ("TAMBOUR_PATH", "path"),
+)
+
+
+def _safe_loads(value: str | None) -> Any:
+    """Decode a JSON environment value, treating unset, "{}" and invalid as {}.
+
+    The unset and "{}" cases are the common ones on the hook path and
+    skip the decoder entirely.
+    """
+    if not value or value == "{}":
+        return {}
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return {}
+
+
+@dataclass(slots=True)
 class MetricEvent:
     """A metric event to be stored in JSONL.
 
@@ -52,11 +81,34 @@ class MetricEvent:
     error: str | None = None
 
     def to_json(self) -> str:
-        """Convert to JSON string for JSONL storage."""
-        data = asdict(self)
-        # Remove None values for cleaner output
-        data = {k: v for k, v in data.items() if v is not None}
-        return json.dumps(data, separators=(",", ":"))
+        """Convert to JSON string for JSONL storage.
+
+        The record is assembled field by field in declaration order rather
+        than through ``asdict``, which deep-copies ``input`` and ``output``
+        on every event. ``timestamp`` stays the first key so readers can
+        compare it without decoding the line. None values are omitted.
+        """
+        dumps = json.dumps
+        parts = [
+            '{"timestamp":',
+            dumps(self.timestamp),
+            ',"session_id":',
+            dumps(self.session_id),
+            ',"tool":',
+            dumps(self.tool),
+            ',"input":',
+            dumps(self.input, separators=(",", ":")),
+        ]
+        if self.output is not None:
+            parts += (',"output":', dumps(self.output, separators=(",", ":")))
+        if self.issue_id is not None:
+            parts += (',"issue_id":', dumps(self.issue_id))
+        if self.worktree is not None:
+            parts += (',"worktree":', dumps(self.worktree))
+        if self.error is not None:
+            parts += (',"error":', dumps(self.error))
+        parts.append("}")
+        return "".join(parts)
 
 
 class MetricsCollector:
@@ -108,11 +160,7 @@ class MetricsCollector:
 
         # Get any additional tool-specific data from environment
         # The bridge script may have stored tool_input as JSON in TAMBOUR_TOOL_INPUT
-        tool_input_str = os.environ.get("TAMBOUR_TOOL_INPUT", "{}")
-        try:
-            tool_input = json.loads(tool_input_str)
-        except json.JSONDecodeError:
-            tool_input = {}
+        tool_input = _safe_loads(os.environ.get("TAMBOUR_TOOL_INPUT"))
 
         # Fallback: check for specific fields passed directly as env vars
         # (e.g., TAMBOUR_FILE_PATH, TAMBOUR_COMMAND)
@@ -123,11 +171,7 @@ class MetricsCollector:
         extracted_input = extract_tool_fields(tool_name, tool_input)
 
         # Get tool response/output if available
-        tool_output_str = os.environ.get("TAMBOUR_TOOL_OUTPUT", "{}")
-        try:
-            tool_output = json.loads(tool_output_str)
-        except json.JSONDecodeError:
-            tool_output = {}
+        tool_output = _safe_loads(os.environ.get("TAMBOUR_TOOL_OUTPUT"))
 
         # If no structured output, check for success indicator
         if not tool_output:
@@ -155,32 +199,8 @@ class MetricsCollector:
         Returns:
             Dict with tool input fields.
         """
-        result: dict[str, Any] = {}
-
-        # Common fields
-        file_path = os.environ.get("TAMBOUR_FILE_PATH")
-        if file_path:
-            result["file_path"] = file_path
-
-        # Bash-specific
-        command = os.environ.get("TAMBOUR_COMMAND")
-        if command:
-            result["command"] = command
-
-        description = os.environ.get("TAMBOUR_DESCRIPTION")
-        if description:
-            result["description"] = description
-
-        # Search tools
-        pattern = os.environ.get("TAMBOUR_PATTERN")
-        if pattern:
-            result["pattern"] = pattern
-
-        path = os.environ.get("TAMBOUR_PATH")
-        if path:
-            result["path"] = path
-
-        return result
+        env = os.environ
+        return {key: value for name, key in _TOOL_INPUT_ENV_MAP if (value := env.get(name))}
 
     def collect_from_stdin(self) -> MetricEvent | None:
         """Collect a metric event from JSON on stdin.
@@ -266,12 +286,19 @@ class MetricsCollector:
             True if storage succeeded, False otherwise.
         """
         try:
-            # Create directory if it doesn't exist
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Append to JSONL file
-            with open(self.storage_path, "a") as f:
-                f.write(event.to_json() + "\n")
+            line = (event.to_json() + "\n").encode()
+            try:
+                fd = os.open(self.storage_path, _APPEND_FLAGS, 0o666)
+            except FileNotFoundError:
+                # Create directory if it doesn't exist
+                self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(self.storage_path, _APPEND_FLAGS, 0o666)
+
+            # A single O_APPEND write keeps concurrent hooks' lines whole
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
 
             return True
         except Exception as e:
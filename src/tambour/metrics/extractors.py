@@ -100,10 +100,13 @@ def extract_bash_fields(tool_input: dict[str, Any]) -> dict[str, Any]:
         Dict with command_prefix (first token) and description.
     """
     command = tool_input.get("command", "")
-    # Extract first token as command prefix
+    # Extract first token as command prefix; a single bounded split stops
+    # after it instead of stripping and tokenizing the whole command
     command_prefix = None
-    if isinstance(command, str) and command.strip():
-        command_prefix = command.strip().split()[0]
+    if isinstance(command, str):
+        parts = command.split(None, 1)
+        if parts:
+            command_prefix = parts[0]
 
     return {
         "command_prefix": command_prefix,
@@ -190,19 +193,30 @@ def extract_tool_fields(tool_name: str, tool_input: dict[str, Any]) -> dict[str,
 def _limit_dict_size(d: dict[str, Any], max_str_len: int = 200) -> dict[str, Any]:
     """Limit string values in a dict to prevent huge metrics entries.
 
+    Most inputs need no truncation, so d (or a nested dict) is only
+    copied once a value in it actually changes.
+
     Args:
         d: The dict to limit.
         max_str_len: Maximum length for string values.
 
     Returns:
-        Dict with string values truncated.
+        Dict with string values truncated; d itself if nothing was.
     """
-    result = {}
+    result = None
     for key, value in d.items():
-        if isinstance(value, str) and len(value) > max_str_len:
-            result[key] = value[:max_str_len] + "..."
+        if isinstance(value, str):
+            if len(value) <= max_str_len:
+                continue
+            value = value[:max_str_len] + "..."
         elif isinstance(value, dict):
-            result[key] = _limit_dict_size(value, max_str_len)
+            limited = _limit_dict_size(value, max_str_len)
+            if limited is value:
+                continue
+            value = limited
         else:
-            result[key] = value
-    return result
+            continue
+        if result is None:
+            result = dict(d)
+        result[key] = value
+    return d if result is None else result
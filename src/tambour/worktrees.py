@@ -6,12 +6,27 @@ issue association, health).
 
 from __future__ import annotations
 
-import json
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
 
+from tambour._json import loads
+from tambour.heartbeat import parse_heartbeat_timestamp, read_heartbeat_bytes
+
+# Porcelain "<label> <value>" lines kept per entry, and the key stored for each
+_PORCELAIN_FIELDS = {"worktree": "path", "HEAD": "head", "branch": "branch"}
+# Bare porcelain lines kept per entry as flags
+_PORCELAIN_FLAGS = frozenset(("bare", "detached"))
+
+# Below this many worktrees, starting threads costs more than the
+# heartbeat reads they would overlap
+PARALLEL_HEARTBEAT_MIN = 8
+# Bounded so a large listing on a network filesystem is not a stat storm
+_MAX_HEARTBEAT_WORKERS = 8
+
 
 @dataclass
 class WorktreeInfo:
@@ -69,39 +84,53 @@ def _parse_porcelain(output: str) -> list[WorktreeInfo]:
     Returns:
         List of WorktreeInfo objects.
     """
-    worktrees: list[WorktreeInfo] = []
+    entries: list[dict[str, str]] = []
     current: dict[str, str] = {}
 
     for line in output.splitlines():
         if not line:
             # Empty line separates worktree entries
             if current:
-                worktrees.append(_build_worktree_info(current))
+                entries.append(current)
                 current = {}
             continue
 
-        if line.startswith("worktree "):
-            current["path"] = line[len("worktree "):]
-        elif line.startswith("HEAD "):
-            current["head"] = line[len("HEAD "):]
-        elif line.startswith("branch "):
-            current["branch"] = line[len("branch "):]
-        elif line == "bare":
-            current["bare"] = "true"
-        elif line == "detached":
-            current["detached"] = "true"
+        label, sep, value = line.partition(" ")
+        if sep:
+            field = _PORCELAIN_FIELDS.get(label)
+            if field:
+                current[field] = value
+        elif line in _PORCELAIN_FLAGS:
+            current[line] = "true"
 
     # Handle last entry (no trailing blank line)
     if current:
-        worktrees.append(_build_worktree_info(current))
-
-    return worktrees
-
-
-def _build_worktree_info(data: dict[str, str]) -> WorktreeInfo:
-    """Build a WorktreeInfo from parsed porcelain data."""
-    path = Path(data.get("path", ""))
-    heartbeat_age, heartbeat_pid = _read_heartbeat(path)
+        entries.append(current)
+
+    paths = [Path(data.get("path", "")) for data in entries]
+    # Heartbeat ages are all measured against the same moment
+    now = time.time()
+    if len(paths) >= PARALLEL_HEARTBEAT_MIN:
+        # Each read is an independent open/read on a different worktree
+        workers = min(_MAX_HEARTBEAT_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            heartbeats = list(pool.map(_read_heartbeat, paths, repeat(now)))
+    else:
+        heartbeats = [_read_heartbeat(path, now) for path in paths]
+
+    return [
+        _build_worktree_info(data, path, heartbeat)
+        for data, path, heartbeat in zip(entries, paths, heartbeats)
+    ]
+
+
+def _build_worktree_info(
+    data: dict[str, str],
+    path: Path,
+    heartbeat: tuple[float | None, int | None],
+) -> WorktreeInfo:
+    """Build a WorktreeInfo from parsed porcelain data and its heartbeat."""
+    heartbeat_age, heartbeat_pid = heartbeat
 
     return WorktreeInfo(
         path=path,
@@ -113,33 +142,36 @@ def _build_worktree_info(data: dict[str, str]) -> WorktreeInfo:
     )
 
 
-def _read_heartbeat(worktree_path: Path) -> tuple[float | None, int | None]:
+def _read_heartbeat(
+    worktree_path: Path, now: float | None = None
+) -> tuple[float | None, int | None]:
     """Read heartbeat file from a worktree.
 
     Args:
         worktree_path: Path to the worktree.
+        now: Epoch time to measure the age against. Defaults to the current time.
 
     Returns:
         Tuple of (age_in_seconds, pid) or (None, None) if no heartbeat.
     """
-    heartbeat_file = worktree_path / ".tambour" / "heartbeat"
-    if not heartbeat_file.exists():
+    raw = read_heartbeat_bytes(worktree_path / ".tambour" / "heartbeat")
+    if raw is None:
         return None, None
 
     try:
-        data = json.loads(heartbeat_file.read_text())
+        data = loads(raw)
         timestamp_str = data.get("timestamp")
         pid = data.get("pid")
 
         age = None
         if timestamp_str:
-            last_activity = datetime.fromisoformat(
-                timestamp_str.replace("Z", "+00:00")
-            )
-            age = (datetime.now(timezone.utc) - last_activity).total_seconds()
+            last_activity = parse_heartbeat_timestamp(timestamp_str)
+            if now is None:
+                now = time.time()
+            age = now - last_activity.timestamp()
 
         return age, int(pid) if pid is not None else None
-    except (json.JSONDecodeError, ValueError, OSError):
+    except (ValueError, TypeError, AttributeError):
         return None, None
 
 
@@ -3,20 +3,29 @@
 from __future__ import annotations
 
 import json
+import os
 import time
+from dataclasses import asdict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from tambour.metrics import aggregator as aggregator_module
 from tambour.metrics.aggregator import (
     AggregationResult,
     FileStats,
     MetricsAggregator,
     SessionStats,
     ToolStats,
+    before_cutoff,
+    compare_line_to_cutoff,
     compute,
+    compute_json,
+    cutoff_keys,
 )
+from tambour.metrics.collector import MetricEvent
 
 
 def make_event(
@@ -53,6 +62,80 @@ def make_event(
     return event
 
 
+class TestBeforeCutoff:
+    """Tests for the timestamp cutoff filter."""
+
+    CUTOFF = datetime(2026, 1, 10, 12, 0, 0, 500000, tzinfo=timezone.utc)
+    CUTOFF_SECOND = "2026-01-10T12:00:00"
+
+    @pytest.mark.parametrize("timestamp,expected", [
+        ("2026-01-10T11:59:59.999999+00:00", True),
+        ("2026-01-10T12:00:01+00:00", False),
+        ("2026-01-09T23:00:00Z", True),
+        ("2026-01-11T00:00:00Z", False),
+        # Same second as the cutoff is decided by the sub-second part
+        ("2026-01-10T12:00:00Z", True),
+        ("2026-01-10T12:00:00.700000+00:00", False),
+        # Other offsets are parsed
+        ("2026-01-10T13:30:00+02:00", True),
+        ("2026-01-10T07:30:00-05:00", False),
+    ])
+    def test_matches_datetime_comparison(self, timestamp, expected):
+        """Test that the result matches comparing parsed datetimes."""
+        assert before_cutoff(timestamp, self.CUTOFF, self.CUTOFF_SECOND) is expected
+        assert (datetime.fromisoformat(timestamp) < self.CUTOFF) is expected
+
+    @pytest.mark.parametrize("timestamp", ["not-a-date", "2026-01-01T00:00:00"])
+    def test_unparseable_or_naive_is_kept(self, timestamp):
+        """Test that timestamps that cannot be compared are not filtered out."""
+        assert before_cutoff(timestamp, self.CUTOFF, self.CUTOFF_SECOND) is False
+
+    @pytest.mark.parametrize("timestamp,expected", [
+        ("2026-01-10T11:59:59.999999+00:00", -1),
+        ("2026-01-10T12:00:01Z", 1),
+        # Same second, other offsets and naive times are left undecided
+        ("2026-01-10T12:00:00Z", 0),
+        ("2026-01-10T12:00:00.700000+00:00", 0),
+        ("2026-01-10T20:00:00+02:00", 0),
+        ("2026-01-11T00:00:00", 0),
+    ])
+    def test_raw_line_compare(self, timestamp, expected):
+        """Test the undecoded line comparison against collector-written lines."""
+        line = MetricEvent(timestamp=timestamp, session_id="s", tool="Read", input={}).to_json().encode()
+        _, cutoff_line = cutoff_keys(self.CUTOFF)
+        assert compare_line_to_cutoff(line, cutoff_line) == expected
+        assert compare_line_to_cutoff(b'{"tool":"Read","timestamp":"2027-01-01T00:00:00Z"}', cutoff_line) == 0
+
+
+class TestEventFields:
+    """Tests for decoding the fields aggregation reads from a line."""
+
+    @pytest.mark.parametrize("line,expected", [
+        (
+            b'{"timestamp":"t","session_id":"s","tool":"Edit","issue_id":"bd-1",'
+            b'"input":{"file_path":"/a.py","old_string_len":3},"output":{"success":false},'
+            b'"worktree":"/wt"}',
+            ("Edit", "s", "t", "bd-1", "/a.py", False),
+        ),
+        (b'{"tool":"Bash","error":"boom","output":{"success":true}}', ("Bash", "unknown", "", None, None, False)),
+        (b'{"tool":"Bash","output":"text"}', ("Bash", "unknown", "", None, None, True)),
+        (b'{"tool":"Read","input":"/a.py"}', ("Read", "unknown", "", None, None, True)),
+        (b'{"tool":"Read","input":null,"timestamp":null}', ("Read", "unknown", None, None, None, True)),
+        (b'{}', ("", "unknown", "", None, None, True)),
+        (b"{not json", None),
+        (b"", None),
+    ])
+    @pytest.mark.parametrize("typed", [True, False])
+    def test_typed_and_generic_agree(self, line, expected, typed, monkeypatch):
+        """Test that the msgspec and generic decoders give the same fields."""
+        if typed:
+            pytest.importorskip("msgspec")
+        else:
+            monkeypatch.setattr(aggregator_module, "_EVENT_DECODER", None)
+
+        assert aggregator_module._event_fields(line) == expected
+
+
 class TestFileStats:
     """Tests for FileStats dataclass."""
 
@@ -93,6 +176,21 @@ class TestFileStats:
         assert d["total_reads"] == 5
         assert "first_accessed" not in d or d["first_accessed"] is None
 
+    def test_to_dict_matches_fields(self):
+        """Test that to_dict carries every set field and drops None ones."""
+        stats = FileStats(file_path="/a.py", total_reads=2, first_accessed="2026-01-01T00:00:00Z")
+
+        assert stats.to_dict() == {
+            "file_path": "/a.py",
+            "total_reads": 2,
+            "unique_sessions": 0,
+            "avg_reads_per_session": 0.0,
+            "total_edits": 0,
+            "edit_success_rate": 1.0,
+            "first_accessed": "2026-01-01T00:00:00Z",
+        }
+        assert FileStats(**stats.to_dict()) == stats
+
 
 class TestSessionStats:
     """Tests for SessionStats dataclass."""
@@ -120,6 +218,24 @@ class TestSessionStats:
         assert stats.issue_id == "bobbin-xyz"
         assert stats.total_tool_uses == 100
 
+    @pytest.mark.parametrize("stats", [
+        SessionStats(session_id="s1"),
+        SessionStats(
+            session_id="s1",
+            issue_id="bd-1",
+            total_tool_uses=3,
+            start_time="2026-01-05T08:00:00Z",
+            end_time="2026-01-05T10:00:00Z",
+        ),
+        FileStats(file_path="/a.py", last_accessed="2026-01-05T10:00:00Z"),
+        ToolStats(tool="Read", total_uses=3, success_count=2, failure_count=1),
+    ])
+    def test_to_dict_covers_every_field(self, stats):
+        """Test that the handwritten to_dict matches asdict minus None values."""
+        expected = {k: v for k, v in asdict(stats).items() if v is not None}
+        assert stats.to_dict() == expected
+        assert type(stats)(**stats.to_dict()) == stats
+
 
 class TestToolStats:
     """Tests for ToolStats dataclass."""
@@ -232,6 +348,42 @@ class TestAggregationResult:
         stats = result.get_session_stats("nonexistent")
         assert stats is None
 
+    def test_find_files(self):
+        """Test exact, path-suffix and substring file lookups."""
+        result = AggregationResult(
+            computed_at="2026-01-05T12:00:00Z",
+            window_days=7,
+        )
+        for path in ("/src/a/cli.py", "/src/b/cli.py", "/src/b/mycli.py", "/docs/readme.md"):
+            result.file_stats[path] = FileStats(file_path=path)
+
+        def paths(query):
+            return [f.file_path for f in result.find_files(query)]
+
+        assert paths("/src/b/mycli.py") == ["/src/b/mycli.py"]
+        assert paths("b/cli.py") == ["/src/b/cli.py"]
+        assert paths("cli.py") == ["/src/a/cli.py", "/src/b/cli.py"]
+        assert paths("readme") == ["/docs/readme.md"]
+        assert paths("src/b") == ["/src/b/cli.py", "/src/b/mycli.py"]
+        assert paths("nothing") == []
+
+    def test_find_sessions(self):
+        """Test exact and prefix session lookups."""
+        result = AggregationResult(
+            computed_at="2026-01-05T12:00:00Z",
+            window_days=7,
+        )
+        for sid in ("sess_b2", "sess_a", "sess_b1", "other", "sess_a1"):
+            result.session_stats[sid] = SessionStats(session_id=sid)
+
+        def ids(prefix):
+            return [s.session_id for s in result.find_sessions(prefix)]
+
+        assert ids("sess_a") == ["sess_a"]
+        assert ids("sess_b") == ["sess_b1", "sess_b2"]
+        assert ids("sess_") == ["sess_a", "sess_a1", "sess_b1", "sess_b2"]
+        assert ids("zzz") == []
+
     def test_get_all_sessions(self):
         """Test getting all sessions sorted by tool usage."""
         result = AggregationResult(
@@ -254,6 +406,29 @@ class TestAggregationResult:
         assert sessions[1].session_id == "sess_1"
         assert sessions[2].session_id == "sess_3"
 
+    def test_top_k_matches_full_sort(self):
+        """Test that top_k returns the head of the full ordering, ties included."""
+        result = AggregationResult(
+            computed_at="2026-01-05T12:00:00Z",
+            window_days=7,
+        )
+        for i, reads in enumerate([3, 9, 3, 7, 9, 1, 3]):
+            path = f"file{i}.py"
+            result.file_stats[path] = FileStats(
+                file_path=path, total_reads=reads, avg_reads_per_session=reads / 2
+            )
+            result.tool_stats[path] = ToolStats(tool=path, total_uses=reads)
+            result.session_stats[path] = SessionStats(session_id=path, total_tool_uses=reads)
+
+        for top_k in (0, 1, 3, 4, 10):
+            assert result.get_files_by_reads(2, top_k=top_k) == result.get_files_by_reads(2)[:top_k]
+            assert (
+                result.get_files_with_high_reread_rate(1.0, top_k=top_k)
+                == result.get_files_with_high_reread_rate(1.0)[:top_k]
+            )
+            assert result.get_tool_stats(top_k=top_k) == result.get_tool_stats()[:top_k]
+            assert result.get_all_sessions(top_k=top_k) == result.get_all_sessions()[:top_k]
+
     def test_to_dict_and_from_dict_roundtrip(self):
         """Test serialization/deserialization roundtrip."""
         original = AggregationResult(
@@ -293,6 +468,27 @@ class TestAggregationResult:
         assert len(restored.tool_stats) == 1
         assert restored.tool_stats["Read"].success_rate == 0.98
 
+    def test_from_dict_ignores_unknown_fields(self):
+        """Test that a cache with extra per-stat fields still loads."""
+        data = {
+            "computed_at": "2026-01-05T12:00:00Z",
+            "window_days": 7,
+            "file_stats": {"/a.py": {"file_path": "/a.py", "total_reads": 4, "new_field": 1}},
+            "session_stats": {"s1": {"session_id": "s1", "new_field": [1]}},
+            "tool_stats": {"Read": {"tool": "Read", "total_uses": 4, "new_field": None}},
+        }
+
+        result = AggregationResult.from_dict(data)
+
+        assert result.file_stats["/a.py"] == FileStats(file_path="/a.py", total_reads=4)
+        assert result.session_stats["s1"] == SessionStats(session_id="s1")
+        assert result.tool_stats["Read"] == ToolStats(tool="Read", total_uses=4)
+
+    def test_stats_have_no_instance_dict(self):
+        """Test that the per-file, session and tool records are slotted."""
+        for stats in (FileStats(file_path="/a.py"), SessionStats(session_id="s"), ToolStats(tool="Read")):
+            assert not hasattr(stats, "__dict__")
+
     def test_to_json(self):
         """Test JSON serialization."""
         result = AggregationResult(
@@ -501,7 +697,8 @@ class TestMetricsAggregator:
         )
 
         # First compute should create cache
-        result1 = aggregator.compute(window_days=7)
+        with patch.object(aggregator_module, "_ENCODER", None):
+            result1 = aggregator.compute(window_days=7)
         assert cache_path.exists()
 
         # Cache should contain valid data
@@ -510,6 +707,94 @@ class TestMetricsAggregator:
         assert cached["window_days"] == 7
         assert cached["event_count"] == 1
 
+    def test_caching_saves_msgpack(self, tmp_path, monkeypatch):
+        """Test that the binary cache replaces the JSON one when msgspec is installed."""
+        msgspec = pytest.importorskip("msgspec")
+        monkeypatch.delenv(aggregator_module.JSON_CACHE_ENV, raising=False)
+        metrics_path = tmp_path / "metrics.jsonl"
+        metrics_path.write_text(json.dumps(make_event("Read", file_path="/path/file.py")) + "\n")
+
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+        result = aggregator.compute(window_days=7)
+
+        assert aggregator.cache_bin_path == tmp_path / "cache.msgpack"
+        assert not aggregator.cache_path.exists()
+        cached = msgspec.msgpack.decode(aggregator.cache_bin_path.read_bytes())
+        assert AggregationResult.from_dict(cached) == result
+
+        # A cache hit comes from the binary file
+        with patch.object(aggregator, "_compute_aggregations") as mock_compute:
+            assert aggregator.compute(window_days=7).to_dict() == result.to_dict()
+        mock_compute.assert_not_called()
+
+    def test_caching_json_on_request(self, tmp_path, monkeypatch):
+        """Test that the JSON cache is still written when asked for."""
+        pytest.importorskip("msgspec")
+        monkeypatch.setenv(aggregator_module.JSON_CACHE_ENV, "1")
+        metrics_path = tmp_path / "metrics.jsonl"
+        metrics_path.write_text(json.dumps(make_event("Read", file_path="/path/file.py")) + "\n")
+
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+        result = aggregator.compute(window_days=7)
+
+        assert aggregator.cache_bin_path.exists()
+        cached = json.loads(aggregator.cache_path.read_text())
+        assert cached["state"]["cursor"] == metrics_path.stat().st_size
+        del cached["state"]
+        assert cached == result.to_dict()
+
+    @pytest.mark.parametrize("use_stdlib", [False, True])
+    def test_json_cache_is_streamed_per_record(self, tmp_path, use_stdlib):
+        """Test that the JSON cache is valid with one record per line."""
+        metrics_path = tmp_path / "metrics.jsonl"
+        with open(metrics_path, "w") as f:
+            f.write(json.dumps(make_event("Read", session_id="s1", file_path="/a.py", issue_id="bd-1")) + "\n")
+            f.write(json.dumps(make_event("Edit", session_id="s2", file_path="/b\"q.py")) + "\n")
+            f.write(json.dumps(make_event("Bash", session_id="s2")) + "\n")
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+
+        with patch.object(aggregator_module, "_ENCODER", None):
+            if use_stdlib:
+                with patch.object(aggregator_module, "dumps", lambda o: json.dumps(o).encode()):
+                    result = aggregator.compute(window_days=7)
+            else:
+                result = aggregator.compute(window_days=7)
+
+        text = aggregator.cache_path.read_text()
+        cached = json.loads(text)
+        assert AggregationResult.from_dict(cached) == result
+        assert cached["state"]["files"]["/b\"q.py"]["edits"] == 1
+        assert cached["state"]["tool_uses"] == {"Read": 1, "Edit": 1, "Bash": 1}
+        assert any(line.startswith('"/b\\"q.py": {') for line in text.splitlines())
+
+    def test_cache_is_replaced_not_rewritten(self, tmp_path):
+        """Test that a reader holding the old cache never sees a partial write."""
+        metrics_path = tmp_path / "metrics.jsonl"
+        metrics_path.write_text(json.dumps(make_event("Read", file_path="/a.py")) + "\n")
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+
+        with patch.object(aggregator_module, "_ENCODER", None):
+            aggregator.compute(window_days=7)
+            old_bytes = aggregator.cache_path.read_bytes()
+            with open(aggregator.cache_path, "rb") as reader:
+                aggregator.compute(window_days=14)
+                assert reader.read() == old_bytes
+
+        assert json.loads(aggregator.cache_path.read_text())["window_days"] == 14
+        assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
     def test_caching_uses_cache_when_fresh(self, tmp_path):
         """Test that cache is used when metrics haven't changed."""
         metrics_path = tmp_path / "metrics.jsonl"
@@ -622,6 +907,83 @@ class TestMetricsAggregator:
         result2 = aggregator.compute(window_days=7, force=True)
         assert result2.computed_at != computed_at1
 
+    def test_first_and_last_timestamps_out_of_order(self, tmp_path):
+        """Test that first/last access come from the extreme timestamps, not file order."""
+        metrics_path = tmp_path / "metrics.jsonl"
+        now = datetime.now(timezone.utc)
+        times = [(now - timedelta(hours=h)).isoformat() for h in (2, 5, 1, 3)]
+        with open(metrics_path, "w") as f:
+            for ts in times:
+                f.write(json.dumps(make_event("Read", file_path="/a.py", timestamp=ts)) + "\n")
+
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+        result = aggregator.compute(window_days=7)
+
+        stats = result.file_stats["/a.py"]
+        assert stats.first_accessed == times[1]
+        assert stats.last_accessed == times[2]
+        session = result.session_stats["sess_test"]
+        assert (session.start_time, session.end_time) == (times[1], times[2])
+
+    def test_non_dict_input_is_tolerated(self, tmp_path):
+        """Test that an event whose input is not an object still counts."""
+        metrics_path = tmp_path / "metrics.jsonl"
+        bad = make_event("Bash")
+        bad["input"] = None
+        with open(metrics_path, "w") as f:
+            f.write(json.dumps(bad) + "\n")
+            f.write(json.dumps(make_event("Edit", file_path="/a.py")) + "\n")
+
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+        result = aggregator.compute(window_days=7)
+
+        assert result.event_count == 2
+        assert result.tool_stats["Bash"].total_uses == 1
+        assert result.file_stats["/a.py"].total_edits == 1
+        assert result.file_stats["/a.py"].total_reads == 0
+
+    def test_paths_and_sessions_are_shared(self, tmp_path):
+        """Test that the per-session and per-file sets share one string per value."""
+        metrics_path = tmp_path / "metrics.jsonl"
+        with open(metrics_path, "w") as f:
+            for session_id in ("s1", "s2"):
+                for path in ("/src/a.py", "/src/b.py"):
+                    f.write(json.dumps(make_event("Read", session_id=session_id, file_path=path)) + "\n")
+
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+        _, state = aggregator._compute_aggregations(7)
+
+        paths = [p for s in state.sessions.values() for p in s.files if p == "/src/a.py"]
+        sessions = [s for t in state.files.values() for s in t.sessions if s == "s1"]
+        assert len(paths) == 2 and paths[0] is paths[1]
+        assert len(sessions) == 2 and sessions[0] is sessions[1]
+
+    def test_events_are_streamed(self, tmp_path):
+        """Test that events are read lazily rather than loaded into a list."""
+        metrics_path = tmp_path / "metrics.jsonl"
+        with open(metrics_path, "w") as f:
+            for i in range(3):
+                f.write(json.dumps(make_event("Read", file_path=f"/f{i}.py")) + "\n")
+
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+        events = aggregator._iter_events(datetime.now(timezone.utc) - timedelta(days=1))
+
+        assert not isinstance(events, list)
+        assert next(events)[4] == "/f0.py"
+        assert len(list(events)) == 2
+
     def test_handles_malformed_events(self, tmp_path):
         """Test that malformed events are skipped."""
         metrics_path = tmp_path / "metrics.jsonl"
@@ -660,6 +1022,23 @@ class TestMetricsAggregator:
         result = aggregator.compute(window_days=7)
         assert result.event_count == 2
 
+    def test_handles_crlf_and_unterminated_last_line(self, tmp_path):
+        """Test lines with surrounding whitespace and no final newline."""
+        metrics_path = tmp_path / "metrics.jsonl"
+        metrics_path.write_bytes(
+            b'  {"tool": "Read", "session_id": "sess_1"}\r\n'
+            b'\t\r\n'
+            b'{"tool": "Edit", "session_id": "sess_2"}'
+        )
+
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+
+        result = aggregator.compute(window_days=7)
+        assert result.event_count == 2
+
     def test_timestamp_formats(self, tmp_path):
         """Test handling of different timestamp formats."""
         metrics_path = tmp_path / "metrics.jsonl"
@@ -688,6 +1067,209 @@ class TestMetricsAggregator:
         result = aggregator.compute(window_days=7)
         assert result.event_count == 3
 
+    def test_expired_collector_lines_are_not_decoded(self, tmp_path):
+        """Test that old lines in the collector's format are skipped undecoded."""
+        metrics_path = tmp_path / "metrics.jsonl"
+        old = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
+        lines = [
+            MetricEvent(timestamp=old, session_id="s1", tool="Read", input={}).to_json(),
+            MetricEvent(
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                session_id="s1",
+                tool="Edit",
+                input={"file_path": "/a.py"},
+            ).to_json(),
+            # Not a plain timestamp, so decoded and kept as unparseable
+            '{"timestamp":"' + old + '\\"x","session_id":"s2","tool":"Bash"}',
+            '{"timestamp":"2026',
+        ]
+        metrics_path.write_text("\n".join(lines) + "\n")
+
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+        with patch.object(
+            aggregator_module, "_event_fields", wraps=aggregator_module._event_fields
+        ) as mock_decode:
+            result = aggregator.compute(window_days=7, force=True)
+
+        assert result.event_count == 2
+        assert set(result.tool_stats) == {"Edit", "Bash"}
+        assert mock_decode.call_count == 3
+
+
+class TestIncrementalAggregation:
+    """Tests for resuming aggregation from the cached offset."""
+
+    @pytest.fixture(params=["msgpack", "json"])
+    def aggregator(self, request, tmp_path, monkeypatch):
+        if request.param == "msgpack":
+            pytest.importorskip("msgspec")
+        else:
+            monkeypatch.setattr(aggregator_module, "_ENCODER", None)
+            monkeypatch.setattr(aggregator_module, "_DECODER", None)
+        return MetricsAggregator(
+            metrics_path=tmp_path / "metrics.jsonl",
+            cache_path=tmp_path / "cache.json",
+        )
+
+    def _write(self, aggregator, events, mode="a"):
+        with open(aggregator.metrics_path, mode) as f:
+            for event in events:
+                f.write(json.dumps(event) + "\n")
+        # Make sure the append is seen as newer than the cache
+        stat = aggregator.metrics_path.stat()
+        os.utime(aggregator.metrics_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def _spy_starts(self, aggregator):
+        starts = []
+        original = aggregator._iter_events
+
+        def spy(cutoff, start=0):
+            starts.append(start)
+            return original(cutoff, start)
+
+        return starts, patch.object(aggregator, "_iter_events", spy)
+
+    def test_appended_events_are_read_from_cursor(self, aggregator):
+        """Test that only appended events are read and totals match a full recompute."""
+        self._write(aggregator, [
+            make_event("Read", session_id="s1", file_path="/a.py", issue_id="bd-1"),
+            make_event("Edit", session_id="s1", file_path="/a.py", success=False),
+        ], mode="w")
+        aggregator.compute(window_days=7)
+        cursor = aggregator.metrics_path.stat().st_size
+
+        self._write(aggregator, [
+            make_event("Read", session_id="s2", file_path="/a.py"),
+            make_event("Edit", session_id="s1", file_path="/b.py"),
+            make_event("Bash", session_id="s2", error="boom"),
+        ])
+        starts, spy = self._spy_starts(aggregator)
+        with spy:
+            resumed = aggregator.compute(window_days=7)
+        full = aggregator.compute(window_days=7, force=True)
+
+        assert starts == [cursor]
+        assert resumed.event_count == 5
+        for name in ("file_stats", "session_stats", "tool_stats"):
+            assert getattr(resumed, name) == getattr(full, name)
+
+    def test_rewritten_file_is_recomputed(self, aggregator):
+        """Test that a file replaced rather than appended to is read from the start."""
+        self._write(aggregator, [make_event("Read", file_path="/a.py")], mode="w")
+        aggregator.compute(window_days=7)
+
+        self._write(aggregator, [
+            make_event("Edit", file_path="/b.py"),
+            make_event("Edit", file_path="/b.py"),
+        ], mode="w")
+        starts, spy = self._spy_starts(aggregator)
+        with spy:
+            result = aggregator.compute(window_days=7)
+
+        assert starts == [0]
+        assert result.event_count == 2
+        assert set(result.file_stats) == {"/b.py"}
+
+    def test_expired_events_reset_totals(self, aggregator):
+        """Test that totals are rebuilt once a cached event leaves the window."""
+        old = (datetime.now(timezone.utc) - timedelta(days=6, hours=23, minutes=59, seconds=59))
+        self._write(aggregator, [
+            make_event("Read", file_path="/old.py", timestamp=old.isoformat()),
+        ], mode="w")
+        aggregator.compute(window_days=7)
+
+        time.sleep(1.1)
+        self._write(aggregator, [make_event("Read", file_path="/new.py")])
+        starts, spy = self._spy_starts(aggregator)
+        with spy:
+            result = aggregator.compute(window_days=7)
+
+        assert starts == [0]
+        assert set(result.file_stats) == {"/new.py"}
+
+    def test_unterminated_line_is_not_resumed(self, aggregator):
+        """Test that a partially written last line is read again next time."""
+        line = json.dumps(make_event("Read", file_path="/a.py"))
+        aggregator.metrics_path.write_text(line + "\n" + line[:10])
+        assert aggregator.compute(window_days=7).event_count == 1
+
+        with open(aggregator.metrics_path, "a") as f:
+            f.write(line[10:] + "\n")
+        self._write(aggregator, [])
+        starts, spy = self._spy_starts(aggregator)
+        with spy:
+            result = aggregator.compute(window_days=7)
+
+        assert starts == [0]
+        assert result.event_count == 2
+
+
+class TestParallelAggregation:
+    """Tests for aggregating large files across worker processes."""
+
+    @pytest.fixture
+    def metrics_path(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        with open(path, "w") as f:
+            for i in range(400):
+                f.write(json.dumps(make_event(
+                    "Edit" if i % 3 else "Read",
+                    session_id=f"s{i % 7}",
+                    file_path=f"/src/f{i % 11}.py",
+                    issue_id=f"bd-{i % 7}" if i > 200 else None,
+                    success=i % 5 != 0,
+                    timestamp=(datetime.now(timezone.utc) - timedelta(minutes=i)).isoformat(),
+                )) + "\n")
+            f.write("not json\n")
+        return path
+
+    def test_split_lines(self, metrics_path):
+        """Test that ranges cover the file and start on line boundaries."""
+        data = metrics_path.read_bytes()
+        bounds = aggregator_module._split_lines(metrics_path, 4)
+
+        assert bounds[0] == 0 and bounds[-1] == len(data)
+        assert bounds == sorted(set(bounds)) and len(bounds) == 5
+        assert all(data[b - 1:b] == b"\n" for b in bounds[1:])
+
+    def test_matches_serial(self, tmp_path, metrics_path):
+        """Test that merged worker totals equal a single in-process pass."""
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+        serial, serial_state = aggregator._compute_aggregations(7)
+
+        with patch.object(aggregator_module, "PARALLEL_CHUNK_BYTES", 1024), \
+                patch.object(aggregator_module, "_usable_cpus", return_value=3), \
+                patch.object(aggregator, "_iter_events") as mock_iter:
+            parallel, parallel_state = aggregator._compute_aggregations(7)
+
+        mock_iter.assert_not_called()
+        assert parallel.event_count == serial.event_count == 400
+        for name in ("file_stats", "session_stats", "tool_stats"):
+            assert getattr(parallel, name) == getattr(serial, name)
+            assert list(getattr(parallel, name)) == list(getattr(serial, name))
+        assert parallel_state.cursor == serial_state.cursor == metrics_path.stat().st_size
+        assert parallel_state.oldest == serial_state.oldest
+
+    def test_falls_back_without_pool(self, tmp_path, metrics_path):
+        """Test that the file is read in-process if workers cannot start."""
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+
+        with patch.object(aggregator_module, "PARALLEL_CHUNK_BYTES", 1024), \
+                patch.object(aggregator_module, "_usable_cpus", return_value=3), \
+                patch.object(aggregator_module, "ProcessPoolExecutor", side_effect=OSError):
+            result = aggregator.compute(window_days=7)
+
+        assert result.event_count == 400
+
 
 class TestComputeFunction:
     """Tests for the compute() convenience function."""
@@ -715,10 +1297,72 @@ class TestComputeFunction:
         assert result.event_count == 2
         assert len(result.tool_stats) == 2
 
+    @pytest.mark.parametrize("cache_format", ["msgpack", "json"])
+    def test_compute_json(self, tmp_path, monkeypatch, cache_format):
+        """Test that compute_json matches compute() and skips the dataclasses on a hit."""
+        if cache_format == "msgpack":
+            pytest.importorskip("msgspec")
+        else:
+            monkeypatch.setattr(aggregator_module, "_ENCODER", None)
+            monkeypatch.setattr(aggregator_module, "_DECODER", None)
+        metrics_path = tmp_path / "metrics.jsonl"
+        metrics_path.write_text(
+            json.dumps(make_event("Read", file_path="/path/file.py", issue_id="bd-1")) + "\n"
+        )
+        paths = {"metrics_path": metrics_path, "cache_path": tmp_path / "cache.json"}
+
+        # Miss: computed and cached
+        payload = compute_json(window_days=7, **paths)
+        assert json.loads(payload) == compute(window_days=7, **paths).to_dict()
+
+        # Hit: re-encoded from the cache
+        from_dict = AggregationResult.from_dict
+        with patch.object(AggregationResult, "from_dict") as mock_from_dict:
+            cached = json.loads(compute_json(window_days=7, **paths))
+        mock_from_dict.assert_not_called()
+        assert "state" not in cached
+        assert from_dict(cached) == from_dict(json.loads(payload))
+
+    @pytest.mark.parametrize("cache_format", ["msgpack", "json"])
+    def test_compute_json_keys_match_on_hit_and_miss(self, tmp_path, monkeypatch, cache_format):
+        """Test that a cache hit returns exactly the public keys of a fresh compute."""
+        if cache_format == "msgpack":
+            pytest.importorskip("msgspec")
+        else:
+            monkeypatch.setattr(aggregator_module, "_ENCODER", None)
+            monkeypatch.setattr(aggregator_module, "_DECODER", None)
+        metrics_path = tmp_path / "metrics.jsonl"
+        metrics_path.write_text(json.dumps(make_event("Read", file_path="/path/file.py")) + "\n")
+        paths = {"metrics_path": metrics_path, "cache_path": tmp_path / "cache.json"}
+
+        miss = json.loads(compute_json(window_days=7, **paths))
+        hit = json.loads(compute_json(window_days=7, **paths))
+
+        assert set(hit) == set(miss)
+        assert not any(key.startswith("_") for key in hit)
+
 
 class TestEdgeCases:
     """Tests for edge cases and special scenarios."""
 
+    def test_invalid_utf8_line_is_skipped(self, tmp_path):
+        """Test that a line with invalid UTF-8 in a field that is read is skipped."""
+        metrics_path = tmp_path / "metrics.jsonl"
+
+        with open(metrics_path, "wb") as f:
+            f.write(b'{"tool": "Read", "input": {"file_path": "\xff\xfe"}}\n')
+            f.write(json.dumps(make_event("Read", file_path="/ok.py")).encode() + b"\n")
+
+        aggregator = MetricsAggregator(
+            metrics_path=metrics_path,
+            cache_path=tmp_path / "cache.json",
+        )
+
+        result = aggregator.compute(window_days=7)
+
+        assert result.event_count == 1
+        assert list(result.file_stats) == ["/ok.py"]
+
     def test_single_event(self, tmp_path):
         """Test aggregation with single event."""
         metrics_path = tmp_path / "metrics.jsonl"
@@ -159,12 +159,18 @@ class TestInferIssueId:
         issue_id = infer_issue_id(cwd)
         assert issue_id == "feature-abc123.sub1.sub2"
 
+    def test_trailing_slash(self):
+        """Test that a trailing separator does not hide the directory name."""
+        assert infer_issue_id("/home/user/project-worktrees/bobbin-xyz/") == "bobbin-xyz"
+        assert infer_issue_id("/some/path/proj-123/") == "proj-123"
 
+
+@patch("tambour.hooks.bridge._emit_in_process", return_value=None)
 class TestEmitEvent:
-    """Tests for emit_event function."""
+    """Tests for emit_event function (CLI fallback path)."""
 
     @patch("subprocess.run")
-    def test_emit_tool_used(self, mock_run):
+    def test_emit_tool_used(self, mock_run, _mock_in_process):
         """Test emitting tool.used event."""
         mock_run.return_value = MagicMock(returncode=0)
 
@@ -186,7 +192,7 @@ class TestEmitEvent:
         assert "bobbin-xyz" in cmd
 
     @patch("subprocess.run")
-    def test_emit_tool_failed(self, mock_run):
+    def test_emit_tool_failed(self, mock_run, _mock_in_process):
         """Test emitting tool.failed event."""
         mock_run.return_value = MagicMock(returncode=0)
 
@@ -204,7 +210,7 @@ class TestEmitEvent:
         assert "tool.failed" in cmd
 
     @patch("subprocess.run")
-    def test_emit_with_extra_data(self, mock_run):
+    def test_emit_with_extra_data(self, mock_run, _mock_in_process):
         """Test emitting event with extra data."""
         mock_run.return_value = MagicMock(returncode=0)
 
@@ -226,7 +232,7 @@ class TestEmitEvent:
         assert data_json["command"] == "ls -la"
 
     @patch("subprocess.run")
-    def test_emit_timeout_handling(self, mock_run):
+    def test_emit_timeout_handling(self, mock_run, _mock_in_process):
         """Test handling subprocess timeout."""
         mock_run.side_effect = subprocess.TimeoutExpired(cmd=[], timeout=3)
 
@@ -241,7 +247,7 @@ class TestEmitEvent:
         assert result == 1
 
     @patch("subprocess.run")
-    def test_emit_exception_handling(self, mock_run):
+    def test_emit_exception_handling(self, mock_run, _mock_in_process):
         """Test handling subprocess exceptions."""
         mock_run.side_effect = OSError("spawn failed")
 
@@ -256,6 +262,249 @@ class TestEmitEvent:
         assert result == 1
 
 
+class TestEmitEventInProcess:
+    """Tests for in-process event dispatch."""
+
+    @patch("subprocess.run")
+    @patch("tambour.events.emit")
+    def test_dispatches_without_subprocess(self, mock_emit, mock_run):
+        """Test that events are dispatched without spawning the CLI."""
+        mock_emit.return_value = []
+
+        result = emit_event(
+            event_type="tool.used",
+            tool_name="Read",
+            session_id="sess_123",
+            issue_id="bobbin-xyz",
+            worktree="/path/to/worktree",
+            extra_data={"file_path": "/a.py", "meta": {"k": 1}},
+        )
+
+        assert result == 0
+        mock_run.assert_not_called()
+        args, kwargs = mock_emit.call_args
+        assert args == ("tool.used",)
+        assert kwargs["issue_id"] == "bobbin-xyz"
+        assert kwargs["worktree"] == Path("/path/to/worktree")
+        assert kwargs["extra"] == {
+            "tool_name": "Read",
+            "session_id": "sess_123",
+            "file_path": "/a.py",
+            "meta": '{"k": 1}',
+        }
+        assert kwargs["detach_async"] is True
+
+    @patch("tambour.hooks.bridge._emit_via_cli", return_value=0)
+    @patch("tambour.events.emit")
+    def test_blocking_plugin_uses_cli(self, mock_emit, mock_cli):
+        """Test that events with a blocking plugin go through the time-bounded CLI."""
+        from tambour.config import Config, PluginConfig
+
+        plugin = PluginConfig(name="p", on=["tool.used"], run="true", blocking=True)
+        with patch.object(Config, "load_or_default", return_value=Config(plugins={"p": plugin})):
+            result = emit_event(
+                event_type="tool.used",
+                tool_name="Read",
+                session_id="sess_123",
+                issue_id=None,
+                worktree=None,
+            )
+
+        assert result == 0
+        mock_emit.assert_not_called()
+        mock_cli.assert_called_once()
+
+    @patch("tambour.events.emit")
+    def test_plugin_failure_returns_one(self, mock_emit):
+        """Test that a failed blocking plugin gives a non-zero exit code."""
+        from tambour.events import PluginResult
+
+        mock_emit.return_value = [PluginResult(plugin_name="p", success=False)]
+
+        result = emit_event(
+            event_type="tool.used",
+            tool_name="Read",
+            session_id="sess_123",
+            issue_id=None,
+            worktree=None,
+        )
+
+        assert result == 1
+
+    @patch("tambour.events.emit", side_effect=RuntimeError("boom"))
+    def test_exception_returns_one(self, mock_emit):
+        """Test that dispatch errors are swallowed."""
+        result = emit_event(
+            event_type="tool.used",
+            tool_name="Read",
+            session_id="sess_123",
+            issue_id=None,
+            worktree=None,
+        )
+
+        assert result == 1
+
+
+class TestEmitEventViaDaemon:
+    """Tests for handing events to the daemon's bridge socket."""
+
+    @patch("tambour.hooks.bridge._emit_in_process")
+    @patch("tambour.eventsock.send_event", return_value=True)
+    def test_uses_socket_when_configured(self, mock_send, mock_in_process, monkeypatch):
+        """Test that a configured socket takes the event."""
+        monkeypatch.setenv("TAMBOUR_BRIDGE_SOCKET", "/tmp/tambour.sock")
+
+        result = emit_event(
+            event_type="tool.used",
+            tool_name="Read",
+            session_id="sess_123",
+            issue_id="bobbin-xyz",
+            worktree="/path/to/worktree",
+        )
+
+        assert result == 0
+        mock_in_process.assert_not_called()
+        socket_path, record = mock_send.call_args[0]
+        assert socket_path == "/tmp/tambour.sock"
+        assert record == {
+            "event": "tool.used",
+            "issue": "bobbin-xyz",
+            "worktree": "/path/to/worktree",
+            "data": {"tool_name": "Read", "session_id": "sess_123"},
+        }
+
+    @patch("tambour.hooks.bridge._emit_in_process", return_value=0)
+    @patch("tambour.eventsock.send_event", return_value=False)
+    def test_falls_back_when_daemon_absent(self, mock_send, mock_in_process, monkeypatch):
+        """Test fallback to in-process dispatch when the socket is not accepting."""
+        monkeypatch.setenv("TAMBOUR_BRIDGE_SOCKET", "/tmp/tambour.sock")
+
+        result = emit_event(
+            event_type="tool.used",
+            tool_name="Read",
+            session_id="sess_123",
+            issue_id=None,
+            worktree=None,
+        )
+
+        assert result == 0
+        mock_send.assert_called_once()
+        mock_in_process.assert_called_once()
+
+    @patch("tambour.hooks.bridge._emit_in_process", return_value=0)
+    @patch("tambour.eventsock.send_event")
+    def test_socket_not_used_without_env(self, mock_send, mock_in_process, monkeypatch):
+        """Test that no socket is tried unless TAMBOUR_BRIDGE_SOCKET is set."""
+        monkeypatch.delenv("TAMBOUR_BRIDGE_SOCKET", raising=False)
+
+        emit_event(
+            event_type="tool.used",
+            tool_name="Read",
+            session_id="sess_123",
+            issue_id=None,
+            worktree=None,
+        )
+
+        mock_send.assert_not_called()
+
+
+class TestEmitEventDirect:
+    """Tests for appending tool.used metrics directly."""
+
+    def _collector_record(self, tmp_path, monkeypatch, env):
+        """Store an event with the metrics collector plugin and return its record."""
+        from tambour.metrics.collector import MetricsCollector
+
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        collector = MetricsCollector(tmp_path / "collector.jsonl")
+        assert collector.collect_and_store()
+        return json.loads(collector.storage_path.read_text())
+
+    @patch("tambour.hooks.bridge._send_to_daemon")
+    @patch("tambour.hooks.bridge._emit_in_process")
+    def test_appends_collector_record(self, mock_in_process, mock_daemon, tmp_path, monkeypatch):
+        """Test that the direct record matches what the collector plugin stores."""
+        monkeypatch.setenv("TAMBOUR_BRIDGE_DIRECT", "1")
+
+        for command in ("ls -la", "git status"):
+            result = emit_event(
+                event_type="tool.used",
+                tool_name="Bash",
+                session_id="sess_123",
+                issue_id="bobbin-xyz",
+                worktree=str(tmp_path),
+                extra_data={"command": command},
+            )
+            assert result == 0
+
+        mock_in_process.assert_not_called()
+        mock_daemon.assert_not_called()
+        lines = (tmp_path / ".tambour" / "metrics.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        direct = json.loads(lines[0])
+
+        expected = self._collector_record(tmp_path, monkeypatch, {
+            "TAMBOUR_EVENT": "tool.used",
+            "TAMBOUR_TIMESTAMP": direct["timestamp"],
+            "TAMBOUR_TOOL_NAME": "Bash",
+            "TAMBOUR_SESSION_ID": "sess_123",
+            "TAMBOUR_ISSUE_ID": "bobbin-xyz",
+            "TAMBOUR_WORKTREE": str(tmp_path),
+            "TAMBOUR_COMMAND": "ls -la",
+        })
+        assert direct == expected
+
+    @patch("tambour.hooks.bridge._emit_in_process", return_value=0)
+    def test_failed_events_are_dispatched(self, mock_in_process, tmp_path, monkeypatch):
+        """Test that tool.failed still goes through the dispatcher."""
+        monkeypatch.setenv("TAMBOUR_BRIDGE_DIRECT", "1")
+
+        emit_event(
+            event_type="tool.failed",
+            tool_name="Bash",
+            session_id="sess_123",
+            issue_id=None,
+            worktree=str(tmp_path),
+            extra_data={"error": "boom"},
+        )
+
+        mock_in_process.assert_called_once()
+        assert not (tmp_path / ".tambour").exists()
+
+    @patch("tambour.hooks.bridge._emit_in_process", return_value=0)
+    def test_not_used_without_env(self, mock_in_process, tmp_path, monkeypatch):
+        """Test that metrics are only written directly when opted in."""
+        monkeypatch.delenv("TAMBOUR_BRIDGE_DIRECT", raising=False)
+
+        emit_event(
+            event_type="tool.used",
+            tool_name="Read",
+            session_id="sess_123",
+            issue_id=None,
+            worktree=str(tmp_path),
+        )
+
+        mock_in_process.assert_called_once()
+        assert not (tmp_path / ".tambour").exists()
+
+    @patch("tambour.hooks.bridge._emit_in_process", return_value=0)
+    def test_falls_back_when_unwritable(self, mock_in_process, tmp_path, monkeypatch):
+        """Test that a write failure falls back to dispatching the event."""
+        monkeypatch.setenv("TAMBOUR_BRIDGE_DIRECT", "1")
+        (tmp_path / ".tambour").write_text("not a directory")
+
+        emit_event(
+            event_type="tool.used",
+            tool_name="Read",
+            session_id="sess_123",
+            issue_id=None,
+            worktree=str(tmp_path),
+        )
+
+        mock_in_process.assert_called_once()
+
+
 class TestMain:
     """Tests for main function."""
 
@@ -353,6 +602,29 @@ class TestMain:
         call_kwargs = mock_emit.call_args
         assert len(call_kwargs[1]["extra_data"]["command"]) == 200
 
+    @patch("tambour.hooks.bridge.emit_event")
+    def test_main_truncates_multibyte_commands_by_character(self, mock_emit):
+        """Test that truncation never splits a multibyte character."""
+        mock_emit.return_value = 0
+
+        long_command = "echo " + "é" * 300
+        input_data = json.dumps(
+            {
+                "session_id": "sess_abc123",
+                "tool_name": "Bash",
+                "tool_input": {"command": long_command},
+                "tool_response": {"success": True},
+                "cwd": "/path/to/project",
+            }
+        )
+
+        with patch("sys.stdin", StringIO(input_data)):
+            main()
+
+        command = mock_emit.call_args[1]["extra_data"]["command"]
+        assert command == long_command[:200]
+        assert "\ufffd" not in command
+
     def test_main_empty_input(self):
         """Test main with empty input returns success."""
         with patch("sys.stdin", StringIO("")):
@@ -297,6 +297,35 @@ enabled = false
         finally:
             config_path.unlink()
 
+    def test_resolved_worktree_base(self, tmp_path, monkeypatch):
+        """Test that the worktree base is expanded against the current directory."""
+        repo = tmp_path / "myrepo"
+        repo.mkdir()
+        monkeypatch.chdir(repo)
+
+        config = Config()
+
+        assert config.resolved_worktree_base == tmp_path / "myrepo-worktrees"
+
+    def test_resolved_worktree_base_absolute(self, tmp_path, monkeypatch):
+        """Test that an absolute base_path is used as-is."""
+        monkeypatch.chdir(tmp_path)
+        config = Config(worktree=WorktreeConfig(base_path="/srv/{repo}-trees"))
+
+        assert config.resolved_worktree_base == Path(f"/srv/{tmp_path.name}-trees")
+
+    def test_resolved_worktree_base_is_cached(self, tmp_path, monkeypatch):
+        """Test that the base is computed once per config."""
+        repo = tmp_path / "myrepo"
+        repo.mkdir()
+        monkeypatch.chdir(repo)
+        config = Config()
+        first = config.resolved_worktree_base
+
+        monkeypatch.chdir(tmp_path)
+
+        assert config.resolved_worktree_base is first
+
 
 class TestValidEventNames:
     """Tests for VALID_EVENT_NAMES constant."""
@@ -15,6 +15,8 @@ from tambour.events import (
     PluginResult,
     SessionEvent,
     ToolEvent,
+    emit,
+    flatten_event_data,
 )
 
 
@@ -58,10 +60,14 @@ def test_dispatch_mixed_blocking(mock_config, tmp_path):
         
         results = dispatcher.dispatch(event)
 
-        # Wait for threads to finish
+        # Wait for plugin threads to finish, then flush the log writer
         for thread in threading.enumerate():
-            if thread is not threading.current_thread():
-                thread.join(timeout=1.0)
+            if thread is threading.current_thread():
+                continue
+            if thread.name.startswith("tambour-log"):
+                continue
+            thread.join(timeout=1.0)
+        dispatcher.close()
 
     # Check immediate results
     assert len(results) == 2
@@ -83,6 +89,26 @@ def test_dispatch_mixed_blocking(mock_config, tmp_path):
     assert "SUCCESS" in content
 
 
+def test_dispatch_detached_async(mock_config):
+    """Test that detached async plugins are spawned without a waiting thread."""
+    mock_config.plugins["p1"].enabled = False
+    dispatcher = EventDispatcher(mock_config, detach_async=True)
+    event = Event(event_type=EventType.BRANCH_MERGED, worktree=Path("/wt"))
+
+    with patch("subprocess.Popen") as mock_popen, \
+         patch("threading.Thread") as mock_thread:
+        results = dispatcher.dispatch(event)
+
+    assert [r.plugin_name for r in results] == ["p2-async"]
+    mock_thread.assert_not_called()
+    args, kwargs = mock_popen.call_args
+    assert args == ("echo 'async'",)
+    assert kwargs["start_new_session"] is True
+    assert kwargs["cwd"] == Path("/wt")
+    assert kwargs["env"]["TAMBOUR_EVENT"] == "branch.merged"
+    mock_popen.return_value.wait.assert_not_called()
+
+
 def test_blocking_failure_stops_chain(mock_config, tmp_path):
     """Test that a blocking plugin failure stops the chain."""
     # Make p1 fail
@@ -104,6 +130,55 @@ def test_blocking_failure_stops_chain(mock_config, tmp_path):
     assert not results[0].success
 
 
+def test_log_write_happens_off_dispatch_thread(tmp_path):
+    """Test that blocking-plugin results are logged by the writer thread."""
+    config = Config()
+    config.plugins = {
+        "p1": PluginConfig(
+            name="p1-blocking",
+            on=["branch.merged"],
+            run="true",
+            blocking=True,
+        )
+    }
+    log_file = tmp_path / "events.log"
+    dispatcher = EventDispatcher(config, log_file=log_file)
+
+    writer_threads: list[str] = []
+    original = dispatcher._write_log_sync
+
+    def recording_write(line: str) -> None:
+        writer_threads.append(threading.current_thread().name)
+        original(line)
+
+    dispatcher._write_log_sync = recording_write
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        dispatcher.dispatch(Event(event_type=EventType.BRANCH_MERGED))
+
+    dispatcher.close()
+
+    assert len(writer_threads) == 1
+    assert writer_threads[0] != threading.current_thread().name
+    assert "Plugin 'p1-blocking'" in log_file.read_text()
+
+
+def test_log_after_close_writes_inline(tmp_path):
+    """Test that results logged after close() are still written."""
+    log_file = tmp_path / "events.log"
+    dispatcher = EventDispatcher(Config(), log_file=log_file)
+    dispatcher.close()
+
+    dispatcher._log_result(
+        PluginResult(plugin_name="late", success=False, error="boom", duration_ms=3)
+    )
+
+    content = log_file.read_text()
+    assert "[FAILED] Plugin 'late'" in content
+    assert "Error: boom" in content
+
+
 def test_event_env_vars():
     """Test that event is converted to environment variables correctly."""
     event = Event(
@@ -134,6 +209,24 @@ def test_event_env_vars_with_paths():
     assert env["TAMBOUR_BEADS_DB"] == "/path/to/beads"
 
 
+def test_event_env_vars_omit_unset_fields():
+    """Test that empty or missing fields are not exported."""
+    event = Event(
+        event_type=EventType.TASK_CLAIMED,
+        issue_id="issue-123",
+        issue_title="",
+        worktree=Path("/path/to/worktree"),
+    )
+
+    env = event.to_env()
+
+    assert env["TAMBOUR_ISSUE_ID"] == "issue-123"
+    assert env["TAMBOUR_WORKTREE"] == "/path/to/worktree"
+    assert "TAMBOUR_ISSUE_TITLE" not in env
+    assert "TAMBOUR_BRANCH" not in env
+    assert "TAMBOUR_MAIN_REPO" not in env
+
+
 # Tests for new tool and session event types
 
 
@@ -319,3 +412,41 @@ class TestNewEventTypes:
         other_plugins = config.get_plugins_for_event("branch.merged")
         assert len(other_plugins) == 0
 
+
+
+class TestEmit:
+    """Tests for the in-process emit() helper."""
+
+    def test_flatten_event_data(self):
+        """Test that values are flattened to strings."""
+        extra = flatten_event_data({"a": 1, "b": {"c": True}, "d": "x"})
+        assert extra == {"a": "1", "b": '{"c": true}', "d": "x"}
+
+    def test_emit_dispatches_event(self, tmp_path, monkeypatch):
+        """Test that emit builds the event and dispatches it."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        plugin = PluginConfig(name="p", on=["tool.used"], run="true", blocking=True)
+        config = Config(plugins={"p": plugin})
+
+        with patch.object(EventDispatcher, "_execute_plugin") as mock_exec:
+            mock_exec.return_value = PluginResult(plugin_name="p", success=True)
+            results = emit(
+                "tool.used",
+                issue_id="bd-1",
+                worktree=Path("/wt"),
+                extra={"tool_name": "Read"},
+                config=config,
+            )
+
+        assert [r.plugin_name for r in results] == ["p"]
+        event = mock_exec.call_args[0][1]
+        assert event.event_type == EventType.TOOL_USED
+        assert event.issue_id == "bd-1"
+        assert event.worktree == Path("/wt")
+        assert event.extra == {"tool_name": "Read"}
+        assert (tmp_path / ".tambour" / "events.log").exists()
+
+    def test_emit_unknown_event(self):
+        """Test that unknown event types raise ValueError."""
+        with pytest.raises(ValueError):
+            emit("no.such.event", config=Config())
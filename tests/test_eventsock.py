@@ -0,0 +1,213 @@
+"""Tests for the daemon's bridge event socket."""
+
+import socket
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tambour.config import Config
+from tambour.events import EventDispatcher, EventType
+from tambour.eventsock import EventSocketServer, _find_main_repo, send_event
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    """Socket path in a short temp dir, with HOME redirected for the events log."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path / "bridge.sock"
+
+
+def _make_repo(path: Path, plugin: str) -> Path:
+    """Create a fake main repository with a config subscribing one plugin."""
+    (path / ".git" / "worktrees" / "wt").mkdir(parents=True)
+    (path / ".tambour").mkdir()
+    (path / ".tambour" / "config.toml").write_text(
+        f'[plugins.{plugin}]\non = "tool.used"\nrun = "true"\n'
+    )
+    return path
+
+
+def _make_worktree(path: Path, repo: Path) -> Path:
+    """Create a fake linked worktree of repo, outside the repo's tree."""
+    path.mkdir()
+    git_dir = repo / ".git" / "worktrees" / "wt"
+    (path / ".git").write_text(f"gitdir: {git_dir}\n")
+    (git_dir / "commondir").write_text("../..\n")
+    return path
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestSendEvent:
+    """Tests for send_event."""
+
+    def test_missing_socket(self, tmp_path):
+        """Test that a missing socket reports failure."""
+        assert send_event(tmp_path / "nope.sock", {"event": "tool.used"}) is False
+
+    def test_sends_json_line(self, socket_path):
+        """Test that the record is sent as one JSON line."""
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(socket_path))
+        server.listen()
+        try:
+            assert send_event(socket_path, {"event": "tool.used", "issue": "bd-1"})
+            conn, _ = server.accept()
+            with conn:
+                assert conn.recv(1024) == b'{"event": "tool.used", "issue": "bd-1"}\n'
+        finally:
+            server.close()
+
+
+class TestEventSocketServer:
+    """Tests for EventSocketServer."""
+
+    def test_dispatches_received_events(self, socket_path):
+        """Test that events sent to the socket are dispatched."""
+        dispatched = []
+        lock = threading.Lock()
+
+        def record_dispatch(self, event):
+            with lock:
+                dispatched.append(event)
+            return []
+
+        server = EventSocketServer(socket_path, Config())
+        with patch.object(EventDispatcher, "dispatch", record_dispatch):
+            server.start()
+            try:
+                for i in range(3):
+                    assert send_event(socket_path, {
+                        "event": "tool.used",
+                        "issue": f"bd-{i}",
+                        "worktree": "/wt",
+                        "data": {"tool_name": "Read", "meta": {"k": 1}},
+                    })
+                assert _wait_for(lambda: len(dispatched) == 3)
+            finally:
+                server.stop()
+
+        assert [e.issue_id for e in dispatched] == ["bd-0", "bd-1", "bd-2"]
+        assert dispatched[0].event_type == EventType.TOOL_USED
+        assert dispatched[0].worktree == Path("/wt")
+        assert dispatched[0].extra == {"tool_name": "Read", "meta": '{"k": 1}'}
+        assert not socket_path.exists()
+
+    def test_multiple_records_per_connection(self, socket_path):
+        """Test that one connection can carry several records, and bad lines are skipped."""
+        dispatched = []
+
+        server = EventSocketServer(socket_path, Config())
+        with patch.object(EventDispatcher, "dispatch", lambda self, e: dispatched.append(e)):
+            server.start()
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.connect(str(socket_path))
+                    sock.sendall(
+                        b'{"event": "tool.used", "issue": "a"}\n'
+                        b"not json\n"
+                        b'{"event": "tool.failed", "issue": "b"}'
+                    )
+                assert _wait_for(lambda: len(dispatched) == 2)
+            finally:
+                server.stop()
+
+        assert [e.event_type for e in dispatched] == [EventType.TOOL_USED, EventType.TOOL_FAILED]
+
+    def test_unknown_event_does_not_stop_server(self, socket_path):
+        """Test that a bad record is logged and later records still dispatch."""
+        dispatched = []
+
+        server = EventSocketServer(socket_path, Config())
+        with patch.object(EventDispatcher, "dispatch", lambda self, e: dispatched.append(e)):
+            server.start()
+            try:
+                assert send_event(socket_path, {"event": "no.such.event"})
+                assert send_event(socket_path, {"event": "tool.used"})
+                assert _wait_for(lambda: len(dispatched) == 1)
+            finally:
+                server.stop()
+
+    def test_replaces_stale_socket(self, socket_path):
+        """Test that a leftover socket file does not prevent startup."""
+        socket_path.write_text("")
+
+        server = EventSocketServer(socket_path, Config())
+        server.start()
+        try:
+            assert socket_path.is_socket()
+        finally:
+            server.stop()
+
+    def test_refuses_live_socket(self, socket_path):
+        """Test that a socket another server is listening on is left alone."""
+        first = EventSocketServer(socket_path, Config())
+        first.start()
+        try:
+            second = EventSocketServer(socket_path, Config())
+            with pytest.raises(OSError):
+                second.start()
+            assert socket_path.is_socket()
+            assert send_event(socket_path, {"event": "tool.used"})
+        finally:
+            first.stop()
+
+    def test_dispatches_with_each_repos_config(self, socket_path, tmp_path):
+        """Test that records from another repository's worktree use its config."""
+        own_repo = _make_repo(tmp_path / "own", "own-plugin")
+        other_repo = _make_repo(tmp_path / "other", "other-plugin")
+        own_wt = _make_worktree(tmp_path / "own-wt", own_repo)
+        other_wt = _make_worktree(tmp_path / "other-wt", other_repo)
+        dispatched = []
+
+        def record_dispatch(self, event):
+            dispatched.append((event.worktree, sorted(self.config.plugins)))
+            return []
+
+        config = Config.load(own_repo / ".tambour" / "config.toml")
+        server = EventSocketServer(socket_path, config)
+        with patch.object(EventDispatcher, "dispatch", record_dispatch):
+            server.start()
+            try:
+                for worktree in (own_wt, other_wt, other_wt):
+                    assert send_event(socket_path, {"event": "tool.used", "worktree": str(worktree)})
+                assert _wait_for(lambda: len(dispatched) == 3)
+                assert len(server._dispatchers) == 1
+            finally:
+                server.stop()
+
+        assert dispatched == [
+            (own_wt, ["own-plugin"]),
+            (other_wt, ["other-plugin"]),
+            (other_wt, ["other-plugin"]),
+        ]
+
+
+class TestFindMainRepo:
+    """Tests for _find_main_repo."""
+
+    def test_main_repo(self, tmp_path):
+        """Test that a path inside the main repository resolves to it."""
+        repo = _make_repo(tmp_path / "repo", "p")
+        (repo / "src").mkdir()
+        assert _find_main_repo(repo / "src") == repo
+
+    def test_linked_worktree(self, tmp_path):
+        """Test that a linked worktree resolves to its main repository."""
+        repo = _make_repo(tmp_path / "repo", "p")
+        worktree = _make_worktree(tmp_path / "wt", repo)
+        assert _find_main_repo(worktree) == repo.resolve()
+
+    def test_not_a_repository(self, tmp_path):
+        """Test that a path outside any repository gives None."""
+        assert _find_main_repo(tmp_path) is None
@@ -1,6 +1,7 @@
 """Tests for finish command."""
 
 import json
+import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 
@@ -46,6 +47,15 @@ class TestFinishResult:
         assert len(result.closed_epics) == 2
         assert result.closed_epics[0] == ("epic-1", "First Epic")
 
+    def test_closed_epics_not_shared(self):
+        """Test that each result gets its own closed_epics list."""
+        first = FinishResult(success=True, issue_id="a")
+        second = FinishResult(success=True, issue_id="b")
+        first.closed_epics.append(("epic-1", "Epic"))
+
+        assert second.closed_epics == []
+        assert not hasattr(first, "__dict__")
+
 
 class TestFinishCommand:
     """Tests for FinishCommand class."""
@@ -71,13 +81,14 @@ class TestFinishCommand:
     def finish_cmd(self, mock_repo):
         """Create FinishCommand instance."""
         main_repo, worktree_base, _ = mock_repo
-        return FinishCommand(
+        with FinishCommand(
             issue_id="test-issue",
             main_repo=main_repo,
             worktree_base=worktree_base,
             merge=True,
             no_continue=True,
-        )
+        ) as cmd:
+            yield cmd
 
     def test_worktree_not_found(self, mock_repo):
         """Test error when worktree doesn't exist."""
@@ -93,6 +104,18 @@ class TestFinishCommand:
         assert not result.success
         assert "Worktree not found" in result.error
 
+    def test_worktree_exists_requires_directory(self, mock_repo):
+        """Test that a plain file at the worktree path is not a worktree."""
+        main_repo, worktree_base, _ = mock_repo
+        (worktree_base / "not-a-dir").write_text("")
+
+        with FinishCommand(
+            issue_id="not-a-dir",
+            main_repo=main_repo,
+            worktree_base=worktree_base,
+        ) as cmd:
+            assert cmd._worktree_exists() is False
+
     def test_no_merge_preserves_worktree(self, mock_repo):
         """Test that --no-merge preserves the worktree."""
         main_repo, worktree_base, _ = mock_repo
@@ -138,17 +161,98 @@ class TestFinishCommand:
             assert issue_type == "unknown"
             assert status == "unknown"
 
+    def test_get_issue_info_is_cached(self, finish_cmd):
+        """Test that repeated issue lookups reuse the parsed bd output."""
+        with patch.object(finish_cmd, "_run_bd") as mock_bd:
+            mock_bd.return_value = MagicMock(
+                returncode=0,
+                stdout=json.dumps([{"title": "Test Issue", "status": "open"}]),
+            )
+
+            first = finish_cmd._get_issue_info()
+            second = finish_cmd._get_issue_info()
+
+            assert first == second
+            mock_bd.assert_called_once_with("show", "test-issue", "--json")
+
+    def test_get_epic_status_bust(self, finish_cmd):
+        """Test that bust=True bypasses the cached epic status."""
+        with patch.object(finish_cmd, "_run_bd") as mock_bd:
+            mock_bd.side_effect = [
+                MagicMock(returncode=0, stdout="[]"),
+                MagicMock(returncode=0, stdout=json.dumps([{"epic": {"id": "e-1"}}])),
+            ]
+
+            assert finish_cmd._get_epic_status() == []
+            assert finish_cmd._get_epic_status() == []
+            assert finish_cmd._get_epic_status(bust=True) == [{"epic": {"id": "e-1"}}]
+            assert mock_bd.call_count == 2
+
+    def test_get_epic_status_failure_not_cached(self, finish_cmd):
+        """Test that a failed epic status query is retried next time."""
+        from subprocess import CalledProcessError
+
+        with patch.object(finish_cmd, "_run_bd") as mock_bd:
+            mock_bd.side_effect = [
+                CalledProcessError(1, "bd"),
+                MagicMock(returncode=0, stdout="[]"),
+            ]
+
+            assert finish_cmd._get_epic_status() == []
+            assert finish_cmd._get_epic_status() == []
+            assert mock_bd.call_count == 2
+
+    def test_run_git_uses_resolved_binary(self, finish_cmd):
+        """Test that git runs from its resolved path without a cwd switch."""
+        from tambour.finish import _GIT
+
+        with patch("subprocess.run") as mock_run:
+            finish_cmd._run_git("status", check=False)
+
+        args, kwargs = mock_run.call_args
+        assert args[0] == [_GIT, "-C", str(finish_cmd.main_repo), "status"]
+        assert "cwd" not in kwargs
+        assert kwargs["close_fds"] is False
+
+    def test_run_git_in_worktree(self, finish_cmd):
+        """Test that an explicit cwd is passed to git via -C."""
+        with patch("subprocess.run") as mock_run:
+            finish_cmd._run_git("checkout", "--detach", cwd=finish_cmd.worktree_path, check=False)
+
+        assert mock_run.call_args[0][0][1:3] == ["-C", str(finish_cmd.worktree_path)]
+
     def test_branch_exists(self, finish_cmd):
-        """Test checking if branch exists."""
+        """Test checking if branch exists from the cached branch list."""
         with patch.object(finish_cmd, "_run_git") as mock_git:
-            mock_git.return_value = MagicMock(returncode=0)
+            mock_git.return_value = MagicMock(returncode=0, stdout="main\ntest-issue\n")
 
             assert finish_cmd._branch_exists() is True
+            assert finish_cmd._branch_exists() is True
+
+            mock_git.assert_called_once_with(
+                "for-each-ref", "--format=%(refname:lstrip=2)", "refs/heads/", check=False
+            )
 
-            mock_git.return_value = MagicMock(returncode=1)
+    def test_branch_missing(self, finish_cmd):
+        """Test checking for a branch that is not in the branch list."""
+        with patch.object(finish_cmd, "_run_git") as mock_git:
+            mock_git.return_value = MagicMock(returncode=0, stdout="main\n")
 
             assert finish_cmd._branch_exists() is False
 
+    def test_branch_exists_falls_back_to_show_ref(self, finish_cmd):
+        """Test checking if branch exists when for-each-ref fails."""
+        with patch.object(finish_cmd, "_run_git") as mock_git:
+            mock_git.side_effect = [
+                MagicMock(returncode=128, stdout=""),  # for-each-ref
+                MagicMock(returncode=0),  # show-ref
+            ]
+
+            assert finish_cmd._branch_exists() is True
+            mock_git.assert_called_with(
+                "show-ref", "--verify", "--quiet", "refs/heads/test-issue", check=False
+            )
+
     def test_full_workflow_success(self, finish_cmd):
         """Test successful full workflow."""
         with patch.object(finish_cmd, "_run_git") as mock_git, \
@@ -162,28 +266,165 @@ class TestFinishCommand:
             mock_git.side_effect = [
                 MagicMock(returncode=0),  # checkout main
                 MagicMock(returncode=0),  # pull
-                MagicMock(returncode=0),  # show-ref (branch exists)
+                MagicMock(returncode=0, stdout="main\ntest-issue\n"),  # for-each-ref
                 MagicMock(returncode=0),  # merge
                 MagicMock(returncode=0),  # push
                 MagicMock(returncode=0),  # checkout --detach
-                MagicMock(returncode=0),  # show-ref (branch delete check)
                 MagicMock(returncode=0),  # branch -d
             ]
 
-            # Mock bd operations
-            mock_bd.side_effect = [
-                MagicMock(returncode=0, stdout=json.dumps([{"title": "Test", "status": "in_progress"}])),  # show --json
-                MagicMock(returncode=0),  # worktree remove
-                MagicMock(returncode=0, stdout="[]"),  # epic status (before)
-                MagicMock(returncode=0),  # close
-                MagicMock(returncode=0, stdout="[]"),  # epic status (after)
-            ]
+            # Mock bd operations (beads queries run on worker threads, so
+            # answer by command rather than by call order)
+            def bd_side_effect(*args, check=True):
+                if args[0] == "show":
+                    return MagicMock(
+                        returncode=0,
+                        stdout=json.dumps([{"title": "Test", "status": "in_progress"}]),
+                    )
+                if args[:2] == ("epic", "status"):
+                    return MagicMock(returncode=0, stdout="[]")
+                return MagicMock(returncode=0)  # worktree remove, close
+
+            mock_bd.side_effect = bd_side_effect
 
             result = finish_cmd.run()
 
-            # Result assertions - adjusted for what we're testing
+            assert result.success
             assert result.issue_id == "test-issue"
-            # Note: merged might be True if branch check returns True
+            assert result.issue_title == "Test"
+            assert result.merged
+            assert result.worktree_removed
+            assert result.branch_deleted
+            assert result.issue_closed
+            assert "test-issue" not in finish_cmd._local_branches
+
+    def test_branch_removed_with_worktree(self, finish_cmd):
+        """Test that a branch deleted by the worktree removal counts as deleted."""
+        with patch.object(finish_cmd, "_run_git") as mock_git, \
+             patch.object(finish_cmd, "_run_bd") as mock_bd, \
+             patch.object(MergeLock, "acquire", return_value=True), \
+             patch.object(MergeLock, "release", return_value=True), \
+             patch.object(MergeLock, "is_acquired", True), \
+             patch("builtins.print"):
+
+            mock_git.side_effect = [
+                MagicMock(returncode=0),  # checkout main
+                MagicMock(returncode=0),  # pull
+                MagicMock(returncode=0, stdout="main\ntest-issue\n"),  # for-each-ref
+                MagicMock(returncode=0),  # merge
+                MagicMock(returncode=0),  # push
+                MagicMock(returncode=0),  # checkout --detach
+                MagicMock(returncode=1),  # branch -d
+                MagicMock(returncode=1),  # branch -D
+                MagicMock(returncode=1),  # show-ref
+            ]
+
+            def bd_side_effect(*args, check=True):
+                if args[0] == "show":
+                    return MagicMock(
+                        returncode=0,
+                        stdout=json.dumps([{"title": "Test", "status": "in_progress"}]),
+                    )
+                if args[:2] == ("epic", "status"):
+                    return MagicMock(returncode=0, stdout="[]")
+                return MagicMock(returncode=0)  # worktree remove, close
+
+            mock_bd.side_effect = bd_side_effect
+
+            result = finish_cmd.run()
+
+            assert result.success
+            assert result.branch_deleted
+            assert "test-issue" not in finish_cmd._local_branches
+            mock_git.assert_called_with(
+                "show-ref", "--verify", "--quiet", "refs/heads/test-issue", check=False
+            )
+
+    def test_epics_after_read_following_close(self, finish_cmd):
+        """Test that the post-close epic status is queried after bd close."""
+        calls: list[tuple] = []
+
+        def bd_side_effect(*args, check=True):
+            calls.append(args)
+            if args[0] == "show":
+                return MagicMock(
+                    returncode=0,
+                    stdout=json.dumps([{"title": "Test", "status": "in_progress"}]),
+                )
+            if args[:2] == ("epic", "status"):
+                return MagicMock(returncode=0, stdout="[]")
+            return MagicMock(returncode=0)
+
+        with patch.object(finish_cmd, "_run_git", return_value=MagicMock(returncode=0, stdout="")), \
+             patch.object(finish_cmd, "_run_bd", side_effect=bd_side_effect), \
+             patch.object(finish_cmd, "_emit_event"), \
+             patch.object(MergeLock, "acquire", return_value=True), \
+             patch.object(MergeLock, "release", return_value=True), \
+             patch.object(MergeLock, "is_acquired", True), \
+             patch("builtins.print"):
+            result = finish_cmd.run()
+
+        assert result.success
+        close_index = calls.index(("close", "test-issue"))
+        epic_indexes = [i for i, c in enumerate(calls) if c[:2] == ("epic", "status")]
+        assert len(epic_indexes) == 2
+        assert epic_indexes[0] < close_index < epic_indexes[1]
+
+    def test_standalone_issue_skips_epic_status(self, finish_cmd):
+        """Test that no epic query runs for an issue without a parent epic."""
+        calls: list[tuple] = []
+
+        def bd_side_effect(*args, check=True):
+            calls.append(args)
+            if args[0] == "show":
+                return MagicMock(
+                    returncode=0,
+                    stdout=json.dumps([{
+                        "title": "Test",
+                        "status": "in_progress",
+                        "dependencies": [{"id": "other", "dependency_type": "blocks"}],
+                    }]),
+                )
+            return MagicMock(returncode=0)
+
+        with patch.object(finish_cmd, "_run_git", return_value=MagicMock(returncode=0, stdout="")), \
+             patch.object(finish_cmd, "_run_bd", side_effect=bd_side_effect), \
+             patch.object(finish_cmd, "_emit_event"), \
+             patch.object(MergeLock, "acquire", return_value=True), \
+             patch.object(MergeLock, "release", return_value=True), \
+             patch.object(MergeLock, "is_acquired", True), \
+             patch("builtins.print"):
+            result = finish_cmd.run()
+
+        assert result.success
+        assert result.closed_epics == []
+        assert not [c for c in calls if c[:2] == ("epic", "status")]
+        assert sum(1 for c in calls if c[0] == "show") == 1
+
+    def test_has_epic_parent(self, finish_cmd):
+        """Test parent detection from the bd show record."""
+        cases = [
+            ({"dependencies": []}, False),
+            ({"dependencies": [{"dependency_type": "blocks"}]}, False),
+            ({"dependencies": [{"dependency_type": "parent-child"}]}, True),
+            ({"parent": "epic-1", "dependencies": []}, True),
+            ({}, True),  # No dependency info: assume a parent may exist
+        ]
+        for issue, expected in cases:
+            finish_cmd._bd_cache.clear()
+            with patch.object(
+                finish_cmd, "_run_bd",
+                return_value=MagicMock(returncode=0, stdout=json.dumps([issue])),
+            ):
+                assert finish_cmd._has_epic_parent() is expected, issue
+
+    def test_has_epic_parent_on_bd_failure(self, finish_cmd):
+        """Test that a failed lookup keeps the epic check."""
+        with patch.object(
+            finish_cmd, "_run_bd",
+            side_effect=subprocess.CalledProcessError(1, "bd"),
+        ):
+            assert finish_cmd._has_epic_parent() is True
 
     def test_merge_lock_timeout(self, finish_cmd):
         """Test error when merge lock times out."""
@@ -201,6 +442,38 @@ class TestFinishCommand:
             assert not result.success
             assert "Timeout" in result.error or "lock" in result.error.lower()
 
+    def test_output_flushed_in_one_write(self, finish_cmd):
+        """Test that queued progress messages are written with one call."""
+        finish_cmd._log("one")
+        finish_cmd._log()
+        finish_cmd._log("two")
+
+        with patch("sys.stdout") as mock_stdout:
+            finish_cmd._flush_output()
+            finish_cmd._flush_output()
+
+        mock_stdout.write.assert_called_once_with("one\n\ntwo\n")
+
+    def test_run_flushes_output_before_lock_wait(self, finish_cmd, capsys):
+        """Test that progress is visible before blocking on the lock."""
+        seen_before_acquire = []
+
+        def fake_acquire(holder, on_wait=None):
+            seen_before_acquire.append(capsys.readouterr().out)
+            return False
+
+        with patch.object(finish_cmd, "_run_bd") as mock_bd, \
+             patch.object(MergeLock, "acquire", side_effect=fake_acquire):
+            mock_bd.return_value = MagicMock(
+                returncode=0,
+                stdout=json.dumps([{"title": "Test", "status": "in_progress"}]),
+            )
+            result = finish_cmd.run()
+
+        assert not result.success
+        assert "Acquiring merge lock..." in seen_before_acquire[0]
+        assert finish_cmd._out == []
+
     def test_auto_close_epics(self, finish_cmd):
         """Test auto-closing epics when they become eligible."""
         epics_before = [
@@ -221,6 +494,38 @@ class TestFinishCommand:
             mock_bd.assert_called_with("close", "epic-1", check=False)
 
 
+    def test_auto_close_epics_only_newly_eligible(self, finish_cmd):
+        """Test that only newly eligible epics are closed, in order."""
+        epics_before = [
+            {"epic": {"id": "epic-1", "title": "Epic 1"}, "eligible_for_close": True},
+            {"epic": {"id": "epic-2", "title": "Epic 2"}, "eligible_for_close": False},
+        ]
+        epics_after = [
+            {"epic": {"id": "epic-1", "title": "Epic 1"}, "eligible_for_close": True},
+            {"epic": {"id": "epic-2", "title": "Epic 2"}, "eligible_for_close": True},
+            {"epic": {"id": "epic-3"}, "eligible_for_close": True},
+            {"epic": {"id": "epic-4", "title": "Epic 4"}, "eligible_for_close": False},
+        ]
+
+        def bd_side_effect(*args, check=True):
+            # epic-3 fails to close
+            return MagicMock(returncode=1 if args[1] == "epic-3" else 0)
+
+        with patch.object(finish_cmd, "_run_bd", side_effect=bd_side_effect) as mock_bd, \
+             patch("builtins.print"):
+            closed = finish_cmd._auto_close_epics(epics_before, epics_after)
+
+        assert closed == [("epic-2", "Epic 2")]
+        closed_ids = sorted(c.args[1] for c in mock_bd.call_args_list)
+        assert closed_ids == ["epic-2", "epic-3"]
+
+    def test_auto_close_epics_none_eligible(self, finish_cmd):
+        """Test that no bd calls are made when nothing became eligible."""
+        with patch.object(finish_cmd, "_run_bd") as mock_bd:
+            assert finish_cmd._auto_close_epics([], []) == []
+            mock_bd.assert_not_called()
+
+
 class TestFindMainRepo:
     """Tests for _find_main_repo function."""
 
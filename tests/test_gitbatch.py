@@ -0,0 +1,99 @@
+"""Tests for the persistent git batch helper."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tambour.gitbatch import GitBatch, GitBatchError
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create a git repository with one commit on 'main'."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+
+    def git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q", "-b", "main")
+    (repo / "README").write_text("hello\n")
+    git("add", "README")
+    git("commit", "-q", "-m", "initial")
+    git("branch", "feature")
+    return repo
+
+
+def _batch_supported(repo: Path) -> bool:
+    with GitBatch(repo) as batch:
+        try:
+            batch.contents("HEAD:README")
+        except GitBatchError:
+            return False
+    return True
+
+
+class TestGitBatch:
+    """Tests for GitBatch."""
+
+    def test_contents(self, git_repo):
+        """Test reading blob contents through the session."""
+        if not _batch_supported(git_repo):
+            pytest.skip("git lacks cat-file --batch-command")
+
+        with GitBatch(git_repo) as batch:
+            assert batch.contents("HEAD:README") == b"hello\n"
+            assert batch.contents("HEAD:missing") is None
+            # Session stays usable after a miss
+            assert batch.contents("refs/heads/feature:README") == b"hello\n"
+
+    def test_reuses_single_process(self, git_repo):
+        """Test that multiple queries share one helper process."""
+        if not _batch_supported(git_repo):
+            pytest.skip("git lacks cat-file --batch-command")
+
+        batch = GitBatch(git_repo)
+        try:
+            batch.contents("HEAD:README")
+            proc = batch._proc
+            batch.contents("refs/heads/feature:README")
+            batch.contents("refs/heads/nope:README")
+            assert batch._proc is proc
+        finally:
+            batch.close()
+
+        assert batch._proc is None
+
+    def test_sees_ref_deletion(self, git_repo):
+        """Test that ref changes made by other git processes are visible."""
+        if not _batch_supported(git_repo):
+            pytest.skip("git lacks cat-file --batch-command")
+
+        with GitBatch(git_repo) as batch:
+            assert batch.contents("refs/heads/feature:README") is not None
+            subprocess.run(
+                ["git", "branch", "-D", "feature"],
+                cwd=git_repo,
+                check=True,
+                capture_output=True,
+            )
+            assert batch.contents("refs/heads/feature:README") is None
+
+    def test_not_a_repository_raises(self, tmp_path):
+        """Test that an unusable repository raises GitBatchError."""
+        with GitBatch(tmp_path) as batch:
+            with pytest.raises(GitBatchError):
+                batch.contents("HEAD:README")
+            # Stays broken without respawning
+            with pytest.raises(GitBatchError):
+                batch.contents("HEAD:README")
@@ -1,6 +1,9 @@
 """Tests for the health command."""
 
+import io
 import json
+import os
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -16,6 +19,7 @@ from tambour.__main__ import (
     format_task_health,
     task_health_to_dict,
 )
+from tambour.config import Config
 from tambour.health import HealthChecker, TaskHealth
 
 
@@ -484,15 +488,11 @@ class TestHealthChecker:
 
     @pytest.fixture
     def config(self):
-        config = MagicMock()
-        config.daemon.zombie_threshold = 300
-        config.daemon.auto_recover = False
-        config.worktree.base_path = "../{repo}-worktrees"
-        return config
+        return Config()
 
     def test_check_all_empty(self, config):
         checker = HealthChecker(config)
-        with patch.object(checker, "_get_in_progress_tasks", return_value=[]):
+        with patch.object(checker, "_iter_in_progress_tasks", return_value=[]):
             results = checker.check_all()
             assert results == []
 
@@ -501,7 +501,7 @@ class TestHealthChecker:
         tasks = [
             {"id": "ta-1", "status": "in_progress", "assignee": "a"},
         ]
-        with patch.object(checker, "_get_in_progress_tasks", return_value=tasks), \
+        with patch.object(checker, "_iter_in_progress_tasks", return_value=tasks), \
              patch.object(checker, "_find_worktree", return_value=None):
             results = checker.check_all()
             assert len(results) == 1
@@ -523,6 +523,34 @@ class TestHealthChecker:
             assert result.issue_id == "ta-1"
             assert result.is_zombie
 
+    def test_check_task_status_from_json(self, config):
+        # Parsed strings are distinct objects from the module's literals
+        task = json.loads('{"id": "ta-1", "status": "in_progress", "assignee": "a"}')
+        checker = HealthChecker(config)
+        with patch.object(checker, "_find_worktree", return_value=None):
+            result = checker._check_task(task)
+
+        assert result.is_zombie
+        assert result.status == "in_progress"
+
+    def test_check_task_not_in_progress(self, config):
+        task = json.loads('{"id": "ta-1", "status": "open"}')
+        checker = HealthChecker(config)
+        with patch.object(checker, "_find_worktree", return_value=None):
+            result = checker._check_task(task)
+
+        assert not result.is_zombie
+
+    @pytest.mark.parametrize("status", ["null", "3", '["in_progress"]'])
+    def test_check_task_non_string_status(self, config, status):
+        task = json.loads('{"id": "ta-1", "status": %s}' % status)
+        checker = HealthChecker(config)
+        with patch.object(checker, "_find_worktree", return_value=None):
+            result = checker._check_task(task)
+
+        assert not result.is_zombie
+        assert result.status == ""
+
     @patch("subprocess.run")
     def test_recover_zombie_success(self, mock_run, config):
         mock_run.return_value = MagicMock(returncode=0)
@@ -551,3 +579,326 @@ class TestHealthChecker:
             is_zombie=True,
         )
         assert checker._recover_zombie(health) is False
+
+    @pytest.mark.skipif(not Path("/proc/self/cwd").exists(), reason="requires procfs")
+    def test_process_running_in_worktree_via_proc(self, config, tmp_path, monkeypatch):
+        worktree = tmp_path / "ta-1"
+        worktree.mkdir()
+        idle = tmp_path / "ta-2"
+        idle.mkdir()
+        monkeypatch.chdir(worktree)
+
+        checker = HealthChecker(config)
+        with patch("subprocess.run") as mock_run:
+            assert checker._is_process_running_in_worktree(worktree) is True
+            assert checker._is_process_running_in_worktree(idle) is False
+            mock_run.assert_not_called()
+
+    @pytest.mark.skipif(not Path("/proc/self/cwd").exists(), reason="requires procfs")
+    def test_check_all_scans_proc_once(self, config, tmp_path):
+        for issue_id in ("ta-1", "ta-2"):
+            (tmp_path / issue_id).mkdir()
+        tasks = [
+            {"id": "ta-1", "status": "in_progress", "assignee": "a"},
+            {"id": "ta-2", "status": "in_progress", "assignee": "b"},
+        ]
+
+        checker = HealthChecker(config)
+        real_scandir = os.scandir
+        with patch.object(checker, "_iter_in_progress_tasks", return_value=tasks), \
+             patch.object(checker, "_find_worktree", side_effect=lambda i: tmp_path / i), \
+             patch.object(checker, "_handle_zombie"), \
+             patch("tambour.health.os.scandir", side_effect=real_scandir) as mock_scandir:
+            results = checker.check_all()
+
+        assert len(results) == 2
+        proc_scans = [c for c in mock_scandir.call_args_list if c.args == ("/proc",)]
+        assert len(proc_scans) == 1
+        assert checker._proc_cwds is None
+
+    def test_falls_back_to_lsof_without_proc(self, config, tmp_path):
+        checker = HealthChecker(config)
+        with patch("tambour.health.os.scandir", side_effect=FileNotFoundError), \
+             patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            assert checker._is_process_running_in_worktree(tmp_path) is True
+            assert "lsof" in mock_run.call_args[0][0]
+
+    def test_fresh_heartbeat_is_alive(self, config, tmp_path):
+        (tmp_path / ".tambour").mkdir()
+        now = datetime.now(timezone.utc)
+        (tmp_path / ".tambour" / "heartbeat").write_text(
+            json.dumps({"timestamp": now.isoformat().replace("+00:00", "Z"), "pid": 1})
+        )
+
+        checker = HealthChecker(config)
+        with patch.object(checker, "_is_process_running_in_worktree") as mock_proc:
+            is_alive, last_activity = checker._check_heartbeat(tmp_path)
+
+        assert is_alive is True
+        assert last_activity == now
+        mock_proc.assert_not_called()
+
+    def test_missing_heartbeat_checks_process(self, config, tmp_path):
+        checker = HealthChecker(config)
+        with patch.object(checker, "_is_process_running_in_worktree", return_value=False) as mock_proc:
+            is_alive, last_activity = checker._check_heartbeat(tmp_path)
+
+        assert is_alive is False
+        assert last_activity is None
+        mock_proc.assert_called_once_with(tmp_path)
+
+    def test_stale_heartbeat_uses_reference_time(self, config, tmp_path):
+        (tmp_path / ".tambour").mkdir()
+        (tmp_path / ".tambour" / "heartbeat").write_text(
+            json.dumps({"timestamp": "2024-01-02T03:04:05.000000Z", "pid": 1})
+        )
+        checker = HealthChecker(config)
+
+        early = datetime(2024, 1, 2, 3, 5, 0, tzinfo=timezone.utc)
+        late = datetime(2024, 1, 2, 4, 0, 0, tzinfo=timezone.utc)
+
+        assert checker._check_heartbeat(tmp_path, early)[0] is True
+        assert checker._check_heartbeat(tmp_path, late)[0] is False
+
+    def _fake_bd_list(self, stdout: str, returncode: int = 0) -> MagicMock:
+        proc = MagicMock()
+        proc.stdout = io.StringIO(stdout)
+        proc.returncode = returncode
+        proc.wait.return_value = returncode
+        return proc
+
+    def test_iter_in_progress_tasks_streams_jsonl(self, config):
+        checker = HealthChecker(config)
+        stdout = (
+            json.dumps({"id": "ta-1", "status": "in_progress"}) + "\n"
+            + "\n"
+            + json.dumps({"id": "ta-2", "status": "in_progress"}) + "\n"
+        )
+        with patch("subprocess.Popen", return_value=self._fake_bd_list(stdout)) as mock_popen, \
+             patch.object(checker, "_get_in_progress_tasks") as mock_fallback:
+            tasks = list(checker._iter_in_progress_tasks())
+
+        assert [t["id"] for t in tasks] == ["ta-1", "ta-2"]
+        assert "jsonl" in mock_popen.call_args[0][0]
+        mock_fallback.assert_not_called()
+
+    def test_iter_in_progress_tasks_falls_back_on_json_array(self, config):
+        checker = HealthChecker(config)
+        stdout = json.dumps([{"id": "ta-1", "status": "in_progress"}], indent=2)
+        fallback = [{"id": "ta-1", "status": "in_progress"}]
+        with patch("subprocess.Popen", return_value=self._fake_bd_list(stdout)), \
+             patch.object(checker, "_get_in_progress_tasks", return_value=fallback):
+            tasks = list(checker._iter_in_progress_tasks())
+
+        assert tasks == fallback
+
+    def test_iter_in_progress_tasks_falls_back_on_error(self, config):
+        checker = HealthChecker(config)
+        fallback = [{"id": "ta-1", "status": "in_progress"}]
+        with patch("subprocess.Popen", return_value=self._fake_bd_list("", returncode=1)), \
+             patch.object(checker, "_get_in_progress_tasks", return_value=fallback):
+            tasks = list(checker._iter_in_progress_tasks())
+
+        assert tasks == fallback
+
+    def test_iter_in_progress_tasks_partial_stream_fails_listing(self, config):
+        checker = HealthChecker(config)
+        stdout = json.dumps({"id": "ta-1", "status": "in_progress"}) + "\n"
+        with patch("subprocess.Popen", return_value=self._fake_bd_list(stdout, returncode=1)), \
+             patch.object(checker, "_get_in_progress_tasks") as mock_fallback:
+            tasks = list(checker._iter_in_progress_tasks())
+
+        assert [t["id"] for t in tasks] == ["ta-1"]
+        assert checker._list_failed is True
+        mock_fallback.assert_not_called()
+
+    def test_iter_in_progress_tasks_kills_stalled_bd(self, config, tmp_path):
+        fake_bd = tmp_path / "bd"
+        fake_bd.write_text(
+            "#!/bin/sh\n"
+            "echo '{\"id\": \"ta-1\", \"status\": \"in_progress\"}'\n"
+            "exec sleep 30\n"
+        )
+        fake_bd.chmod(0o755)
+        checker = HealthChecker(config)
+
+        with patch("tambour.health._BD", str(fake_bd)), \
+             patch("tambour.health.BD_TIMEOUT", 0.5), \
+             patch.object(checker, "_get_in_progress_tasks") as mock_fallback:
+            start = time.monotonic()
+            tasks = list(checker._iter_in_progress_tasks())
+            elapsed = time.monotonic() - start
+
+        assert [t["id"] for t in tasks] == ["ta-1"]
+        assert elapsed < 5
+        assert checker._list_failed is True
+        mock_fallback.assert_not_called()
+
+    def test_iter_in_progress_tasks_without_bd(self, config):
+        checker = HealthChecker(config)
+        with patch("subprocess.Popen", side_effect=FileNotFoundError):
+            assert list(checker._iter_in_progress_tasks()) == []
+
+    def test_run_bd_missing_binary(self, config):
+        checker = HealthChecker(config)
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            assert checker._run_bd("list") is None
+            assert checker._get_task("ta-1") is None
+            assert checker._get_in_progress_tasks() == []
+
+    def test_recover_zombie_bd_timeout(self, config):
+        import subprocess
+
+        checker = HealthChecker(config)
+        health = TaskHealth(
+            issue_id="ta-1",
+            status="in_progress",
+            assignee="a",
+            worktree_path=None,
+            worktree_exists=False,
+            is_zombie=True,
+        )
+        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("bd", 10)):
+            assert checker._recover_zombie(health) is False
+
+    def test_find_worktree_uses_precomputed_base(self, config, tmp_path, monkeypatch):
+        repo = tmp_path / "myrepo"
+        repo.mkdir()
+        (tmp_path / "myrepo-worktrees" / "ta-1").mkdir(parents=True)
+        monkeypatch.chdir(repo)
+
+        checker = HealthChecker(config)
+        monkeypatch.chdir(tmp_path)  # Later cwd changes do not matter
+
+        assert checker._find_worktree("ta-1") == tmp_path / "myrepo-worktrees" / "ta-1"
+        assert checker._find_worktree("ta-2") is None
+
+    def test_find_worktree_ignores_plain_files(self, config, tmp_path, monkeypatch):
+        repo = tmp_path / "myrepo"
+        repo.mkdir()
+        base = tmp_path / "myrepo-worktrees"
+        base.mkdir()
+        (base / "ta-1").write_text("")
+        monkeypatch.chdir(repo)
+
+        checker = HealthChecker(config)
+
+        assert checker._find_worktree("ta-1") is None
+        assert checker._find_worktree("ta-1/nested") is None
+
+    def test_check_all_lists_worktrees_once(self, config, tmp_path, monkeypatch):
+        repo = tmp_path / "myrepo"
+        repo.mkdir()
+        base = tmp_path / "myrepo-worktrees"
+        (base / "ta-1").mkdir(parents=True)
+        (base / "not-a-dir").write_text("")
+        monkeypatch.chdir(repo)
+
+        tasks = [
+            {"id": "ta-1", "status": "in_progress", "assignee": "a"},
+            {"id": "ta-2", "status": "in_progress", "assignee": "b"},
+            {"id": "not-a-dir", "status": "in_progress", "assignee": "c"},
+        ]
+        checker = HealthChecker(config)
+        with patch.object(checker, "_iter_in_progress_tasks", return_value=tasks), \
+             patch.object(checker, "_check_heartbeat", return_value=(True, None)), \
+             patch.object(checker, "_handle_zombie"), \
+             patch("os.stat", side_effect=AssertionError("unexpected stat")):
+            results = checker.check_all()
+
+        assert [r.worktree_exists for r in results] == [True, False, False]
+        assert checker._existing_worktrees is None
+
+    def test_check_all_without_worktree_base(self, config, tmp_path, monkeypatch):
+        repo = tmp_path / "myrepo"
+        repo.mkdir()
+        monkeypatch.chdir(repo)
+
+        checker = HealthChecker(config)
+        tasks = [{"id": "ta-1", "status": "in_progress", "assignee": "a"}]
+        with patch.object(checker, "_iter_in_progress_tasks", return_value=tasks), \
+             patch.object(checker, "_handle_zombie"):
+            results = checker.check_all()
+
+        assert results[0].worktree_exists is False
+        assert results[0].is_zombie
+
+    def test_task_list_reused_while_beads_unchanged(self, config, tmp_path, monkeypatch):
+        beads = tmp_path / ".beads"
+        beads.mkdir()
+        (beads / "issues.jsonl").write_text("{}\n")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("BEADS_DIR", raising=False)
+
+        checker = HealthChecker(config)
+        tasks = [{"id": "ta-1", "status": "in_progress", "assignee": "a"}]
+        with patch.object(checker, "_iter_in_progress_tasks", return_value=iter(tasks)) as mock_iter, \
+             patch.object(checker, "_handle_zombie"):
+            first = checker.check_all()
+            second = checker.check_all()
+
+            assert mock_iter.call_count == 1
+            assert [r.issue_id for r in second] == [r.issue_id for r in first] == ["ta-1"]
+
+            (beads / "issues.jsonl").write_text("{}\n{}\n")
+            mock_iter.return_value = iter([])
+            assert checker.check_all() == []
+            assert mock_iter.call_count == 2
+
+    def test_failed_task_list_not_reused(self, config, tmp_path, monkeypatch):
+        (tmp_path / ".beads").mkdir()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("BEADS_DIR", raising=False)
+
+        checker = HealthChecker(config)
+        with patch.object(checker, "_run_bd", return_value=None), \
+             patch("subprocess.Popen", side_effect=FileNotFoundError):
+            checker.check_all()
+            checker.check_all()
+
+        assert checker._task_cache is None
+
+    def test_task_list_not_cached_without_beads_dir(self, config):
+        with patch("tambour.health._find_beads_dir", return_value=None):
+            checker = HealthChecker(config)
+        with patch.object(checker, "_iter_in_progress_tasks", side_effect=lambda: iter([])) as mock_iter:
+            checker.check_all()
+            checker.check_all()
+
+        assert mock_iter.call_count == 2
+
+    def test_unchanged_heartbeat_is_not_reread(self, config, tmp_path):
+        heartbeat = tmp_path / ".tambour" / "heartbeat"
+        heartbeat.parent.mkdir()
+        heartbeat.write_text(json.dumps({"timestamp": "2024-01-02T03:04:05.000000Z", "pid": 1}))
+        checker = HealthChecker(config)
+
+        from tambour import health as health_module
+
+        with patch.object(
+            health_module, "read_heartbeat_bytes", wraps=health_module.read_heartbeat_bytes
+        ) as mock_read:
+            first = checker._read_heartbeat_timestamp(heartbeat)
+            second = checker._read_heartbeat_timestamp(heartbeat)
+            assert mock_read.call_count == 1
+
+            heartbeat.write_text(json.dumps({"timestamp": "2024-01-02T03:09:05.000000Z", "pid": 1}))
+            os.utime(heartbeat, ns=(0, 10**18))
+            third = checker._read_heartbeat_timestamp(heartbeat)
+            assert mock_read.call_count == 2
+
+        assert first == second == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert third == datetime(2024, 1, 2, 3, 9, 5, tzinfo=timezone.utc)
+
+    def test_removed_heartbeat_drops_cache_entry(self, config, tmp_path):
+        heartbeat = tmp_path / ".tambour" / "heartbeat"
+        heartbeat.parent.mkdir()
+        heartbeat.write_text(json.dumps({"timestamp": "2024-01-02T03:04:05.000000Z"}))
+        checker = HealthChecker(config)
+
+        assert checker._read_heartbeat_timestamp(heartbeat) is not None
+        heartbeat.unlink()
+
+        assert checker._read_heartbeat_timestamp(heartbeat) is None
+        assert heartbeat not in checker._heartbeat_cache
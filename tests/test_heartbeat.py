@@ -1,12 +1,21 @@
 """Tests for heartbeat mechanism."""
 
 import json
+import os
+import signal
+import threading
 import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
-from tambour.heartbeat import HeartbeatWriter
+from tambour.heartbeat import (
+    HeartbeatWriter,
+    format_heartbeat_timestamp,
+    parse_heartbeat_timestamp,
+    read_heartbeat_bytes,
+)
 
 
 def test_heartbeat_writer_initialization(tmp_path: Path):
@@ -34,8 +43,47 @@ def test_write_heartbeat(tmp_path: Path):
     assert isinstance(data["pid"], int)
 
 
-@patch("tambour.heartbeat.time.sleep")
-def test_start_loop(mock_sleep: MagicMock, tmp_path: Path):
+def test_write_heartbeat_matches_json_dumps(tmp_path: Path):
+    """Test that the templated payload is what json.dumps would write."""
+    writer = HeartbeatWriter(tmp_path, interval=1)
+    (tmp_path / ".tambour").mkdir()
+
+    writer._write_heartbeat()
+
+    raw = writer.heartbeat_file.read_text()
+    data = json.loads(raw)
+    assert raw == json.dumps(data)
+    assert len(data["timestamp"]) == 27  # Always includes microseconds
+    parse_heartbeat_timestamp(data["timestamp"])
+
+
+def test_write_heartbeat_does_not_fsync(tmp_path: Path):
+    """Test that heartbeats are not forced to disk."""
+    writer = HeartbeatWriter(tmp_path, interval=1)
+    (tmp_path / ".tambour").mkdir()
+
+    with patch("tambour.heartbeat.os.fsync") as mock_fsync:
+        writer._write_heartbeat()
+
+    mock_fsync.assert_not_called()
+    assert writer.heartbeat_file.exists()
+
+
+def test_write_heartbeat_replaces_file(tmp_path: Path):
+    """Test that each heartbeat is renamed into place, not rewritten."""
+    writer = HeartbeatWriter(tmp_path, interval=1)
+    (tmp_path / ".tambour").mkdir()
+    writer.heartbeat_file.write_text("old")
+    old_inode = writer.heartbeat_file.stat().st_ino
+
+    writer._write_heartbeat()
+
+    assert writer.heartbeat_file.stat().st_ino != old_inode
+    assert json.loads(writer.heartbeat_file.read_text())["pid"]
+    assert sorted(p.name for p in (tmp_path / ".tambour").iterdir()) == ["heartbeat"]
+
+
+def test_start_loop(tmp_path: Path):
     """Test the start loop (run once and stop)."""
     writer = HeartbeatWriter(tmp_path, interval=1)
     
@@ -44,10 +92,12 @@ def test_start_loop(mock_sleep: MagicMock, tmp_path: Path):
     
     def side_effect():
         original_write()
-        writer._running = False
+        writer._stop(signal.SIGTERM, None)
         
     # We also need to patch sys.exit to avoid exiting the test
-    with patch.object(writer, "_write_heartbeat", side_effect=side_effect) as mock_write:
+    with patch.object(writer, "_write_heartbeat", side_effect=side_effect) as mock_write, \
+         patch.object(writer, "_wait", wraps=writer._wait) as mock_wait, \
+         patch("signal.signal"):
         with patch("sys.exit"):
             # Patch unlink to prevent deletion so we can verify existence
             with patch("pathlib.Path.unlink") as mock_unlink:
@@ -56,5 +106,134 @@ def test_start_loop(mock_sleep: MagicMock, tmp_path: Path):
     assert writer.heartbeat_file.exists()
     mock_write.assert_called_once()
     mock_unlink.assert_called_once()
-    # Should have slept once
-    mock_sleep.assert_called_once_with(1)
+    # Should have waited once
+    mock_wait.assert_called_once_with(1)
+
+
+def test_signal_interrupts_wait(tmp_path: Path):
+    """Test that SIGTERM stops the loop without waiting out the interval."""
+    writer = HeartbeatWriter(tmp_path, interval=30)
+    previous = signal.getsignal(signal.SIGTERM), signal.getsignal(signal.SIGINT)
+    timer = threading.Timer(0.2, os.kill, (os.getpid(), signal.SIGTERM))
+
+    try:
+        with patch("sys.exit") as mock_exit:
+            timer.start()
+            started = time.monotonic()
+            writer.start()
+            elapsed = time.monotonic() - started
+    finally:
+        timer.cancel()
+        signal.signal(signal.SIGTERM, previous[0])
+        signal.signal(signal.SIGINT, previous[1])
+
+    assert elapsed < 5
+    mock_exit.assert_called_once_with(0)
+    assert not writer.heartbeat_file.exists()
+
+
+
+def test_unrelated_signal_keeps_waiting(tmp_path: Path):
+    """Test that other signals wake the wait but do not end the loop."""
+    writer = HeartbeatWriter(tmp_path, interval=30)
+    previous = [signal.getsignal(sig) for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGUSR1)]
+    signal.signal(signal.SIGUSR1, lambda signum, frame: None)
+    timers = [
+        threading.Timer(0.1, os.kill, (os.getpid(), signal.SIGUSR1)),
+        threading.Timer(0.4, os.kill, (os.getpid(), signal.SIGTERM)),
+    ]
+
+    try:
+        with patch("sys.exit") as mock_exit:
+            for timer in timers:
+                timer.start()
+            started = time.monotonic()
+            writer.start()
+            elapsed = time.monotonic() - started
+    finally:
+        for timer in timers:
+            timer.cancel()
+        for sig, handler in zip((signal.SIGTERM, signal.SIGINT, signal.SIGUSR1), previous):
+            signal.signal(sig, handler)
+
+    assert 0.3 < elapsed < 5
+    mock_exit.assert_called_once_with(0)
+    assert signal.set_wakeup_fd(-1) == -1
+
+def test_read_heartbeat_bytes(tmp_path: Path):
+    """Test reading a heartbeat written by the writer."""
+    writer = HeartbeatWriter(tmp_path, interval=1)
+    (tmp_path / ".tambour").mkdir()
+    writer._write_heartbeat()
+
+    raw = read_heartbeat_bytes(writer.heartbeat_file)
+
+    assert raw is not None
+    assert json.loads(raw) == json.loads(writer.heartbeat_file.read_text())
+
+
+def test_read_heartbeat_bytes_missing(tmp_path: Path):
+    """Test reading a heartbeat file that does not exist."""
+    assert read_heartbeat_bytes(tmp_path / ".tambour" / "heartbeat") is None
+
+
+def test_parse_heartbeat_timestamp_fast_path():
+    """Test parsing the writer's fixed timestamp format."""
+    parsed = parse_heartbeat_timestamp("2024-01-02T03:04:05.123456Z")
+    assert parsed == datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-01-02T03:04:05Z", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+        (
+            "2024-01-02T03:04:05.123456+00:00",
+            datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+        ),
+        (
+            "2024-01-02T05:04:05.000001+02:00",
+            datetime(2024, 1, 2, 5, 4, 5, 1, tzinfo=timezone(timedelta(hours=2))),
+        ),
+    ],
+)
+def test_parse_heartbeat_timestamp_fallback(value, expected):
+    """Test that other ISO-8601 shapes still parse."""
+    assert parse_heartbeat_timestamp(value) == expected
+
+
+def test_parse_heartbeat_timestamp_invalid():
+    """Test that malformed timestamps raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_heartbeat_timestamp("2024-13-02T03:04:05.123456Z")
+    with pytest.raises(ValueError):
+        parse_heartbeat_timestamp("not a timestamp")
+
+
+def test_parse_heartbeat_timestamp_roundtrip(tmp_path: Path):
+    """Test parsing what the writer produces."""
+    writer = HeartbeatWriter(tmp_path, interval=1)
+    (tmp_path / ".tambour").mkdir()
+    writer._write_heartbeat()
+
+    data = json.loads(writer.heartbeat_file.read_text())
+    parsed = parse_heartbeat_timestamp(data["timestamp"])
+
+    assert parsed.tzinfo is not None
+    assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 60
+
+
+def test_format_heartbeat_timestamp():
+    """Test formatting epoch nanoseconds as a heartbeat timestamp."""
+    moment = datetime(2024, 3, 4, 5, 6, 7, 890123, tzinfo=timezone.utc)
+    ns = int(moment.timestamp()) * 1_000_000_000 + 890_123_456
+
+    value = format_heartbeat_timestamp(ns)
+
+    assert value == b"2024-03-04T05:06:07.890123Z"
+    assert parse_heartbeat_timestamp(value.decode()) == moment
+
+
+def test_format_heartbeat_timestamp_whole_second():
+    """Test that whole seconds still carry a microsecond field."""
+    assert format_heartbeat_timestamp(0) == b"1970-01-01T00:00:00.000000Z"
@@ -2,7 +2,7 @@
 
 import argparse
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -38,40 +38,43 @@ class TestInitParsing:
 class TestIsGitRepo:
     """Tests for _is_git_repo."""
 
-    @patch("subprocess.run")
-    def test_returns_true_for_git_repo(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="true\n")
-        assert _is_git_repo(Path("/some/repo")) is True
+    def test_returns_true_for_git_repo(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        assert _is_git_repo(tmp_path) is True
 
-    @patch("subprocess.run")
-    def test_returns_false_for_non_git_dir(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=128, stdout="")
-        assert _is_git_repo(Path("/some/dir")) is False
+    def test_returns_false_for_non_git_dir(self, tmp_path):
+        with patch("tambour.init._get_git_root", return_value=None):
+            assert _is_git_repo(tmp_path) is False
 
     @patch("subprocess.run")
-    def test_passes_directory_as_cwd(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="true\n")
-        _is_git_repo(Path("/my/dir"))
-        mock_run.assert_called_once_with(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            capture_output=True,
-            text=True,
-            cwd=Path("/my/dir"),
-        )
+    def test_does_not_run_git(self, mock_run, tmp_path):
+        (tmp_path / ".git").mkdir()
+        _is_git_repo(tmp_path)
+        mock_run.assert_not_called()
 
 
 class TestGetGitRoot:
     """Tests for _get_git_root."""
 
-    @patch("subprocess.run")
-    def test_returns_git_root_path(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="/my/repo\n")
-        assert _get_git_root(Path("/my/repo/sub")) == Path("/my/repo")
-
-    @patch("subprocess.run")
-    def test_returns_none_on_failure(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=128, stdout="")
-        assert _get_git_root(Path("/not/a/repo")) is None
+    def test_returns_git_root_path(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        sub = tmp_path / "sub" / "dir"
+        sub.mkdir(parents=True)
+        assert _get_git_root(sub) == tmp_path
+
+    def test_linked_worktree_git_file(self, tmp_path):
+        (tmp_path / ".git").write_text("gitdir: /elsewhere/.git/worktrees/wt\n")
+        assert _get_git_root(tmp_path) == tmp_path
+
+    def test_nearest_repository_wins(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        inner = tmp_path / "vendor" / "lib"
+        (inner / ".git").mkdir(parents=True)
+        assert _get_git_root(inner) == inner
+
+    def test_returns_none_outside_repository(self, tmp_path):
+        with patch.object(Path, "exists", return_value=False):
+            assert _get_git_root(tmp_path / "not" / "a" / "repo") is None
 
 
 class TestInitTambour:
@@ -0,0 +1,59 @@
+"""Tests for the JSON shim."""
+
+import importlib
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from tambour import _json
+
+
+class TestLoads:
+    """Tests for tambour._json.loads."""
+
+    def test_loads_str_and_bytes(self):
+        """Test decoding from both str and bytes input."""
+        assert _json.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+        assert _json.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_decode_error_is_json_decode_error(self):
+        """Test that invalid input raises a catchable JSONDecodeError."""
+        with pytest.raises(_json.JSONDecodeError):
+            _json.loads("{not json")
+
+    def test_stdlib_fallback(self):
+        """Test that the stdlib decoder is used when orjson is missing."""
+        import json
+
+        with patch.dict(sys.modules, {"orjson": None}):
+            fallback = importlib.reload(_json)
+            try:
+                assert fallback.loads is json.loads
+                assert fallback.loads(b"[1]") == [1]
+            finally:
+                importlib.reload(_json)
+
+
+class TestDumps:
+    """Tests for tambour._json.dumps."""
+
+    def test_round_trip(self):
+        """Test that dumps output decodes back to the same object."""
+        data = {"path": "/src/ünï.py", "count": 3, "rate": 1.5, "tags": [None, True]}
+        assert _json.loads(_json.dumps(data)) == data
+        assert _json.loads(_json.dumps(data, indent=True)) == data
+
+    def test_indent(self):
+        """Test that indent pretty-prints with two spaces."""
+        assert _json.dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+
+    def test_stdlib_fallback(self):
+        """Test that dumps works without orjson."""
+        with patch.dict(sys.modules, {"orjson": None}):
+            fallback = importlib.reload(_json)
+            try:
+                assert fallback.dumps({"a": [1]}, indent=True) == b'{\n  "a": [\n    1\n  ]\n}'
+                assert fallback.loads(fallback.dumps({"a": 1})) == {"a": 1}
+            finally:
+                importlib.reload(_json)
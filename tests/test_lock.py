@@ -1,12 +1,16 @@
 """Tests for distributed merge lock."""
 
+import itertools
 import json
+import shutil
+import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 
 import pytest
 
+from tambour.gitbatch import GitBatchError
 from tambour.lock import (
     LOCK_REF,
     LockMetadata,
@@ -51,6 +55,34 @@ class TestLockMetadata:
         assert metadata.host == "test-host"
         assert metadata.pid == 99999
 
+    def test_to_json_matches_to_dict(self):
+        """Test that the compact JSON carries the same fields as to_dict."""
+        metadata = LockMetadata(
+            holder='bobbin-"quoted"',
+            acquired_at=datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc),
+            host="agent-host",
+            pid=12345,
+        )
+
+        payload = metadata.to_json()
+
+        assert "\n" not in payload
+        assert json.loads(payload) == metadata.to_dict()
+        assert LockMetadata.from_json(payload) == metadata
+
+    def test_from_json_accepts_indented_blob(self):
+        """Test that locks written by older versions still parse."""
+        data = {
+            "holder": "bobbin-abc",
+            "acquired_at": "2024-01-15T10:30:00+00:00",
+            "host": "test-host",
+            "pid": 99999,
+        }
+
+        metadata = LockMetadata.from_json(json.dumps(data, indent=2).encode())
+
+        assert metadata == LockMetadata.from_dict(data)
+
 
 class TestLockStatus:
     """Tests for LockStatus dataclass."""
@@ -90,16 +122,21 @@ class TestMergeLock:
     def test_status_free(self, lock):
         """Test status when lock is free."""
         with patch.object(lock, "_run_git") as mock_git:
-            # fetch returns non-zero when ref doesn't exist
-            mock_git.return_value = MagicMock(returncode=128)
+            # ls-remote prints nothing when the ref doesn't exist
+            mock_git.return_value = MagicMock(returncode=0, stdout="")
 
             status = lock.status()
 
             assert not status.held
-            mock_git.assert_called_once_with("fetch", "origin", LOCK_REF, check=False)
+            mock_git.assert_called_once_with("ls-remote", "origin", LOCK_REF, check=False)
+
+    def test_status_remote_unreachable(self, lock):
+        """Test that an unreachable remote reports the lock as free."""
+        with patch.object(lock, "_run_git", return_value=MagicMock(returncode=128, stdout="")):
+            assert not lock.status().held
 
     def test_status_held_with_metadata(self, lock):
-        """Test status when lock is held."""
+        """Test status when lock is held and the commit is already local."""
         lock_data = {
             "holder": "bobbin-xyz",
             "acquired_at": "2024-01-15T10:30:00+00:00",
@@ -107,28 +144,66 @@ class TestMergeLock:
             "pid": 12345,
         }
 
-        with patch.object(lock, "_run_git") as mock_git:
-            # Mock the git commands
-            mock_git.side_effect = [
-                MagicMock(returncode=0),  # fetch succeeds
-                MagicMock(returncode=0, stdout="commit ..."),  # cat-file
-                MagicMock(returncode=0, stdout="100644 blob abc123\tlock.json"),  # ls-tree
-                MagicMock(returncode=0, stdout=json.dumps(lock_data)),  # cat-file blob
-            ]
+        with patch.object(lock, "_run_git") as mock_git, \
+             patch.object(lock._batch, "contents", return_value=json.dumps(lock_data).encode()) as mock_contents:
+            mock_git.return_value = MagicMock(returncode=0, stdout=f"abc123\t{LOCK_REF}\n")
 
             status = lock.status()
 
             assert status.held
             assert status.holder == "bobbin-xyz"
+            # No fetch needed when the lock commit is already local
+            mock_git.assert_called_once_with("ls-remote", "origin", LOCK_REF, check=False)
+            mock_contents.assert_called_once_with("abc123:lock.json")
+
+    def test_status_fetches_unknown_commit(self, lock):
+        """Test that a lock commit missing locally is fetched once."""
+        lock_data = {
+            "holder": "bobbin-new",
+            "acquired_at": "2024-01-15T10:30:00+00:00",
+            "host": "test-host",
+            "pid": 1,
+        }
+
+        with patch.object(lock, "_run_git") as mock_git, \
+             patch.object(lock._batch, "contents", side_effect=[None, json.dumps(lock_data).encode()]):
+            mock_git.side_effect = [
+                MagicMock(returncode=0, stdout=f"def456\t{LOCK_REF}\n"),  # ls-remote
+                MagicMock(returncode=0),  # fetch
+            ]
+
+            status = lock.status()
+
+        assert status.holder == "bobbin-new"
+        assert mock_git.call_args_list[1] == call("fetch", "origin", LOCK_REF, check=False)
+
+    def test_status_without_batch_helper(self, lock):
+        """Test the cat-file fallback when the batch helper is unavailable."""
+        lock_data = {
+            "holder": "bobbin-old-git",
+            "acquired_at": "2024-01-15T10:30:00+00:00",
+            "host": "test-host",
+            "pid": 1,
+        }
+
+        with patch.object(lock, "_run_git") as mock_git, \
+             patch.object(lock._batch, "contents", side_effect=GitBatchError("unavailable")):
+            mock_git.side_effect = [
+                MagicMock(returncode=0, stdout=f"abc123\t{LOCK_REF}\n"),  # ls-remote
+                MagicMock(returncode=0, stdout=json.dumps(lock_data)),  # cat-file
+            ]
+
+            status = lock.status()
+
+        assert status.holder == "bobbin-old-git"
+        assert mock_git.call_args_list[1] == call("cat-file", "blob", "abc123:lock.json", check=False)
 
     def test_acquire_success(self, lock):
         """Test successful lock acquisition."""
         with patch("subprocess.run") as mock_run:
             # Mock successful git operations
             mock_run.side_effect = [
-                MagicMock(returncode=0, stdout="abc123"),  # hash-object
-                MagicMock(returncode=0, stdout="tree123"),  # mktree
-                MagicMock(returncode=0, stdout="commit123"),  # commit-tree
+                MagicMock(returncode=0, stdout=b"commit123\n"),  # fast-import
                 MagicMock(returncode=0),  # push (success)
             ]
 
@@ -142,12 +217,8 @@ class TestMergeLock:
         def mock_subprocess(*args, **kwargs):
             """Mock that simulates push always failing."""
             cmd = args[0] if args else kwargs.get("args", [])
-            if "hash-object" in cmd:
-                return MagicMock(returncode=0, stdout="abc123\n")
-            elif "mktree" in cmd:
-                return MagicMock(returncode=0, stdout="tree123\n")
-            elif "commit-tree" in cmd:
-                return MagicMock(returncode=0, stdout="commit123\n")
+            if "fast-import" in cmd:
+                return MagicMock(returncode=0, stdout=b"commit123\n")
             elif "push" in cmd:
                 return MagicMock(returncode=128, stderr="error: failed to push")
             else:
@@ -163,6 +234,101 @@ class TestMergeLock:
             assert result is False
             assert not lock.is_acquired
 
+    def test_acquire_reports_wait_via_callback(self, lock):
+        """Test that on_wait receives the current holder while waiting."""
+        def mock_subprocess(*args, **kwargs):
+            cmd = args[0] if args else kwargs.get("args", [])
+            if "fast-import" in cmd:
+                return MagicMock(returncode=0, stdout=b"commit123\n")
+            return MagicMock(returncode=0)
+
+        push_results = iter([MagicMock(returncode=1), MagicMock(returncode=0)])
+        waits: list[str] = []
+
+        with patch("subprocess.run", side_effect=mock_subprocess), \
+             patch.object(lock, "_run_git", side_effect=lambda *a, **k: next(push_results)), \
+             patch.object(lock, "status", return_value=LockStatus(held=True)), \
+             patch("time.sleep"), \
+             patch("builtins.print") as mock_print:
+            result = lock.acquire("bobbin-test", on_wait=waits.append)
+
+        assert result is True
+        assert waits == ["unknown"]
+        mock_print.assert_not_called()
+
+    def test_acquire_builds_commit_once(self, lock):
+        """Test that retries only re-push the same lock commit."""
+        with patch.object(lock, "_create_lock_commit", return_value="commit123") as mock_create, \
+             patch.object(lock, "_run_git") as mock_git, \
+             patch.object(lock, "status", return_value=LockStatus(held=True)), \
+             patch("time.sleep"):
+            mock_git.side_effect = [
+                MagicMock(returncode=1),  # push rejected
+                MagicMock(returncode=1),  # push rejected
+                MagicMock(returncode=0),  # push accepted
+            ]
+            result = lock.acquire("bobbin-test", on_wait=lambda holder: None)
+
+        assert result is True
+        mock_create.assert_called_once()
+        assert mock_git.call_args_list == [
+            call("push", "origin", f"commit123:{LOCK_REF}", check=False)
+        ] * 3
+
+    def test_acquire_backs_off_and_resets_on_new_holder(self, mock_repo):
+        """Test exponential backoff that restarts when the holder changes."""
+        lock = MergeLock(mock_repo, timeout=1000)
+        holders = iter(["a", "a", "a", "b", "b"])
+        pushes = iter([MagicMock(returncode=1)] * 5 + [MagicMock(returncode=0)])
+
+        with patch.object(lock, "_create_lock_commit", return_value="commit123"), \
+             patch.object(lock, "_run_git", side_effect=lambda *a, **k: next(pushes)), \
+             patch.object(lock, "status", side_effect=lambda: LockStatus(
+                 held=True,
+                 metadata=LockMetadata(next(holders), datetime.now(timezone.utc), "h", 1),
+             )), \
+             patch("tambour.lock.random.uniform", return_value=1.0), \
+             patch("time.monotonic", side_effect=itertools.count(step=30)), \
+             patch("time.sleep") as mock_sleep:
+            assert lock.acquire("me", on_wait=lambda holder: None)
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == pytest.approx([5, 7.5, 11.25, 5, 7.5])
+
+    def test_acquire_backoff_is_capped(self, mock_repo):
+        """Test that the delay never exceeds the maximum poll interval."""
+        lock = MergeLock(mock_repo, timeout=10_000)
+        pushes = iter([MagicMock(returncode=1)] * 12 + [MagicMock(returncode=0)])
+
+        with patch.object(lock, "_create_lock_commit", return_value="commit123"), \
+             patch.object(lock, "_run_git", side_effect=lambda *a, **k: next(pushes)), \
+             patch.object(lock, "status", return_value=LockStatus(held=True)), \
+             patch("tambour.lock.random.uniform", return_value=1.0), \
+             patch("time.sleep") as mock_sleep:
+            assert lock.acquire("me", on_wait=lambda holder: None)
+
+        assert max(c.args[0] for c in mock_sleep.call_args_list) == 60
+
+    def test_acquire_rate_limits_holder_lookup(self, mock_repo):
+        """Test that the holder is looked up at most every refresh interval."""
+        lock = MergeLock(mock_repo, timeout=1000)
+        pushes = iter([MagicMock(returncode=1)] * 4 + [MagicMock(returncode=0)])
+        waits: list[str] = []
+
+        with patch.object(lock, "_create_lock_commit", return_value="commit123"), \
+             patch.object(lock, "_run_git", side_effect=lambda *a, **k: next(pushes)), \
+             patch.object(lock, "status", return_value=LockStatus(
+                 held=True,
+                 metadata=LockMetadata("other", datetime.now(timezone.utc), "h", 1),
+             )) as mock_status, \
+             patch("time.monotonic", side_effect=[0, 10, 20, 31]), \
+             patch("time.sleep"):
+            assert lock.acquire("me", on_wait=waits.append)
+
+        # Looked up on the first rejection and again once 30s had passed
+        assert mock_status.call_count == 2
+        assert waits == ["other"] * 4
+
     def test_release_success(self, lock):
         """Test successful lock release."""
         lock._acquired = True
@@ -230,3 +396,61 @@ class TestMergeLock:
                 pass
 
             mock_release.assert_called_once_with("bobbin-test")
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestMergeLockWithGit:
+    """End-to-end tests against a local bare remote."""
+
+    @pytest.fixture
+    def clones(self, tmp_path):
+        """Create a bare remote and two clones of it."""
+        def git(*args, cwd=tmp_path):
+            subprocess.run(
+                ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                cwd=cwd, check=True, capture_output=True,
+            )
+
+        git("init", "-q", "--bare", "remote.git")
+        git("clone", "-q", "remote.git", "a")
+        git("clone", "-q", "remote.git", "b")
+        for name in ("a", "b"):
+            git("config", "user.name", "test", cwd=tmp_path / name)
+            git("config", "user.email", "test@example.com", cwd=tmp_path / name)
+        return tmp_path / "a", tmp_path / "b"
+
+    def test_status_sees_other_clones_lock(self, clones):
+        """Test acquiring in one clone and reading the holder from another."""
+        a, b = clones
+        with MergeLock(a, timeout=5) as lock_a, MergeLock(b, timeout=5) as lock_b:
+            assert not lock_b.status().held
+            assert lock_a.acquire("bobbin-a")
+
+            status = lock_b.status()
+            assert status.held
+            assert status.holder == "bobbin-a"
+            # Second poll reads the now-local commit without fetching
+            with patch.object(lock_b, "_run_git", wraps=lock_b._run_git) as spy:
+                assert lock_b.status().holder == "bobbin-a"
+            assert [c.args[0] for c in spy.call_args_list] == ["ls-remote"]
+
+            assert lock_a.release("bobbin-a")
+            assert not lock_b.status().held
+
+    def test_lock_commit_leaves_no_local_ref(self, clones):
+        """Test that building the lock commit writes no ref in the clone."""
+        a, _ = clones
+        with MergeLock(a, timeout=5) as lock:
+            sha = lock._create_lock_commit("bobbin-a", '{"holder": "bobbin-a"}')
+
+            blob = subprocess.run(
+                ["git", "-C", str(a), "cat-file", "blob", f"{sha}:lock.json"],
+                capture_output=True, text=True, check=True,
+            )
+            refs = subprocess.run(
+                ["git", "-C", str(a), "for-each-ref", "refs/tambour"],
+                capture_output=True, text=True, check=True,
+            )
+
+        assert blob.stdout == '{"holder": "bobbin-a"}'
+        assert refs.stdout == ""
@@ -116,6 +116,14 @@ class TestExtractors:
         assert result["command_prefix"] == "git"
         assert result["description"] == "Check git status"
 
+    def test_extract_bash_fields_multiline_command(self):
+        """Test that only the first token of a long multi-line command is kept."""
+        tool_input = {"command": "\n\t cat <<'EOF' > out.txt\n" + "line\n" * 1000 + "EOF"}
+
+        result = extract_bash_fields(tool_input)
+
+        assert result["command_prefix"] == "cat"
+
     def test_extract_bash_fields_empty_command(self):
         """Test Bash extraction with empty command."""
         tool_input = {"command": "", "description": "Nothing"}
@@ -181,6 +189,20 @@ class TestExtractors:
         assert len(result["large_field"]) == 203  # 200 + "..."
         assert result["large_field"].endswith("...")
 
+    def test_extract_tool_fields_copies_only_when_truncating(self):
+        """Test that inputs are copied only along the path that gets truncated."""
+        small = {"a": "short", "n": 1, "nested": {"b": "ok"}}
+        assert extract_tool_fields("UnknownTool", small) is small
+
+        tool_input = {"keep": {"b": "ok"}, "trim": {"big": "y" * 300}, "n": 1}
+        result = extract_tool_fields("UnknownTool", tool_input)
+
+        assert result is not tool_input
+        assert result["keep"] is tool_input["keep"]
+        assert result["trim"]["big"] == "y" * 200 + "..."
+        assert tool_input["trim"]["big"] == "y" * 300
+        assert result["n"] == 1
+
 
 class TestMetricEvent:
     """Tests for MetricEvent dataclass."""
@@ -240,6 +262,11 @@ class TestMetricEvent:
         assert "output" not in parsed
         assert "issue_id" not in parsed
 
+    def test_metric_event_is_slotted(self):
+        """Test that MetricEvent carries no per-instance __dict__."""
+        event = MetricEvent(timestamp="t", session_id="s", tool="Read", input={})
+        assert not hasattr(event, "__dict__")
+
     def test_metric_event_to_json_with_error(self):
         """Test JSON serialization includes error field."""
         event = MetricEvent(
@@ -255,6 +282,24 @@ class TestMetricEvent:
 
         assert parsed["error"] == "old_string not found"
 
+    def test_metric_event_to_json_matches_compact_dumps(self):
+        """Test that to_json matches compact json.dumps of the non-None fields."""
+        from dataclasses import asdict
+
+        event = MetricEvent(
+            timestamp="2026-01-05T10:30:00Z",
+            session_id="sess_\u00e9\"1",
+            tool="Edit",
+            input={"file_path": "/path/ünï.py", "nested": {"a": [1, None]}},
+            output={"success": False},
+            issue_id="bobbin-xyz",
+            worktree="/path/to/worktree",
+            error="line\nbreak",
+        )
+        for ev in (event, MetricEvent(timestamp="t", session_id="s", tool="Read", input={})):
+            expected = {k: v for k, v in asdict(ev).items() if v is not None}
+            assert ev.to_json() == json.dumps(expected, separators=(",", ":"))
+
 
 class TestMetricsCollector:
     """Tests for MetricsCollector class."""
@@ -341,6 +386,33 @@ class TestMetricsCollector:
         assert event.session_id == "sess_test"
         assert event.issue_id == "bobbin-xyz"
 
+    def test_collect_from_env_json_fields(self, tmp_path):
+        """Test TAMBOUR_TOOL_INPUT/OUTPUT decoding, including empty and invalid values."""
+        collector = MetricsCollector(storage_path=tmp_path / "metrics.jsonl")
+        base = {
+            "TAMBOUR_EVENT": "tool.used",
+            "TAMBOUR_TOOL_NAME": "Read",
+            "TAMBOUR_FILE_PATH": "/from/env.py",
+            "TAMBOUR_SUCCESS": "false",
+        }
+
+        env = dict(
+            base,
+            TAMBOUR_TOOL_INPUT='{"file_path": "/from/json.py"}',
+            TAMBOUR_TOOL_OUTPUT='{"success": true}',
+        )
+        with patch.dict(os.environ, env, clear=False):
+            event = collector.collect_from_env()
+        assert event.input["file_path"] == "/from/json.py"
+        assert event.output == {"success": True}
+
+        for raw in ("{}", "", "{not json"):
+            env = dict(base, TAMBOUR_TOOL_INPUT=raw, TAMBOUR_TOOL_OUTPUT=raw)
+            with patch.dict(os.environ, env, clear=False):
+                event = collector.collect_from_env()
+            assert event.input["file_path"] == "/from/env.py"
+            assert event.output == {"success": False}
+
     def test_collect_from_env_missing_tool_name(self, tmp_path):
         """Test that collection fails gracefully without tool name."""
         collector = MetricsCollector(storage_path=tmp_path / "metrics.jsonl")
@@ -8,6 +8,7 @@ from argparse import Namespace
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from io import StringIO
+from unittest.mock import patch
 
 import pytest
 
@@ -22,6 +23,7 @@ from tambour.metrics.cli import (
     format_number,
     format_percent,
     format_duration,
+    format_timestamp,
 )
 
 
@@ -106,6 +108,14 @@ class TestFormatHelpers:
     def test_format_duration_invalid(self):
         """Test duration formatting with invalid timestamps."""
         assert format_duration("invalid", "invalid") == "N/A"
+        # Naive and aware timestamps cannot be subtracted
+        assert format_duration("2026-01-01T00:00:00", "2026-01-01T00:05:00Z") == "N/A"
+
+    def test_format_timestamp(self):
+        """Test timestamp formatting falls back to the raw string."""
+        assert format_timestamp("2026-01-05T10:30:45.123Z") == "2026-01-05 10:30"
+        assert format_timestamp("2026-01-05T10:30:45+02:00") == "2026-01-05 10:30"
+        assert format_timestamp("yesterday") == "yesterday"
 
 
 class TestMetricsShow:
@@ -517,6 +527,71 @@ class TestMetricsClear:
         assert len(lines) == 1
         assert "/recent/file.py" in lines[0]
 
+    def test_clear_timestamp_formats(self, tmp_path, capsys):
+        """Test that collector lines, other layouts and odd timestamps are judged alike."""
+        from tambour.metrics.collector import MetricEvent
+
+        metrics_path = tmp_path / ".tambour" / "metrics.jsonl"
+        metrics_path.parent.mkdir(parents=True)
+        now = datetime.now(timezone.utc)
+        old = now - timedelta(days=60)
+        recent = now - timedelta(days=5)
+
+        lines = [
+            MetricEvent(timestamp=old.isoformat(), session_id="s", tool="Read", input={}).to_json(),
+            MetricEvent(timestamp=recent.isoformat(), session_id="s", tool="Read", input={}).to_json(),
+            json.dumps(make_event("Edit", timestamp=old.strftime("%Y-%m-%dT%H:%M:%SZ"))),
+            json.dumps(make_event("Edit", timestamp=(old + timedelta(hours=2)).astimezone(
+                timezone(timedelta(hours=2))).isoformat())),
+            json.dumps(make_event("Bash", timestamp="2020-01-01T00:00:00")),  # naive
+            "not json",
+        ]
+        metrics_path.write_text("\n".join(lines) + "\n")
+
+        args = Namespace(older_than=30, dry_run=False, storage=str(metrics_path))
+
+        assert cmd_metrics_clear(args) == 0
+        assert "Removed 3 events" in capsys.readouterr().out
+        assert metrics_path.read_text().splitlines() == [lines[1], lines[4], lines[5]]
+
+    def test_clear_replaces_file_without_leftovers(self, tmp_path, capsys):
+        """Test that kept events are streamed to a temp file renamed over the log."""
+        metrics_path = tmp_path / ".tambour" / "metrics.jsonl"
+        now = datetime.now(timezone.utc)
+        events = [
+            make_event("Read", file_path=f"/f{i}.py", timestamp=(now - timedelta(days=i * 20)).isoformat())
+            for i in range(4)
+        ]
+        create_metrics_file(metrics_path, events)
+        original_inode = metrics_path.stat().st_ino
+
+        for dry_run in (True, False):
+            args = Namespace(older_than=30, dry_run=dry_run, storage=str(metrics_path))
+            assert cmd_metrics_clear(args) == 0
+            assert [p.name for p in metrics_path.parent.iterdir()] == ["metrics.jsonl"]
+
+        assert "Would keep 2 events" in capsys.readouterr().out
+        assert metrics_path.stat().st_ino != original_inode
+        assert [json.loads(line)["input"]["file_path"] for line in metrics_path.read_text().splitlines()] == [
+            "/f0.py",
+            "/f1.py",
+        ]
+
+    def test_clear_write_failure_keeps_log(self, tmp_path, capsys):
+        """Test that a failed rewrite leaves metrics.jsonl untouched."""
+        metrics_path = tmp_path / ".tambour" / "metrics.jsonl"
+        old = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
+        create_metrics_file(metrics_path, [make_event("Read", timestamp=old)])
+        before = metrics_path.read_bytes()
+
+        args = Namespace(older_than=30, dry_run=False, storage=str(metrics_path))
+        with patch("os.replace", side_effect=OSError("disk full")):
+            assert cmd_metrics_clear(args) == 1
+
+        assert "Error writing metrics file" in capsys.readouterr().err
+        assert metrics_path.read_bytes() == before
+        assert [p.name for p in metrics_path.parent.iterdir()] == ["metrics.jsonl"]
+
     def test_clear_nothing_to_remove(self, tmp_path, capsys):
         """Test clear when no old events exist."""
         metrics_path = tmp_path / ".tambour" / "metrics.jsonl"
@@ -558,6 +633,24 @@ class TestMetricsClear:
         assert "Cleared aggregation cache" in captured.out
         assert not cache_path.exists()
 
+    def test_clear_invalidates_binary_cache(self, tmp_path, capsys):
+        """Test clear also removes the MessagePack cache."""
+        metrics_path = tmp_path / ".tambour" / "metrics.jsonl"
+        cache_path = tmp_path / ".tambour" / "metrics-agg.msgpack"
+
+        now = datetime.now(timezone.utc)
+        old = (now - timedelta(days=60)).isoformat()
+
+        events = [make_event("Read", file_path="/old/file.py", timestamp=old)]
+        create_metrics_file(metrics_path, events)
+        cache_path.write_bytes(b"\x80")
+
+        args = Namespace(older_than=30, dry_run=False, storage=str(metrics_path))
+
+        assert cmd_metrics_clear(args) == 0
+        assert "Cleared aggregation cache" in capsys.readouterr().out
+        assert not cache_path.exists()
+
 
 class TestMetricsRefresh:
     """Tests for 'metrics refresh' command."""
@@ -597,6 +690,36 @@ class TestMetricsRefresh:
         assert "Sessions: 2" in captured.out
 
 
+class TestComputeMemo:
+    """Tests for reusing aggregations across subcommands in one process."""
+
+    def test_subcommands_share_result(self, tmp_path, capsys):
+        """Test that back-to-back subcommands compute once until the log changes."""
+        from tambour.metrics import cli
+
+        metrics_path = tmp_path / ".tambour" / "metrics.jsonl"
+        create_metrics_file(metrics_path, [make_event("Read", file_path="/a.py")] * 6)
+        args = Namespace(window=7, threshold=5, limit=20, storage=str(metrics_path))
+
+        with patch.object(cli, "compute", wraps=cli.compute) as compute:
+            assert cmd_metrics_show(args) == 0
+            assert cmd_metrics_hot_files(args) == 0
+            assert compute.call_count == 1
+
+            with open(metrics_path, "a") as f:
+                f.write(json.dumps(make_event("Read", file_path="/b.py")) + "\n")
+            assert cmd_metrics_show(args) == 0
+            assert compute.call_count == 2
+
+            assert cmd_metrics_refresh(args) == 0
+            assert cmd_metrics_show(args) == 0
+            assert compute.call_count == 4
+
+        out = capsys.readouterr().out
+        assert "6 reads  /a.py" in out
+        assert "Events collected: 7" in out
+
+
 class TestCLIIntegration:
     """Integration tests for the CLI through __main__."""
 
@@ -0,0 +1,157 @@
+"""Tests for the SessionStart session note hook."""
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tambour.hooks.session_note import get_issue_title, infer_issue_id, write_session_note
+
+
+def _make_repo(path: Path, head: str) -> None:
+    (path / ".git").mkdir(parents=True)
+    (path / ".git" / "HEAD").write_text(head + "\n")
+
+
+class TestInferIssueId:
+    """Tests for infer_issue_id."""
+
+    def test_worktree_path(self):
+        """Test extraction from a worktree path."""
+        assert infer_issue_id("/home/user/bobbin-worktrees/bobbin-abc") == "bobbin-abc"
+
+    def test_directory_name(self, tmp_path):
+        """Test a directory named like an issue."""
+        assert infer_issue_id(str(tmp_path / "proj-123")) == "proj-123"
+
+    def test_branch_from_head(self, tmp_path):
+        """Test that the branch is read from .git/HEAD."""
+        repo = tmp_path / "repo"
+        _make_repo(repo, "ref: refs/heads/feature-abc.sub1")
+
+        with patch("subprocess.run") as mock_run:
+            assert infer_issue_id(str(repo)) == "feature-abc.sub1"
+            mock_run.assert_not_called()
+
+    def test_branch_from_subdirectory(self, tmp_path):
+        """Test that HEAD is found from a subdirectory of the repository."""
+        repo = tmp_path / "repo"
+        _make_repo(repo, "ref: refs/heads/bobbin-xyz")
+        (repo / "src").mkdir()
+
+        assert infer_issue_id(str(repo / "src")) == "bobbin-xyz"
+
+    def test_branch_from_linked_worktree(self, tmp_path):
+        """Test a worktree whose .git is a gitdir file."""
+        git_dir = tmp_path / "main" / ".git" / "worktrees" / "wt"
+        git_dir.mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/bobbin-wt\n")
+        worktree = tmp_path / "checkout"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {git_dir}\n")
+
+        assert infer_issue_id(str(worktree)) == "bobbin-wt"
+
+    @pytest.mark.parametrize("head", [
+        "ref: refs/heads/main",
+        "0123456789abcdef0123456789abcdef01234567",  # detached
+    ])
+    def test_non_issue_head(self, tmp_path, head):
+        """Test that non-issue branches and detached HEADs give None."""
+        repo = tmp_path / "repo"
+        _make_repo(repo, head)
+
+        assert infer_issue_id(str(repo)) is None
+
+    def test_not_a_repository(self, tmp_path):
+        """Test a plain directory outside any repository."""
+        plain = tmp_path / "plain"
+        plain.mkdir()
+
+        assert infer_issue_id(str(plain)) is None
+
+
+class TestGetIssueTitle:
+    """Tests for get_issue_title and its cache."""
+
+    @pytest.fixture
+    def cache_file(self, tmp_path):
+        cache = tmp_path / "title_cache.json"
+        with patch("tambour.hooks.session_note._TITLE_CACHE", cache):
+            yield cache
+
+    def _bd_result(self, title):
+        return MagicMock(returncode=0, stdout=json.dumps([{"title": title}]))
+
+    def test_miss_queries_beads_and_caches(self, cache_file):
+        """Test that a cache miss runs bd and stores the title."""
+        with patch("subprocess.run", return_value=self._bd_result("Fix the thing")) as mock_run:
+            assert get_issue_title("bd-1") == "Fix the thing"
+            assert get_issue_title("bd-1") == "Fix the thing"
+
+        mock_run.assert_called_once()
+        assert json.loads(cache_file.read_text())["bd-1"]["title"] == "Fix the thing"
+
+    def test_expired_entry_is_refreshed(self, cache_file):
+        """Test that entries older than the TTL are fetched again."""
+        cache_file.write_text(json.dumps({
+            "bd-1": {"title": "Old", "fetched": time.time() - 2 * 3600},
+            "bd-2": {"title": "Stale", "fetched": 0},
+        }))
+
+        with patch("subprocess.run", return_value=self._bd_result("New")) as mock_run:
+            assert get_issue_title("bd-1") == "New"
+
+        mock_run.assert_called_once()
+        assert set(json.loads(cache_file.read_text())) == {"bd-1"}
+
+    def test_failure_is_not_cached(self, cache_file):
+        """Test that a failed lookup is retried next time."""
+        with patch("subprocess.run", return_value=MagicMock(returncode=1, stdout="")) as mock_run:
+            assert get_issue_title("bd-1") is None
+            assert get_issue_title("bd-1") is None
+
+        assert mock_run.call_count == 2
+        assert not cache_file.exists()
+
+    def test_corrupt_cache_is_ignored(self, cache_file):
+        """Test that an unreadable cache falls back to beads."""
+        cache_file.write_text("{not json")
+
+        with patch("subprocess.run", return_value=self._bd_result("Title")):
+            assert get_issue_title("bd-1") == "Title"
+
+
+class TestWriteSessionNote:
+    """Tests for write_session_note."""
+
+    def test_creates_notes_dir(self, tmp_path, monkeypatch):
+        """Test that the first note creates the notes directory."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        assert write_session_note("sess-1", "Fix the thing") is True
+
+        note_file = tmp_path / ".claude" / "session_notes" / "sess-1.txt"
+        assert note_file.read_text() == "Fix the thing"
+
+    def test_existing_dir_is_not_recreated(self, tmp_path, monkeypatch):
+        """Test that an existing notes directory skips mkdir and the note is replaced."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        notes_dir = tmp_path / ".claude" / "session_notes"
+        notes_dir.mkdir(parents=True)
+        (notes_dir / "sess-1.txt").write_text("A much longer older note")
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            assert write_session_note("sess-1", "Fix ünïcode") is True
+
+        mock_mkdir.assert_not_called()
+        assert (notes_dir / "sess-1.txt").read_text(encoding="utf-8") == "Fix ünïcode"
+
+    def test_failure_returns_false(self, tmp_path, monkeypatch):
+        """Test that an unwritable location reports failure."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        (tmp_path / ".claude").write_text("not a directory")
+
+        assert write_session_note("sess-1", "note") is False
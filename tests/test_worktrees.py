@@ -279,6 +279,33 @@ class TestFormatWorktrees:
         assert result.startswith("*")  # active indicator
 
 
+class TestParsePorcelainHeartbeats:
+    """Tests for reading heartbeats while parsing a worktree listing."""
+
+    @pytest.mark.parametrize("count", [2, 12])
+    def test_heartbeats_keep_listing_order(self, count):
+        """Test serial and threaded heartbeat reads give the same ordered result."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            blocks = []
+            for i in range(count):
+                wt_path = Path(tmpdir) / f"wt{i}"
+                (wt_path / ".tambour").mkdir(parents=True)
+                if i % 3:
+                    (wt_path / ".tambour" / "heartbeat").write_text(
+                        json.dumps({"timestamp": "2026-01-01T00:00:00Z", "pid": 100 + i})
+                    )
+                blocks.append(f"worktree {wt_path}\nHEAD {i:040d}\nbranch refs/heads/b{i}\n")
+
+            result = _parse_porcelain("\n".join(blocks))
+
+        assert [wt.name for wt in result] == [f"wt{i}" for i in range(count)]
+        assert [wt.heartbeat_pid for wt in result] == [
+            100 + i if i % 3 else None for i in range(count)
+        ]
+        ages = {wt.heartbeat_age for wt in result if wt.heartbeat_age is not None}
+        assert len(ages) == 1
+
+
 class TestReadHeartbeat:
     """Tests for heartbeat file reading."""
 
@@ -300,6 +327,23 @@ class TestReadHeartbeat:
             assert age > 0
             assert pid == 42
 
+    def test_age_against_given_now(self):
+        from datetime import datetime, timezone
+
+        from tambour.worktrees import _read_heartbeat
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            wt_path = Path(tmpdir)
+            (wt_path / ".tambour").mkdir()
+            (wt_path / ".tambour" / "heartbeat").write_text(
+                '{"timestamp": "2026-01-01T00:00:00.250000Z", "pid": 7}'
+            )
+            now = datetime(2026, 1, 1, 0, 1, 0, tzinfo=timezone.utc).timestamp()
+
+            age, pid = _read_heartbeat(wt_path, now)
+            assert age == pytest.approx(59.75)
+            assert pid == 7
+
     def test_returns_none_for_missing(self):
         from tambour.worktrees import _read_heartbeat
 